@@ -1,17 +1,76 @@
 # Gets all URLs for my channel and puts them in "videos.txt". The top-most is the most recent.
+# Usage: python scripts/GetYoutubeURLs.py [--full]
+#
+# By default only new uploads are listed: the channel listing comes back newest first,
+# so paging stops at the first video already in videos.txt (or the metadata store).
+
+import argparse
 
 import yt_dlp
 
-def get_channel_videos(channel_url):
-    ydl_opts = {'extract_flat': True, 'quiet': True}
+from youtubeStore import STORE_PATH, VideoStore
+
+CHANNEL_URL = "https://www.youtube.com/@gabrielmongaras/videos"
+VIDEOS_FILE = "scripts/videos.txt"
+MAX_REDIRECTS = 5
+
+def _video_id(url):
+    return url.rsplit("v=", 1)[-1].split("&", 1)[0]
+
+def iter_channel_videos(channel_url):
+    """Yield video URLs newest first, fetching listing pages only as they are consumed"""
+    ydl_opts = {'extract_flat': True, 'quiet': True, 'lazy_playlist': True}
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        info = ydl.extract_info(channel_url, download=False)
-        return [entry['url'] for entry in info['entries']]
+        # process=False keeps `entries` a lazy generator instead of resolving every page
+        info = ydl.extract_info(channel_url, download=False, process=False)
+        # Unprocessed results can be a redirect (e.g. a handle URL pointing at the channel
+        # tab) with no `entries`; follow it to the actual playlist
+        for _ in range(MAX_REDIRECTS):
+            if info.get('_type') != 'url':
+                break
+            info = ydl.extract_info(info['url'], download=False, process=False, ie_key=info.get('ie_key'))
+        for entry in info.get('entries') or []:
+            yield entry['url']
+
+def get_channel_videos(channel_url):
+    return list(iter_channel_videos(channel_url))
+
+def get_new_channel_videos(channel_url, known_ids):
+    """URLs uploaded since the newest known video (everything, if none is known)"""
+    new = []
+    for url in iter_channel_videos(channel_url):
+        if _video_id(url) in known_ids:
+            break
+        new.append(url)
+    return new
+
+def read_videos_file(path=VIDEOS_FILE):
+    try:
+        with open(path, "r") as f:
+            return [line.strip() for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="List channel uploads into videos.txt")
+    parser.add_argument('--full', action='store_true', help="Re-list the whole channel and rewrite videos.txt")
+    args = parser.parse_args(argv)
+
+    existing = read_videos_file()
+    if args.full or not existing:
+        videos = get_channel_videos(CHANNEL_URL)
+        print(f"Found {len(videos)} videos:")
+    else:
+        known_ids = {_video_id(url) for url in existing} | set(VideoStore.load(STORE_PATH).videos)
+        new_videos = get_new_channel_videos(CHANNEL_URL, known_ids)
+        print(f"Found {len(new_videos)} new videos")
+        if not new_videos:
+            return
+        videos = new_videos + existing
 
-# Example usage
-videos = get_channel_videos("https://www.youtube.com/@gabrielmongaras/videos")
-print(f"Found {len(videos)} videos:")
-with open("scripts/videos.txt", "w") as f:
-    for v in videos:
-        f.write(v + "\n")
+    with open(VIDEOS_FILE, "w") as f:
+        for v in videos:
+            f.write(v + "\n")
 
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,41 @@
-# Takes all URLs in "videos.txt" and parses the data for each
-
-with open("scripts/videos.txt", "r") as f:
-    URLS = f.read().strip().split("\n")
-
-
+# Takes all URLs in "videos.txt", stores their metadata in "youtubeData.jsonl" and generates
+# src/youtubeData.js (card index) plus public/youtube/page-N.json (descriptions and stats) from it
+# Usage: python scripts/GetYoutueData.py [--videos-file scripts/videos.txt] [--workers 8] [--timeout 30] [--retries 2]
+#        [--video-timeout 180] [--refresh 10] [--refresh-all] [--budget SECONDS] [--no-thumbnails]
 
 import yt_dlp
+import argparse
+import hashlib
 import json
+import os
 import re
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 
+from youtubeStore import STORE_PATH, VideoStore, utc_now
+from youtubeThumbnails import THUMBNAIL_BASE, THUMBS_DIR, cache_thumbnails, local_thumbnail
+
+OUTPUT_FILE = 'src/youtubeData.js'
+VIDEOS_FILE = 'scripts/videos.txt'
+CONFIG_FILE = 'youtube_config.json'
+
+# Concurrent fetch defaults (see fetch_videos)
+DEFAULT_WORKERS = 8
+DEFAULT_REFRESH = 10
+DEFAULT_TIMEOUT = 30
+DEFAULT_VIDEO_TIMEOUT = 180
+DEFAULT_RETRIES = 2
+RETRY_BACKOFF = 2.0
+
+YDL_OPTS = {
+    'quiet': True,
+    'no_warnings': True,
+    'extract_flat': False,
+}
+
 def extract_video_id(url):
     """Extract video ID from various YouTube URL formats"""
     patterns = [
@@ -23,175 +49,332 @@ def extract_video_id(url):
             return match.group(1)
     return None
 
-def get_video_info(url, description_length=200):
-    """Get video information from YouTube URL"""
-    video_id = extract_video_id(url)
-    if not video_id:
-        print(f"Could not extract video ID from: {url}")
-        return None
+def video_record(info, video_id):
+    """Turn a yt_dlp info dict into the raw record kept in the metadata store"""
+    # Normalize published date to YYYY-MM-DD
+    upload_date = info.get('upload_date', '')
+    try:
+        published_at = datetime.strptime(upload_date, '%Y%m%d').strftime('%Y-%m-%d') if upload_date else None
+    except ValueError:
+        published_at = upload_date
     
-    ydl_opts = {
-        'quiet': True,
-        'no_warnings': True,
-        'extract_flat': False,
+    return {
+        'videoId': video_id,
+        'title': info.get('title') or 'Unknown Title',
+        'description': info.get('description') or 'No description available',
+        'durationSeconds': info.get('duration') or None,
+        'publishedAt': published_at,
+        'views': info.get('view_count'),
+        'likes': info.get('like_count'),
+        'fetchedAt': utc_now(),
     }
+
+def format_count(count):
+    """1234 -> "1.2K", 1234567 -> "1.2M"; falsy -> "Unknown" """
+    if not count:
+        return "Unknown"
+    if count >= 1000000:
+        return f"{count / 1000000:.1f}M"
+    if count >= 1000:
+        return f"{count / 1000:.1f}K"
+    return str(count)
+
+def display_video(record, description_length=200):
+    """Format a stored record into the entry written to youtubeData.js"""
+    # Format duration from seconds to MM:SS or HH:MM:SS
+    duration_seconds = record.get('durationSeconds')
+    if duration_seconds:
+        hours = duration_seconds // 3600
+        minutes = (duration_seconds % 3600) // 60
+        seconds = duration_seconds % 60
+        
+        if hours > 0:
+            duration = f"{hours}:{minutes:02d}:{seconds:02d}"
+        else:
+            duration = f"{minutes}:{seconds:02d}"
+    else:
+        duration = "Unknown"
     
+    # Truncate description if needed (escaping happens in the serializer)
+    description = record.get('description') or 'No description available'
+    if len(description) > description_length:
+        description = description[:description_length] + '...'
+    
+    video_id = record['videoId']
+    return {
+        'title': record.get('title') or 'Unknown Title',
+        'description': description,
+        'videoId': video_id,
+        'thumbnail': local_thumbnail(video_id) or f"{THUMBNAIL_BASE}/{video_id}/maxresdefault.jpg",
+        'duration': duration,
+        'publishedAt': record.get('publishedAt') or "Unknown",
+        'views': format_count(record.get('views')),
+        'likes': format_count(record.get('likes'))
+    }
+
+# One long-lived extractor per worker thread: YoutubeDL is not thread-safe, and building
+# one per URL repeats its extractor/cookie setup for every video
+# An extractor is anything with yt_dlp's `extract_info(url, download=False)` returning an
+# info dict; `extractor_factory(opts)` builds one. Tests and benchmarks pass an offline fake.
+class WorkerExtractors:
+    """The extractors of one fetch_videos call, one per worker thread; close() releases them all."""
+
+    def __init__(self, extractor_factory, timeout):
+        self.extractor_factory = extractor_factory
+        self.timeout = timeout
+        self._local = threading.local()
+        self._created = []
+        self._lock = threading.Lock()
+
+    def get(self):
+        ydl = getattr(self._local, 'ydl', None)
+        if ydl is None:
+            ydl = self.extractor_factory({**YDL_OPTS, 'socket_timeout': self.timeout})
+            self._local.ydl = ydl
+            with self._lock:
+                self._created.append(ydl)
+        return ydl
+
+    def close(self):
+        with self._lock:
+            created, self._created = self._created, []
+        for ydl in created:
+            close = getattr(ydl, 'close', None)
+            if close is not None:
+                close()
+
+def _fetch_one(url, extractors, started):
+    """Worker task: extract one video with this thread's extractor. Raises on failure."""
+    started[url] = time.monotonic()
+    # socket_timeout only bounds each socket read; fetch_videos enforces the per-video limit
+    info = extractors.get().extract_info(url, download=False)
+    return video_record(info, extract_video_id(url))
+
+def fetch_videos(urls, workers=DEFAULT_WORKERS, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, budget=None,
+                 extractor_factory=yt_dlp.YoutubeDL, verbose=True, video_timeout=DEFAULT_VIDEO_TIMEOUT):
+    """Fetch many videos concurrently. Returns {videoId: store record} for the ones that succeeded.
+
+    Failures go to a retry queue that is re-run (with backoff) after each pass, up to
+    `retries` extra passes. An extraction still running `video_timeout` seconds after it
+    started is abandoned and queued for retry like a failure (its thread cannot be
+    interrupted; it finishes in the background and its result is dropped). With a
+    `budget` in seconds, videos not yet started when it runs out are skipped (in-flight
+    ones still finish). Callers merge the results in videos.txt order.
+    """
+    results = {}
+    queue = [url for url in urls if extract_video_id(url)]
+    deadline = time.monotonic() + budget if budget else None
+    extractors = WorkerExtractors(extractor_factory, timeout)
+    pool = ThreadPoolExecutor(max_workers=max(1, workers))
+    abandoned = False
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-            
-            # Format duration from seconds to MM:SS or HH:MM:SS
-            duration_seconds = info.get('duration', 0)
-            if duration_seconds:
-                hours = duration_seconds // 3600
-                minutes = (duration_seconds % 3600) // 60
-                seconds = duration_seconds % 60
-                
-                if hours > 0:
-                    duration = f"{hours}:{minutes:02d}:{seconds:02d}"
-                else:
-                    duration = f"{minutes}:{seconds:02d}"
-            else:
-                duration = "Unknown"
-            
-            # Format published date
-            upload_date = info.get('upload_date', '')
-            if upload_date:
-                try:
-                    date_obj = datetime.strptime(upload_date, '%Y%m%d')
-                    published_at = date_obj.strftime('%Y-%m-%d')
-                except:
-                    published_at = upload_date
-            else:
-                published_at = "Unknown"
-            
-            # Truncate description if needed and escape for JavaScript
-            description = info.get('description', 'No description available')
-            if len(description) > description_length:
-                description = description[:description_length] + '...'
-            
-            # Escape special characters for JavaScript
-            description = description.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r')
-            
-            # Escape title for JavaScript
-            title = info.get('title', 'Unknown Title').replace('\\', '\\\\').replace('"', '\\"')
-            
-            # Get view count and format it
-            view_count = info.get('view_count', 0)
-            if view_count:
-                if view_count >= 1000000:
-                    views_formatted = f"{view_count / 1000000:.1f}M"
-                elif view_count >= 1000:
-                    views_formatted = f"{view_count / 1000:.1f}K"
-                else:
-                    views_formatted = str(view_count)
-            else:
-                views_formatted = "Unknown"
-            
-            # Get like count
-            like_count = info.get('like_count', 0)
-            if like_count:
-                if like_count >= 1000000:
-                    likes_formatted = f"{like_count / 1000000:.1f}M"
-                elif like_count >= 1000:
-                    likes_formatted = f"{like_count / 1000:.1f}K"
-                else:
-                    likes_formatted = str(like_count)
-            else:
-                likes_formatted = "Unknown"
-            
-            video_data = {
-                'title': title,
-                'description': description,
-                'videoId': video_id,
-                'thumbnail': f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg",
-                'duration': duration,
-                'publishedAt': published_at,
-                'views': views_formatted,
-                'likes': likes_formatted
-            }
-            
-            return video_data
-            
-    except Exception as e:
-        print(f"Error extracting info for {url}: {str(e)}")
-        return None
+        for attempt in range(retries + 1):
+            if not queue:
+                break
+            if deadline and time.monotonic() >= deadline:
+                break
+            if attempt:
+                delay = RETRY_BACKOFF * 2 ** (attempt - 1)
+                print(f"\nRetrying {len(queue)} failed videos in {delay:.0f}s (attempt {attempt + 1}/{retries + 1})...")
+                time.sleep(delay)
+            started = {}
+            futures = {pool.submit(_fetch_one, url, extractors, started): url for url in queue}
+            queue = []
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=min(1.0, video_timeout), return_when=FIRST_COMPLETED)
+                if deadline and time.monotonic() >= deadline:
+                    for future in pending:
+                        future.cancel()
+                for future in done:
+                    url = futures[future]
+                    if future.cancelled():
+                        continue
+                    try:
+                        video_info = future.result()
+                    except Exception as e:
+                        print(f"[FAILED] {url}: {e}")
+                        queue.append(url)
+                        continue
+                    results[video_info['videoId']] = video_info
+                    if verbose:
+                        print(f"[SUCCESS] Successfully fetched: {video_info['title']}")
+                now = time.monotonic()
+                for future in list(pending):
+                    url = futures[future]
+                    if future.cancelled():
+                        pending.discard(future)
+                    elif url in started and now - started[url] > video_timeout:
+                        print(f"[FAILED] {url}: no result after {video_timeout}s")
+                        pending.discard(future)
+                        queue.append(url)
+                        abandoned = True
+    finally:
+        # Don't wait for abandoned extractions; closing their extractor makes them fail fast
+        pool.shutdown(wait=not abandoned, cancel_futures=True)
+        extractors.close()
+    for url in queue:
+        print(f"[FAILED] Giving up on: {url}")
+    return results
+
+JS_HEADER = (
+    "// This file is automatically generated by scripts/GetYoutueData.py\n"
+    "// Do not edit manually - it will be overwritten\n\n"
+)
+# youtubeData.js is a compact index for laying out the cards; descriptions and stats are
+# split into pages under public/ that the Media section fetches when it scrolls into view
+INDEX_FIELDS = ('videoId', 'title', 'publishedAt', 'duration', 'thumbnail')
+PAGE_FIELDS = ('videoId', 'description', 'views', 'likes')
+PAGES_DIR = 'public/youtube'
+PAGE_SIZE = 24
+
+def iter_youtube_data_js(videos, page_urls):
+    """Yield the index module in chunks; string values are escaped with json.dumps"""
+    yield JS_HEADER
+    yield "export const youtubePages = " + json.dumps(page_urls, indent=2) + ";\n\n"
+    yield "export const youtubeVideos = [\n"
+    for i, video in enumerate(videos):
+        # One line per video keeps the index small and its diffs readable
+        fields = [f"{key}: {json.dumps(str(video[key]), ensure_ascii=False)}" for key in INDEX_FIELDS]
+        fields.append(f"page: {i // PAGE_SIZE}")
+        yield "  { " + ", ".join(fields) + " }" + ("," if i < len(videos) - 1 else "") + "\n"
+    yield "];\n"
 
-def load_existing_video_ids():
-    """Load existing video IDs from youtubeData.js file"""
+def _file_digest(path):
+    digest = hashlib.sha256()
     try:
-        with open('src/youtubeData.js', 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Extract video IDs using regex
-        import re
-        video_id_pattern = r'videoId:\s*"([^"]+)"'
-        existing_ids = re.findall(video_id_pattern, content)
-        return set(existing_ids)
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 16), b''):
+                digest.update(block)
     except FileNotFoundError:
-        print("No existing youtubeData.js file found. All URLs will be processed.")
-        return set()
+        return None
+    return digest.hexdigest()
 
-def load_existing_videos_data():
-    """Load existing video data from youtubeData.js file"""
+def write_if_changed(path, chunks):
+    """Stream chunks to a temp file and swap it in only if the content changed.
+
+    Leaving an identical file untouched keeps its mtime, so Vite does not reload or
+    rebuild for a no-op run. Returns True when the file was written.
+    """
+    digest = hashlib.sha256()
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
     try:
-        with open('src/youtubeData.js', 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Extract video data using regex
-        import re
-        video_pattern = r'{\s*title:\s*"([^"]*)",\s*description:\s*"([^"]*)",\s*videoId:\s*"([^"]*)",\s*thumbnail:\s*"([^"]*)",\s*duration:\s*"([^"]*)",\s*publishedAt:\s*"([^"]*)",\s*views:\s*"([^"]*)",\s*likes:\s*"([^"]*)"\s*}'
-        matches = re.findall(video_pattern, content, re.DOTALL)
-        
-        existing_videos = []
-        for match in matches:
-            video_data = {
-                'title': match[0],
-                'description': match[1],
-                'videoId': match[2],
-                'thumbnail': match[3],
-                'duration': match[4],
-                'publishedAt': match[5],
-                'views': match[6],
-                'likes': match[7]
-            }
-            existing_videos.append(video_data)
-        
-        return existing_videos
-    except FileNotFoundError:
-        print("No existing youtubeData.js file found.")
-        return []
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                data = chunk.encode('utf-8')
+                digest.update(data)
+                f.write(data)
+        if digest.hexdigest() == _file_digest(path):
+            os.unlink(tmp)
+            return False
+        os.chmod(tmp, 0o644)  # mkstemp creates 0600; these files are served and committed
+        os.replace(tmp, path)
+        return True
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+def write_youtube_data(videos, output_file=OUTPUT_FILE, pages_dir=PAGES_DIR):
+    """Write the paged JSON details and the index module. Returns True if anything changed."""
+    os.makedirs(pages_dir, exist_ok=True)
+    changed = False
+    page_urls = []
+    for page, start in enumerate(range(0, len(videos), PAGE_SIZE)):
+        rows = [{key: video[key] for key in PAGE_FIELDS} for video in videos[start:start + PAGE_SIZE]]
+        content = json.dumps(rows, ensure_ascii=False, separators=(',', ':')) + "\n"
+        name = f"page-{page}.json"
+        changed |= write_if_changed(os.path.join(pages_dir, name), [content])
+        # Content hash in the URL so a browser never pairs a new index with a cached old page
+        version = hashlib.sha256(content.encode('utf-8')).hexdigest()[:10]
+        page_urls.append(f"/{os.path.relpath(pages_dir, 'public')}/{name}?v={version}")
+    # Drop pages left over from a longer list
+    for name in os.listdir(pages_dir):
+        match = re.fullmatch(r'page-(\d+)\.json', name)
+        if match and int(match.group(1)) >= len(page_urls):
+            os.remove(os.path.join(pages_dir, name))
+            changed = True
+    changed |= write_if_changed(output_file, iter_youtube_data_js(videos, page_urls))
+    return changed
 
-def load_config():
+def load_store():
+    """Load the metadata store, bootstrapping it from an older youtubeData.js on first run"""
+    store = VideoStore.load(STORE_PATH)
+    if not len(store):
+        imported = store.import_legacy_js(OUTPUT_FILE)
+        if imported:
+            print(f"Imported {imported} videos from {OUTPUT_FILE} into {STORE_PATH}")
+            store.save()
+    return store
+
+def ordered_videos(store, urls, description_length=200):
+    """Display entries for every stored video, in the order of the URLs list"""
+    ids = (extract_video_id(url) for url in urls)
+    return [display_video(store.get(video_id), description_length) for video_id in ids if video_id in store]
+
+def read_urls(path=VIDEOS_FILE):
+    """URLs from videos.txt, newest first"""
+    with open(path, "r") as f:
+        return [line.strip() for line in f if line.strip()]
+
+def load_config(config_file=CONFIG_FILE, videos_file=VIDEOS_FILE):
     """Load configuration from JSON file"""
     try:
-        with open('youtube_config.json', 'r', encoding='utf-8') as f:
+        with open(config_file, 'r', encoding='utf-8') as f:
             config = json.load(f)
         return config
     except FileNotFoundError:
         print("Configuration file not found. Using default URLs.")
         return {
-            "youtube_urls": URLS,
+            "youtube_urls": read_urls(videos_file),
             "description_length": 200
         }
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Fetch metadata for the videos in videos.txt into src/youtubeData.js")
+    parser.add_argument('--videos-file', default=VIDEOS_FILE, help=f"URL list, newest first (default: {VIDEOS_FILE})")
+    parser.add_argument('--config', default=CONFIG_FILE, help=f"Optional JSON config overriding the URL list (default: {CONFIG_FILE})")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help=f"Concurrent extractions (default: {DEFAULT_WORKERS}; 1 = serial)")
+    parser.add_argument('--timeout', type=int, default=DEFAULT_TIMEOUT, help=f"Per-request socket timeout in seconds (default: {DEFAULT_TIMEOUT})")
+    parser.add_argument('--video-timeout', type=float, default=DEFAULT_VIDEO_TIMEOUT, help=f"Give up on (and retry) a video whose extraction takes longer than this many seconds (default: {DEFAULT_VIDEO_TIMEOUT})")
+    parser.add_argument('--retries', type=int, default=DEFAULT_RETRIES, help=f"Extra passes over failed videos (default: {DEFAULT_RETRIES})")
+    parser.add_argument('--refresh', type=int, default=DEFAULT_REFRESH, help=f"Refresh stats of at most this many stale videos per run (default: {DEFAULT_REFRESH}; 0 = off)")
+    parser.add_argument('--refresh-all', action='store_true', help="Treat every stored video as stale (still capped by --refresh)")
+    parser.add_argument('--budget', type=float, default=None, help="Stop starting new fetches after this many seconds")
+    parser.add_argument('--no-thumbnails', action='store_true', help="Skip downloading/encoding local WebP thumbnails")
+    parser.add_argument('--thumbnail-base', default=THUMBNAIL_BASE, help=f"Base URL thumbnails are fetched from (default: {THUMBNAIL_BASE})")
+    return parser.parse_args(argv)
+
+def sync_thumbnails(urls, args):
+    """Cache local WebP thumbnails for listed videos that do not have them yet"""
+    video_ids = [video_id for video_id in map(extract_video_id, urls) if video_id]
+    if not args.no_thumbnails:
+        cached, failed = cache_thumbnails(video_ids, args.thumbnail_base, args.workers, args.timeout)
+        if cached or failed:
+            print(f"Cached {len(cached)} thumbnails in '{THUMBS_DIR}'" + (f" ({len(failed)} failed)" if failed else ""))
+    # video_record falls back to the hot-linked image for these; say so instead of hiding it
+    missing = [video_id for video_id in video_ids if local_thumbnail(video_id) is None]
+    if missing:
+        print(f"[WARNING] {len(missing)} videos have no local thumbnail and still hot-link {THUMBNAIL_BASE}")
+
+def main(argv=None, extractor_factory=yt_dlp.YoutubeDL):
+    args = parse_args(argv)
+
     # Load configuration
-    config = load_config()
+    config = load_config(args.config, args.videos_file)
     urls = config.get('youtube_urls', [])
     description_length = config.get('description_length', 200)
     
     # Load existing video data
-    existing_videos = load_existing_videos_data()
-    existing_video_ids = {video['videoId'] for video in existing_videos}
+    store = load_store()
     
-    print(f"Found {len(existing_videos)} existing videos in youtubeData.js")
+    print(f"Found {len(store)} existing videos in {STORE_PATH}")
     
     # Filter URLs to only process new ones
     new_urls = []
     for url in urls:
         video_id = extract_video_id(url)
-        if video_id and video_id not in existing_video_ids:
+        if video_id and video_id not in store:
             new_urls.append(url)
         else:
             if video_id:
@@ -201,109 +384,73 @@ def main():
     
     print(f"\nFound {len(new_urls)} new URLs to process")
     
-    if not new_urls:
+    # Refresh the stalest stored videos whose TTL has expired (newer videos expire sooner)
+    refresh_ids = []
+    if args.refresh > 0:
+        listed_ids = [extract_video_id(url) for url in urls]
+        refresh_ids = store.stale(listed_ids, args.refresh, ttl_scale=0 if args.refresh_all else 1)
+    refresh_urls = [f"https://www.youtube.com/watch?v={video_id}" for video_id in refresh_ids]
+    if refresh_urls:
+        print(f"Refreshing stats for {len(refresh_urls)} stale videos")
+    
+    if not new_urls and not refresh_urls:
         print("No new URLs to process. All URLs have already been processed.")
+        sync_thumbnails(urls, args)
+        # Still cheap to regenerate: a no-op unless videos.txt order or the store changed
+        if write_youtube_data(ordered_videos(store, urls, description_length)):
+            print(f"Regenerated '{OUTPUT_FILE}' and '{PAGES_DIR}/' from {STORE_PATH}")
         return
     
-    new_videos_data = []
+    print(f"\nFetching YouTube video data ({args.workers} workers)...")
+    start = time.monotonic()
+    # New videos first so a tight budget is spent on them before refreshes
+    fetched = fetch_videos(new_urls + refresh_urls, args.workers, args.timeout, args.retries, args.budget,
+                           extractor_factory, video_timeout=args.video_timeout)
+    print(f"Fetched {len(fetched)}/{len(new_urls) + len(refresh_urls)} videos in {time.monotonic() - start:.1f}s")
+    refreshed = [video_id for video_id in refresh_ids if video_id in fetched]
+    sync_thumbnails(urls, args)
     
-    print("\nFetching YouTube video data for new URLs...")
-    for url in new_urls:
-        print(f"Processing: {url}")
-        video_info = get_video_info(url, description_length)
-        if video_info:
-            new_videos_data.append(video_info)
-            print(f"[SUCCESS] Successfully fetched: {video_info['title']}")
-        else:
-            print(f"[FAILED] Failed to fetch data for: {url}")
+    existing_count = len(store)
+    for record in fetched.values():
+        store.upsert(record)
+    if fetched:
+        store.save()
     
-    if new_videos_data:
-        print(f"\nSuccessfully fetched {len(new_videos_data)} new videos:")
+    # Keep videos.txt order regardless of completion order
+    new_videos_data = [display_video(fetched[extract_video_id(url)], description_length)
+                       for url in new_urls if extract_video_id(url) in fetched]
+    
+    if new_videos_data or refreshed:
+        if new_videos_data:
+            print(f"\nSuccessfully fetched {len(new_videos_data)} new videos:")
         for video in new_videos_data:
             print(f"- {video['title']} ({video['duration']})")
-        
-        # Create a mapping of video IDs to video data for quick lookup
-        existing_videos_map = {video['videoId']: video for video in existing_videos}
-        new_videos_map = {video['videoId']: video for video in new_videos_data}
+        if refreshed:
+            print(f"Refreshed stats for {len(refreshed)} videos")
         
         # Combine videos in the order of the original URLs list
-        all_videos = []
-        for url in urls:
-            video_id = extract_video_id(url)
-            if video_id:
-                if video_id in new_videos_map:
-                    all_videos.append(new_videos_map[video_id])
-                elif video_id in existing_videos_map:
-                    all_videos.append(existing_videos_map[video_id])
-        
-        # Generate JavaScript array format
-        js_array = "export const youtubeVideos = [\n"
-        for i, video in enumerate(all_videos):
-            js_array += "  {\n"
-            js_array += f"    title: \"{video['title']}\",\n"
-            js_array += f"    description: \"{video['description']}\",\n"
-            js_array += f"    videoId: \"{video['videoId']}\",\n"
-            js_array += f"    thumbnail: \"{video['thumbnail']}\",\n"
-            js_array += f"    duration: \"{video['duration']}\",\n"
-            js_array += f"    publishedAt: \"{video['publishedAt']}\",\n"
-            js_array += f"    views: \"{video['views']}\",\n"
-            js_array += f"    likes: \"{video['likes']}\"\n"
-            js_array += "  }"
-            if i < len(all_videos) - 1:
-                js_array += ","
-            js_array += "\n"
-        js_array += "];\n"
+        all_videos = ordered_videos(store, urls, description_length)
         
-        print(f"\nTotal videos: {len(existing_videos)} existing + {len(new_videos_data)} new = {len(all_videos)} total")
+        print(f"\nTotal videos: {existing_count} existing + {len(new_videos_data)} new = {len(all_videos)} total")
         
         # Save to file in src directory
-        output_file = 'src/youtubeData.js'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("// This file is automatically generated by scripts/GetYoutueData.py\n")
-            f.write("// Do not edit manually - it will be overwritten\n\n")
-            f.write(js_array)
-        print(f"\nData saved to '{output_file}'")
-        print("Ready for import by data.js")
+        if write_youtube_data(all_videos):
+            print(f"\nData saved to '{OUTPUT_FILE}' and '{PAGES_DIR}/'")
+            print("Ready for import by data.js")
+        else:
+            print(f"\n'{OUTPUT_FILE}' is already up to date")
     else:
         # No new videos, but we might want to reorder existing ones
-        if existing_videos:
+        if len(store):
             print("No new videos to process, but reordering existing videos to match URL order...")
             
-            # Create a mapping of video IDs to video data for quick lookup
-            existing_videos_map = {video['videoId']: video for video in existing_videos}
-            
             # Reorder videos according to the original URLs list
-            all_videos = []
-            for url in urls:
-                video_id = extract_video_id(url)
-                if video_id and video_id in existing_videos_map:
-                    all_videos.append(existing_videos_map[video_id])
+            all_videos = ordered_videos(store, urls, description_length)
             
-            # Generate JavaScript array format
-            js_array = "export const youtubeVideos = [\n"
-            for i, video in enumerate(all_videos):
-                js_array += "  {\n"
-                js_array += f"    title: \"{video['title']}\",\n"
-                js_array += f"    description: \"{video['description']}\",\n"
-                js_array += f"    videoId: \"{video['videoId']}\",\n"
-                js_array += f"    thumbnail: \"{video['thumbnail']}\",\n"
-                js_array += f"    duration: \"{video['duration']}\",\n"
-                js_array += f"    publishedAt: \"{video['publishedAt']}\",\n"
-                js_array += f"    views: \"{video['views']}\",\n"
-                js_array += f"    likes: \"{video['likes']}\"\n"
-                js_array += "  }"
-                if i < len(all_videos) - 1:
-                    js_array += ","
-                js_array += "\n"
-            js_array += "];\n"
-            
-            # Save to file in src directory
-            output_file = 'src/youtubeData.js'
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write("// This file is automatically generated by scripts/GetYoutueData.py\n")
-                f.write("// Do not edit manually - it will be overwritten\n\n")
-                f.write(js_array)
-            print(f"Reordered {len(all_videos)} videos and saved to '{output_file}'")
+            if write_youtube_data(all_videos):
+                print(f"Reordered {len(all_videos)} videos and saved to '{OUTPUT_FILE}'")
+            else:
+                print(f"'{OUTPUT_FILE}' already matches the URL order; not rewritten")
         else:
             print("No video data was successfully fetched.")
 
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for src/blogs/medium_to_markdown.py.
+
+Runs the converter's CPU-bound stages over a committed corpus of Medium-style HTML
+pages (scripts/bench/medium/*.html) and reports the median time per stage, so that
+Readability, BeautifulSoup and markdownify costs can be compared across changes.
+
+The *-apollo pages also embed `window.__APOLLO_STATE__`, like most real Medium pages, so
+select_article() takes the JSON fast path on them; the `path` column shows which path
+each page took.
+
+Stages
+- parse:       one BeautifulSoup parse of the full page
+- readability: readability-lxml summary extraction (skipped when not installed)
+- select:      select_article() — everything up to the working article tree (the JSON
+               fast path on *-apollo pages, Readability on the others)
+- fence:       fence_codeblocks() on the selected tree
+- markdown:    soup_to_markdown() on the fenced tree
+
+Usage
+  python scripts/benchmarkMediumToMarkdown.py                     # all pages, 5 repeats
+  python scripts/benchmarkMediumToMarkdown.py -n 10 --json out.json
+  python scripts/benchmarkMediumToMarkdown.py --compare out.json  # diff against a saved run
+  python scripts/benchmarkMediumToMarkdown.py --build-corpus      # regenerate the corpus from src/blogs/*.js
+"""
+import argparse
+import json
+import re
+import statistics
+import sys
+import time
+from html import escape
+from pathlib import Path
+
+script_dir = Path(__file__).parent
+project_root = script_dir.parent
+corpus_dir = script_dir / 'bench' / 'medium'
+posts_dir = project_root / 'src' / 'blogs'
+
+sys.path.insert(0, str(posts_dir))
+import medium_to_markdown as m2m  # noqa: E402
+
+# Corpus pages: name -> (post slugs, repeat count, embed Apollo state)
+ALL_POSTS = ['diffusion-models', 'ai-girlfriend', 'attn-masks', 'community-detection-neural-networks']
+CORPUS = {
+    'small': (['community-detection-neural-networks'], 1, False),
+    'medium': (['diffusion-models'], 1, False),
+    'large': (ALL_POSTS, 1, False),
+    'xl': (ALL_POSTS, 2, False),
+    'medium-apollo': (['diffusion-models'], 1, True),
+    'large-apollo': (ALL_POSTS, 1, True),
+}
+STAGES = ('parse', 'readability', 'select', 'fence', 'markdown')
+BASE_URL = 'https://gmongaras.medium.com/benchmark-post'
+POST_ID = 'e07b297b2869'
+APOLLO_BASE_URL = f'{BASE_URL}-{POST_ID}'
+
+IMAGE_LINE_RE = re.compile(r'^!\[([^\]]*)\]\(([^)\s]+)(?:\s+"([^"]*)")?\)\s*$')
+CODE_OPEN_RE = re.compile(r'^(?:```(.*)|\{\{code\(([^)]*)\)\}\})$')
+CODE_CLOSE_RE = re.compile(r'^(?:```|\{\{code\}\})$')
+INLINE_MARKUP_RE = re.compile(r'\*\*([^*]+)\*\*|`([^`]+)`|\[([^\]]+)\]\(([^)\s]+)\)')
+
+
+# ------------------------------
+# Corpus generation
+# ------------------------------
+
+def _inline(text: str) -> str:
+    text = escape(text, quote=False)
+    text = re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
+    text = re.sub(r'\*\*([^*]+)\*\*', r'<strong>\1</strong>', text)
+    text = re.sub(r'\[([^\]]+)\]\(([^)\s]+)\)', r'<a href="\2" rel="noopener">\1</a>', text)
+    return text
+
+
+def markdown_to_medium_html(md: str) -> str:
+    """Render a post body into the markup Medium serves (sections of p/h/pre/figure)."""
+    out: list[str] = []
+    para: list[str] = []
+    lines = md.splitlines()
+
+    def flush():
+        if para:
+            out.append(f'<p class="pw-post-body-paragraph">{_inline(" ".join(para))}</p>')
+            para.clear()
+
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+        if stripped.startswith('```'):
+            flush()
+            lang = stripped[3:].strip()
+            code: list[str] = []
+            i += 1
+            while i < len(lines) and not lines[i].strip().startswith('```'):
+                code.append(lines[i])
+                i += 1
+            cls = f' class="language-{lang}"' if lang else ''
+            out.append(f'<pre><span{cls}>' + '<br>'.join(escape(c) for c in code) + '</span></pre>')
+        elif not stripped:
+            flush()
+        elif stripped.startswith('#'):
+            flush()
+            level = min(len(stripped) - len(stripped.lstrip('#')) + 1, 4)
+            out.append(f'<h{level}>{_inline(stripped.lstrip("#").strip())}</h{level}>')
+        elif IMAGE_LINE_RE.match(stripped):
+            flush()
+            alt, src, caption = IMAGE_LINE_RE.match(stripped).groups()
+            src = 'https://miro.medium.com/v2/resize:fit:1400/format:webp/' + Path(src).name
+            cap = f'<figcaption>{_inline(caption)}</figcaption>' if caption else ''
+            out.append(
+                f'<figure><div><picture><source srcset="{src} 1400w" type="image/webp">'
+                f'<img alt="{escape(alt)}" src="{src}" width="700" height="394" loading="lazy"></picture></div>{cap}</figure>'
+            )
+        elif stripped.startswith(('- ', '* ')):
+            flush()
+            items = []
+            while i < len(lines) and lines[i].strip().startswith(('- ', '* ')):
+                items.append(f'<li>{_inline(lines[i].strip()[2:])}</li>')
+                i += 1
+            out.append('<ul>' + ''.join(items) + '</ul>')
+            continue
+        else:
+            para.append(stripped)
+        i += 1
+    flush()
+    return '\n'.join(out)
+
+
+def _apollo_markups(text: str) -> tuple[str, list[dict]]:
+    """Strip **bold**, `code` and [links](...) from `text`, returning Medium's offset markups."""
+    plain, markups, pos = [], [], 0
+    for m in INLINE_MARKUP_RE.finditer(text):
+        plain.append(text[pos:m.start()])
+        start = sum(map(len, plain))
+        inner = m.group(1) or m.group(2) or m.group(3)
+        plain.append(inner)
+        markup = {'type': 'STRONG' if m.group(1) else 'CODE' if m.group(2) else 'A',
+                  'start': start, 'end': start + len(inner)}
+        if m.group(4):
+            markup['href'] = m.group(4)
+        markups.append(markup)
+        pos = m.end()
+    plain.append(text[pos:])
+    return ''.join(plain), markups
+
+
+def markdown_to_apollo_state(title: str, bodies: list[str]) -> dict:
+    """The `window.__APOLLO_STATE__` object Medium embeds for a post with these bodies."""
+    state = {
+        f'Post:{POST_ID}': {
+            'title': title,
+            'firstPublishedAt': 1676160000000,
+            'creator': {'__ref': 'User:bench'},
+            'content({})': {'bodyModel': {'paragraphs': []}},
+        },
+        'User:bench': {'name': 'Gabriel Mongaras'},
+    }
+    paragraphs = state[f'Post:{POST_ID}']['content({})']['bodyModel']['paragraphs']
+
+    def add(para):
+        key = f'Paragraph:{len(paragraphs)}'
+        state[key] = para
+        paragraphs.append({'__ref': key})
+
+    add({'type': 'H3', 'text': title, 'markups': []})
+    for body in bodies:
+        lines, i, para = body.splitlines(), 0, []
+
+        def flush():
+            if para:
+                text, markups = _apollo_markups(' '.join(para))
+                add({'type': 'P', 'text': text, 'markups': markups})
+                para.clear()
+
+        while i < len(lines):
+            stripped = lines[i].strip()
+            code_open = CODE_OPEN_RE.match(stripped)
+            if code_open:
+                flush()
+                code = []
+                i += 1
+                while i < len(lines) and not CODE_CLOSE_RE.match(lines[i].strip()):
+                    code.append(lines[i])
+                    i += 1
+                lang = (code_open.group(1) or code_open.group(2) or '').strip()
+                add({'type': 'PRE', 'text': '\n'.join(code), 'codeBlockMetadata': {'lang': lang}})
+            elif not stripped:
+                flush()
+            elif stripped.startswith('#'):
+                flush()
+                level = min(len(stripped) - len(stripped.lstrip('#')), 2)
+                text, markups = _apollo_markups(stripped.lstrip('#').strip())
+                add({'type': ('H3', 'H4')[level - 1], 'text': text, 'markups': markups})
+            elif IMAGE_LINE_RE.match(stripped):
+                flush()
+                alt, src, caption = IMAGE_LINE_RE.match(stripped).groups()
+                image_id = Path(src).name
+                state[f'ImageMetadata:{image_id}'] = {'id': image_id, 'originalWidth': 1400, 'originalHeight': 788}
+                add({'type': 'IMG', 'text': caption or alt, 'markups': [],
+                     'metadata': {'__ref': f'ImageMetadata:{image_id}'}})
+            elif stripped.startswith(('- ', '* ')):
+                flush()
+                text, markups = _apollo_markups(stripped[2:])
+                add({'type': 'ULI', 'text': text, 'markups': markups})
+            else:
+                para.append(stripped)
+            i += 1
+        flush()
+    return state
+
+
+def build_page(slugs: list[str], repeat: int, apollo: bool = False) -> str:
+    titles = {post['slug']: post['title'] for post in m2m.read_post_manifest(posts_dir)}
+    sections, bodies, title = [], [], titles[slugs[0]]
+    for _ in range(repeat):
+        for slug in slugs:
+            body = m2m.read_post_body(posts_dir / f'{slug}.js')
+            bodies.append(body)
+            sections.append(f'<section>{markdown_to_medium_html(body)}</section>')
+    state = ''
+    if apollo:
+        # Medium serves the rendered article and the same post as JSON for hydration
+        payload = json.dumps(markdown_to_apollo_state(title, bodies)).replace('</', '<\\/')
+        state = f'<script>window.__APOLLO_STATE__ = {payload}</script>\n'
+    chrome = '\n'.join(
+        f'<div class="sidebar-item"><a href="/tag/t{n}">Related story {n}</a><span>{n} min read</span></div>'
+        for n in range(40)
+    )
+    return f"""<!doctype html>
+<html lang="en"><head>
+<meta charset="utf-8"><title>{escape(title)} | Medium</title>
+<meta property="og:title" content="{escape(title)}">
+<meta name="author" content="Gabriel Mongaras">
+<meta property="article:published_time" content="2023-02-12T00:00:00.000Z">
+<link rel="canonical" href="{APOLLO_BASE_URL if apollo else BASE_URL}">
+<script>window.__GRAPHQL_URI__ = "https://medium.com/_/graphql";</script>
+{state}</head><body>
+<nav><a href="/">Medium</a><a href="/me">Sign in</a><button>Get started</button></nav>
+<aside>{chrome}</aside>
+<article><div><h1 class="pw-post-title">{escape(title)}</h1>
+<div class="pw-author"><a rel="author" href="/@gmongaras">Gabriel Mongaras</a><time datetime="2023-02-12">Feb 12, 2023</time></div>
+{''.join(sections)}
+</div></article>
+<footer><a href="/about">About</a><a href="/help">Help</a><a href="/terms">Terms</a></footer>
+</body></html>
+"""
+
+
+def build_corpus() -> None:
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+    for name, (slugs, repeat, apollo) in CORPUS.items():
+        page = build_page(slugs, repeat, apollo)
+        (corpus_dir / f'{name}.html').write_text(page, encoding='utf-8')
+        print(f'📝 {name}.html  {len(page) / 1024:.0f} KB')
+
+
+# ------------------------------
+# Benchmark
+# ------------------------------
+
+def _time(fn, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def select_path(html: str, base_url: str) -> str:
+    """Which branch select_article() takes for this page (same check it applies)."""
+    fast = m2m.extract_from_medium_state(html, base_url)
+    return 'apollo' if fast is not None and len(fast[0].get_text(strip=True)) >= 100 else 'readability'
+
+
+def bench_page(html: str, repeats: int, base_url: str = BASE_URL) -> dict[str, float]:
+    results = {'parse': _time(lambda: m2m.make_soup(html), repeats)}
+    if m2m.Document is not None:
+        results['readability'] = _time(lambda: m2m.Document(html).summary(html_partial=True), repeats)
+    results['select'] = _time(lambda: m2m.select_article(html, base_url), repeats)
+
+    # The DOM passes mutate the tree, so each sample works on a fresh selection
+    fence, markdown = [], []
+    for _ in range(repeats):
+        article, _ = m2m.select_article(html, base_url)
+        start = time.perf_counter()
+        m2m.fence_codeblocks(article)
+        mid = time.perf_counter()
+        m2m.soup_to_markdown(article)
+        fence.append(mid - start)
+        markdown.append(time.perf_counter() - mid)
+    results['fence'] = statistics.median(fence)
+    results['markdown'] = statistics.median(markdown)
+    return results
+
+
+def print_table(results: dict, baseline: dict | None = None) -> None:
+    header = f"{'page':<14}{'KB':>6}{'path':>13}" + ''.join(f'{s:>13}' for s in STAGES)
+    print(header)
+    print('-' * len(header))
+    for page, r in results.items():
+        row = f"{page:<14}{r['kb']:>6}{r.get('path', '-'):>13}"
+        for stage in STAGES:
+            ms = r['stages'].get(stage)
+            if ms is None:
+                row += f"{'-':>13}"
+                continue
+            cell = f'{ms:.1f}'
+            base = (baseline or {}).get(page, {}).get('stages', {}).get(stage)
+            if base:
+                cell += f' {(ms - base) / base:+.0%}'
+            row += f'{cell:>13}'
+        print(row)
+    print('(median ms per stage' + (', change vs baseline)' if baseline else ')'))
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description='Benchmark the Medium → Markdown converter on an offline corpus')
+    ap.add_argument('pages', nargs='*', help=f"Corpus pages to run (default: all of {', '.join(CORPUS)})")
+    ap.add_argument('-n', '--repeats', type=int, default=5, help='Samples per stage; the median is reported (default: 5)')
+    ap.add_argument('--json', dest='json_out', help='Write results to this JSON file')
+    ap.add_argument('--compare', help='Baseline JSON from an earlier --json run to compare against')
+    ap.add_argument('--build-corpus', action='store_true', help='Regenerate the corpus from src/blogs/*.js and exit')
+    args = ap.parse_args(argv)
+
+    if args.build_corpus:
+        build_corpus()
+        return 0
+
+    pages = args.pages or list(CORPUS)
+    results = {}
+    for page in pages:
+        path = corpus_dir / f'{page}.html'
+        if not path.exists():
+            print(f'❌ Missing corpus page {path} (run with --build-corpus)')
+            return 1
+        html = path.read_text(encoding='utf-8')
+        base_url = APOLLO_BASE_URL if CORPUS.get(page, (None, None, False))[2] else BASE_URL
+        stages = bench_page(html, args.repeats, base_url)
+        results[page] = {
+            'kb': round(len(html.encode('utf-8')) / 1024),
+            'path': select_path(html, base_url),
+            'stages': {name: round(sec * 1000, 2) for name, sec in stages.items()},
+        }
+
+    baseline = json.loads(Path(args.compare).read_text(encoding='utf-8')) if args.compare else None
+    print_table(results, baseline)
+
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+        print(f'✅ Results written to {args.json_out}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Scale benchmark for the YouTube data pipeline (scripts/GetYoutueData.py), fully offline.
+
+Builds a synthetic channel of N videos in a temp directory — a metadata store holding
+90% of them plus a legacy-format youtubeData.js — then times each phase of a run with
+FakeExtractor standing in for yt_dlp, and reports wall time and peak traced memory.
+
+Phases
+- legacy_load: the old regex scrape of a generated youtubeData.js (one-time bootstrap path)
+- store_load:  VideoStore.load of youtubeData.jsonl
+- filter:      videos.txt URLs -> IDs not yet in the store
+- fetch:       fetch_videos over the new 10% with FakeExtractor (see --latency)
+- merge:       upsert fetched records + order every video by the URL list
+- serialize:   write_youtube_data (index module + JSON pages)
+- store_save:  VideoStore.save
+
+Usage
+  python scripts/benchmarkYoutubeData.py                    # 100, 1000 and 10000 videos
+  python scripts/benchmarkYoutubeData.py --sizes 100000 --latency 0.05 --workers 16
+  python scripts/benchmarkYoutubeData.py --json out.json
+"""
+import argparse
+import json
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+import GetYoutueData as ytd  # noqa: E402
+from youtubeStore import VideoStore, utc_now  # noqa: E402
+
+PHASES = ('legacy_load', 'store_load', 'filter', 'fetch', 'merge', 'serialize', 'store_save')
+ID_CHARS = string.ascii_letters + string.digits + '-_'
+
+
+class FakeExtractor:
+    """Offline stand-in for yt_dlp.YoutubeDL: deterministic synthetic info dicts.
+
+    `latency` seconds of sleep per video simulates network time; `fail_every` makes
+    every n-th distinct call raise, to exercise the retry queue.
+    """
+
+    def __init__(self, opts=None, latency=0.0, fail_every=0):
+        self.opts = opts or {}
+        self.latency = latency
+        self.fail_every = fail_every
+        self.calls = 0
+
+    def extract_info(self, url, download=False):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if self.fail_every and self.calls % self.fail_every == 0:
+            raise RuntimeError('synthetic extraction failure')
+        return synthetic_info(ytd.extract_video_id(url))
+
+
+def synthetic_info(video_id):
+    rng = random.Random(video_id)
+    return {
+        'id': video_id,
+        'title': f'Paper review: {" ".join(rng.choice(["Attention", "Diffusion", "Scaling", "Sparse", "Linear", "Models", "Learning", "Transformers"]) for _ in range(5))}',
+        'description': 'Paper: https://arxiv.org/abs/2501.00001\n\n' + '\n'.join(
+            f'{m:02d}:00 Chapter {m} "quoted" \\ notes' for m in range(rng.randint(3, 25))
+        ),
+        'duration': rng.randint(300, 7200),
+        'upload_date': f'20{rng.randint(20, 25)}{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}',
+        'view_count': rng.randint(10, 2_000_000),
+        'like_count': rng.randint(0, 50_000),
+    }
+
+
+def fake_factory(latency=0.0, fail_every=0):
+    return lambda opts: FakeExtractor(opts, latency, fail_every)
+
+
+def synthetic_channel(n, seed=0):
+    rng = random.Random(seed)
+    ids = [''.join(rng.choice(ID_CHARS) for _ in range(11)) for _ in range(n)]
+    return [f'https://www.youtube.com/watch?v={video_id}' for video_id in ids]
+
+
+def legacy_js(records, description_length=200):
+    """youtubeData.js as GetYoutueData.py used to write it (multi-line objects)"""
+    parts = ['export const youtubeVideos = [\n']
+    for i, record in enumerate(records):
+        video = ytd.display_video(record, description_length)
+        fields = ',\n'.join(f'    {key}: {json.dumps(str(video[key]), ensure_ascii=False)}' for key in
+                            ('title', 'description', 'videoId', 'thumbnail', 'duration', 'publishedAt', 'views', 'likes'))
+        parts.append('  {\n' + fields + '\n  }' + (',' if i < len(records) - 1 else '') + '\n')
+    parts.append('];\n')
+    return ''.join(parts)
+
+
+def build_fixture(root, n, known_fraction=0.9):
+    urls = synthetic_channel(n)
+    known = urls[len(urls) - int(len(urls) * known_fraction):]  # older uploads are already known
+    store = VideoStore(os.path.join(root, 'youtubeData.jsonl'))
+    for url in known:
+        video_id = ytd.extract_video_id(url)
+        store.upsert(ytd.video_record(synthetic_info(video_id), video_id) | {'fetchedAt': utc_now()})
+    store.save()
+    with open(os.path.join(root, 'legacy_youtubeData.js'), 'w', encoding='utf-8') as f:
+        f.write(legacy_js([store.get(ytd.extract_video_id(url)) for url in known]))
+    return urls
+
+
+class Phases:
+    def __init__(self):
+        self.results = {}
+
+    def run(self, name, fn):
+        tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            return fn()
+        finally:
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            self.results[name] = {'ms': round(elapsed * 1000, 2), 'peak_mb': round(peak / 2**20, 2)}
+
+
+def bench_size(n, workers, latency):
+    with tempfile.TemporaryDirectory() as root:
+        urls = build_fixture(root, n)
+        phases = Phases()
+
+        phases.run('legacy_load', lambda: VideoStore(os.path.join(root, 'legacy.jsonl')).import_legacy_js(
+            os.path.join(root, 'legacy_youtubeData.js')))
+        store = phases.run('store_load', lambda: VideoStore.load(os.path.join(root, 'youtubeData.jsonl')))
+        new_urls = phases.run('filter', lambda: [
+            url for url in urls if (video_id := ytd.extract_video_id(url)) and video_id not in store])
+        fetched = phases.run('fetch', lambda: ytd.fetch_videos(
+            new_urls, workers, retries=0, extractor_factory=fake_factory(latency), verbose=False))
+
+        def merge():
+            for record in fetched.values():
+                store.upsert(record)
+            return ytd.ordered_videos(store, urls)
+        videos = phases.run('merge', merge)
+        phases.run('serialize', lambda: ytd.write_youtube_data(
+            videos, os.path.join(root, 'youtubeData.js'), os.path.join(root, 'pages')))
+        phases.run('store_save', store.save)
+
+        index_kb = os.path.getsize(os.path.join(root, 'youtubeData.js')) / 1024
+        assert len(videos) == n, f'merged {len(videos)} of {n} videos'
+        return {'videos': n, 'new': len(new_urls), 'index_kb': round(index_kb), 'phases': phases.results}
+
+
+def print_table(results):
+    header = f"{'videos':>8}{'index KB':>10}" + ''.join(f'{p:>14}' for p in PHASES)
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        row = f"{r['videos']:>8}{r['index_kb']:>10}"
+        for phase in PHASES:
+            p = r['phases'][phase]
+            row += f"{p['ms']:>8.1f}/{p['peak_mb']:<5.1f}"
+        print(row)
+    print('(ms / peak traced MB per phase)')
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Offline scale benchmark for GetYoutueData.py')
+    ap.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000], help='Channel sizes (default: 100 1000 10000)')
+    ap.add_argument('--workers', type=int, default=ytd.DEFAULT_WORKERS, help='fetch_videos workers')
+    ap.add_argument('--latency', type=float, default=0.0, help='Simulated seconds per extraction (default: 0)')
+    ap.add_argument('--json', dest='json_out', help='Write results to this JSON file')
+    args = ap.parse_args(argv)
+
+    results = [bench_size(n, args.workers, args.latency) for n in args.sizes]
+    print_table(results)
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+        print(f'✅ Results written to {args.json_out}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
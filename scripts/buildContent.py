@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Build every generated content file (posts manifest, YouTube data, OG cards, icons, image
+variants, search index, prerendered posts, sitemap) from one entry point.
+
+Each script is a task with declared inputs, outputs and dependencies. A task is skipped
+when the hash of its inputs (and of the script itself) matches the last successful run and
+its outputs still exist, make-style; the hashes are kept in .build_cache/stamps.json.
+Tasks whose dependencies are done run in parallel, each in its own process, and a timing
+summary is printed at the end.
+
+Tasks that talk to YouTube have no local inputs to compare, so they only run with --fetch
+(or when named) and then always run. Without them, the rest of the build uses the
+YouTube data already on disk.
+
+Usage
+  python scripts/buildContent.py                  # everything offline that is out of date
+  python scripts/buildContent.py --fetch          # also list new uploads and refresh video data
+  python scripts/buildContent.py search-index og-images
+  python scripts/buildContent.py --dry-run
+  python scripts/buildContent.py --force --jobs 2
+  python scripts/buildContent.py --self-test
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from pathlib import Path
+
+script_dir = Path(__file__).parent
+project_root = script_dir.parent
+stamps_path = project_root / '.build_cache' / 'stamps.json'
+
+PYTHON = sys.executable
+DEFAULT_JOBS = os.cpu_count() or 1
+CHUNK_SIZE = 1 << 20
+GLOB_CHARS = set('*?[')
+# Imported by several scripts (post manifest parser)
+BLOG_HELPERS = 'src/blogs/medium_to_markdown.py'
+
+
+@dataclass
+class Task:
+    name: str
+    command: list
+    inputs: list = field(default_factory=list)   # glob patterns, relative to the project root
+    outputs: list = field(default_factory=list)  # plain paths must exist after a run
+    deps: list = field(default_factory=list)
+    network: bool = False  # remote inputs: only with --fetch, never skipped
+
+    @property
+    def script(self):
+        return next(arg for arg in self.command if arg.endswith(('.py', '.js')))
+
+
+# ------------------------------
+# Tasks
+# ------------------------------
+
+TASKS = [
+    Task('youtube-urls', [PYTHON, 'scripts/GetYoutubeURLs.py'],
+         outputs=['scripts/videos.txt'],
+         network=True),
+    Task('youtube-data', [PYTHON, 'scripts/GetYoutueData.py'],
+         inputs=['scripts/videos.txt', 'youtube_config.json', 'scripts/youtubeStore.py', 'scripts/youtubeThumbnails.py'],
+         outputs=['scripts/youtubeData.jsonl', 'src/youtubeData.js', 'public/youtube/page-*.json', 'public/youtube/thumbs/*'],
+         deps=['youtube-urls'], network=True),
+    Task('youtube-data-check', ['node', 'scripts/updateData.js'],
+         inputs=['src/youtubeData.js'],
+         deps=['youtube-data']),
+    Task('post-manifest', [PYTHON, 'src/blogs/medium_to_markdown.py', '--update-manifest'],
+         inputs=['src/blogs/*.js'],
+         outputs=['src/blogs/index.js']),
+    Task('icons', [PYTHON, 'scripts/generateIcons.py'],
+         inputs=['scripts/icons/master.png', 'public/manifest.json'],
+         outputs=['public/favicon.ico', 'public/apple-touch-icon.png', 'public/icons/*', 'scripts/icons/outputs.json']),
+    Task('og-images', [PYTHON, 'scripts/generateOGImage.py'],
+         inputs=['src/blogs/index.js', 'public/icons/icon-512.png', BLOG_HELPERS],
+         outputs=['public/og-image.png', 'public/og/manifest.json', 'src/ogImages.js', 'public/og/*/*.png'],
+         deps=['post-manifest', 'icons']),
+    Task('optimize-images', [PYTHON, 'scripts/optimizeImages.py'],
+         inputs=['src/projects.js', 'src/data.js', 'public/me.*', 'public/projects/*', 'scripts/imageVariants.py'],
+         outputs=['src/imageVariants.js', 'public/me-*.*', 'public/projects/*-[0-9]*.avif', 'public/projects/*-[0-9]*.webp']),
+    Task('search-index', [PYTHON, 'scripts/buildSearchIndex.py'],
+         inputs=['src/blogs/*.js', 'scripts/youtubeData.jsonl', 'src/projects.js', 'scripts/youtubeStore.py', BLOG_HELPERS],
+         outputs=['public/search/index.json', 'public/search/shard-*.json'],
+         deps=['post-manifest', 'youtube-data']),
+    Task('prerender-blogs', ['node', 'scripts/prerenderBlogs.js'],
+         inputs=['src/blogs/*.js', 'src/blogRender.js', 'src/blogContentKey.js', 'package.json',
+                 'public/blogs/images/*/images.json', 'public/blogs/assets/images.json'],
+         outputs=['src/blogs/prerendered/*.json'],
+         deps=['post-manifest']),
+    Task('sitemap', ['node', 'scripts/generateSitemap.js'],
+         inputs=['src/blogs/index.js'],
+         outputs=['public/sitemap.xml'],
+         deps=['post-manifest']),
+]
+
+
+def task_graph(tasks=TASKS):
+    """name -> Task, after checking that every dependency exists and there are no cycles."""
+    graph = {task.name: task for task in tasks}
+    for task in tasks:
+        for dep in task.deps:
+            if dep not in graph:
+                raise ValueError(f'{task.name} depends on unknown task {dep}')
+
+    state = {}
+
+    def visit(name, path):
+        if state.get(name) == 'done':
+            return
+        if state.get(name) == 'visiting':
+            raise ValueError(f"dependency cycle: {' -> '.join(path + [name])}")
+        state[name] = 'visiting'
+        for dep in graph[name].deps:
+            visit(dep, path + [name])
+        state[name] = 'done'
+
+    for name in graph:
+        visit(name, [])
+    return graph
+
+
+def select_tasks(graph, targets, fetch):
+    """The targets plus everything they depend on. Network tasks are left out unless
+    --fetch is given or they are named; their dependents then use the data on disk."""
+    selected = set()
+
+    def add(name, explicit):
+        if name in selected or (graph[name].network and not (fetch or explicit)):
+            return
+        selected.add(name)
+        for dep in graph[name].deps:
+            add(dep, False)
+
+    for name in targets or graph:
+        add(name, bool(targets))
+    return [name for name in graph if name in selected]
+
+
+# ------------------------------
+# Up-to-date checks
+# ------------------------------
+
+def _matches(patterns):
+    files = set()
+    for pattern in patterns:
+        if GLOB_CHARS & set(pattern):
+            files.update(p for p in project_root.glob(pattern) if p.is_file())
+        elif (project_root / pattern).is_file():
+            files.add(project_root / pattern)
+    return files
+
+
+def input_hash(task):
+    """Digest of the command, the task's script and every input file that is not also one
+    of its outputs (tasks may rewrite their own inputs, e.g. the video store)."""
+    digest = hashlib.sha256(json.dumps(task.command[1:]).encode('utf-8'))
+    files = (_matches(task.inputs) | {project_root / task.script}) - _matches(task.outputs)
+    for path in sorted(files):
+        digest.update(path.relative_to(project_root).as_posix().encode('utf-8') + b'\0')
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                digest.update(chunk)
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def missing_outputs(task):
+    return [p for p in task.outputs if not (GLOB_CHARS & set(p)) and not (project_root / p).exists()]
+
+
+def load_stamps():
+    try:
+        return json.loads(stamps_path.read_text(encoding='utf-8'))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_stamps(stamps):
+    stamps_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=stamps_path.parent, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(stamps, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp, stamps_path)
+
+
+def is_up_to_date(task, stamps):
+    if task.network:
+        return False
+    return stamps.get(task.name) == input_hash(task) and not missing_outputs(task)
+
+
+# ------------------------------
+# Runner
+# ------------------------------
+
+def run_task(task):
+    """Run one task in its own process; returns (ok, seconds, output)."""
+    start = time.perf_counter()
+    if shutil.which(task.command[0]) is None:
+        return False, 0.0, f'{task.command[0]} not found on PATH'
+    result = subprocess.run(task.command, cwd=project_root, capture_output=True, text=True)
+    output = (result.stdout + result.stderr).strip()
+    if result.returncode == 0 and missing_outputs(task):
+        return False, time.perf_counter() - start, output + f"\nmissing outputs: {', '.join(missing_outputs(task))}"
+    return result.returncode == 0, time.perf_counter() - start, output
+
+
+def build(names, graph, jobs=DEFAULT_JOBS, force=False, verbose=False):
+    """Run the selected tasks in dependency order, `jobs` at a time.
+    Returns {name: (status, seconds)} with status ran / up to date / failed / blocked."""
+    stamps = load_stamps()
+    results = {}
+    pending = list(names)
+    running = {}
+
+    def finished(name):
+        return name in results or name not in names
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while pending or running:
+            for name in list(pending):
+                task = graph[name]
+                if any(results.get(dep, ('ran',))[0] in ('failed', 'blocked') for dep in task.deps):
+                    results[name] = ('blocked', 0.0)
+                    pending.remove(name)
+                    print(f'[BLOCKED] {name} (a dependency failed)')
+                elif all(finished(dep) for dep in task.deps) and len(running) < max(1, jobs):
+                    pending.remove(name)
+                    # Checked only now, after the dependencies may have rewritten its inputs
+                    if not force and is_up_to_date(task, stamps):
+                        results[name] = ('up to date', 0.0)
+                        continue
+                    print(f'📝 {name}: {" ".join(task.command[1:])}')
+                    running[pool.submit(run_task, task)] = name
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                ok, seconds, output = future.result()
+                if output and (verbose or not ok):
+                    print('\n'.join(f'    {line}' for line in output.splitlines()))
+                if ok:
+                    stamps[name] = input_hash(graph[name])
+                    print(f'✅ {name} ({seconds:.1f}s)')
+                else:
+                    # A failed run may have left partial outputs: never trust its old stamp
+                    stamps.pop(name, None)
+                    print(f'❌ {name} failed ({seconds:.1f}s)')
+                save_stamps(stamps)
+                results[name] = ('ran' if ok else 'failed', seconds)
+    return results
+
+
+def print_summary(results, names, wall):
+    width = max(len(name) for name in names) + 2
+    print(f"\n{'Task'.ljust(width)}{'Status'.ljust(12)}Time")
+    for name in names:
+        status, seconds = results[name]
+        print(f"{name.ljust(width)}{status.ljust(12)}{f'{seconds:.1f}s' if status in ('ran', 'failed') else '-'}")
+    busy = sum(seconds for _, seconds in results.values())
+    print(f'Total {wall:.1f}s wall, {busy:.1f}s of task time')
+
+
+def _run_self_tests():
+    """Offline tests for the task graph and the stamp-based up-to-date checks, on a scratch project."""
+    global project_root, stamps_path
+    saved = project_root, stamps_path
+    with tempfile.TemporaryDirectory() as tmp:
+        project_root = Path(tmp)
+        stamps_path = project_root / '.build_cache' / 'stamps.json'
+        try:
+            # copy.py SRC DST [--fail]: DST = upper-cased SRC
+            (project_root / 'copy.py').write_text(
+                'import sys\n'
+                'if "--fail" in sys.argv: sys.exit(1)\n'
+                'open(sys.argv[2], "w").write(open(sys.argv[1]).read().upper())\n', encoding='utf-8')
+            (project_root / 'a.txt').write_text('a', encoding='utf-8')
+            tasks = [
+                Task('first', [PYTHON, 'copy.py', 'a.txt', 'b.txt'], inputs=['*.txt'], outputs=['b.txt']),
+                Task('second', [PYTHON, 'copy.py', 'b.txt', 'c.out'], inputs=['b.txt'], outputs=['c.out'], deps=['first']),
+                Task('remote', [PYTHON, 'copy.py', 'a.txt', 'r.out'], outputs=['r.out'], network=True),
+            ]
+            graph = task_graph(tasks)
+
+            def run(names=('first', 'second'), force=False):
+                with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+                    return {name: status for name, (status, _) in build(list(names), graph, jobs=2, force=force).items()}
+
+            # Network tasks only with --fetch or when named
+            assert select_tasks(graph, [], fetch=False) == ['first', 'second']
+            assert select_tasks(graph, ['remote'], fetch=False) == ['remote']
+            assert select_tasks(graph, ['second'], fetch=True) == ['first', 'second']
+
+            assert run() == {'first': 'ran', 'second': 'ran'}
+            assert (project_root / 'c.out').read_text() == 'A'
+            assert run() == {'first': 'up to date', 'second': 'up to date'}
+            # An output matched by the task's own input glob (b.txt) does not invalidate it
+            assert set(json.loads(stamps_path.read_text())) == {'first', 'second'}
+
+            # Changed input: the task reruns, and so does its dependent whose input it rewrote
+            (project_root / 'a.txt').write_text('ab', encoding='utf-8')
+            assert run() == {'first': 'ran', 'second': 'ran'} and (project_root / 'c.out').read_text() == 'AB'
+            # Same input content again: nothing to do
+            (project_root / 'a.txt').write_text('ab', encoding='utf-8')
+            assert run() == {'first': 'up to date', 'second': 'up to date'}
+            # A deleted output, the script itself and the command line all invalidate
+            (project_root / 'c.out').unlink()
+            assert run() == {'first': 'up to date', 'second': 'ran'}
+            with open(project_root / 'copy.py', 'a', encoding='utf-8') as f:
+                f.write('# changed\n')
+            assert run() == {'first': 'ran', 'second': 'ran'}
+            graph['second'].command.append('--fail')
+            assert run(['second']) == {'second': 'failed'} and 'second' not in json.loads(stamps_path.read_text())
+            graph['first'].command.append('--fail')
+            assert run(force=True) == {'first': 'failed', 'second': 'blocked'}
+            # Network tasks never count as up to date
+            assert run(['remote']) == {'remote': 'ran'} and run(['remote']) == {'remote': 'ran'}
+
+            for bad in ([Task('x', ['node', 'x.js'], deps=['nope'])],
+                        [Task('x', ['node', 'x.js'], deps=['y']), Task('y', ['node', 'y.js'], deps=['x'])]):
+                try:
+                    task_graph(bad)
+                except ValueError:
+                    pass
+                else:
+                    raise AssertionError(f'task_graph accepted {[t.name for t in bad]}')
+        finally:
+            project_root, stamps_path = saved
+
+    print('All self tests passed.')
+    return 0
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Build the generated site content, skipping tasks whose inputs are unchanged')
+    ap.add_argument('targets', nargs='*', help=f"Tasks to build, with their dependencies (default: all). One of: {', '.join(t.name for t in TASKS)}")
+    ap.add_argument('--fetch', action='store_true', help='Also run the tasks that fetch from YouTube')
+    ap.add_argument('--force', action='store_true', help='Run every selected task, ignoring the stored hashes')
+    ap.add_argument('--jobs', type=int, default=DEFAULT_JOBS, help=f'Tasks run in parallel (default: {DEFAULT_JOBS})')
+    ap.add_argument('--dry-run', action='store_true', help='Show which tasks are out of date now (before any dependency runs) and exit')
+    ap.add_argument('--verbose', action='store_true', help="Print every task's output, not only failures")
+    ap.add_argument('--self-test', action='store_true', help='Run built-in tests and exit')
+    args = ap.parse_args(argv)
+    if args.self_test:
+        return _run_self_tests()
+
+    graph = task_graph()
+    unknown = [name for name in args.targets if name not in graph]
+    if unknown:
+        ap.error(f"unknown task(s): {', '.join(unknown)}")
+    names = select_tasks(graph, args.targets, args.fetch)
+
+    if args.dry_run:
+        stamps = load_stamps()
+        for name in names:
+            stale = args.force or not is_up_to_date(graph[name], stamps)
+            print(f"{name}: {'out of date' if stale else 'up to date'}")
+        return 0
+
+    start = time.perf_counter()
+    results = build(names, graph, args.jobs, args.force, args.verbose)
+    print_summary(results, names, time.perf_counter() - start)
+    return 1 if any(status in ('failed', 'blocked') for status, _ in results.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
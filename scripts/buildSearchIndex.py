@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Build a compact, sharded inverted index over blog posts, YouTube videos and projects.
+
+Sources
+- posts:    src/blogs/index.js manifest + the <slug>.js body modules
+- videos:   scripts/youtubeData.jsonl (full descriptions, written by GetYoutueData.py)
+- projects: src/projects.js
+
+Output (public/search/, small enough for a client to fetch lazily)
+- index.json:    document table, tokenizer settings and the shard directory. A client
+                 tokenizes queries with the same rules as tokenize() below, using the
+                 settings recorded here, or it looks up terms the index never stores
+- shard-N.json:  {term: [doc, score, doc, score, ...]} for a contiguous range of sorted
+                 terms, postings ordered by score. A lookup (or prefix lookup) reads the
+                 directory and then only the one or two shards covering that range.
+
+Scores are BM25 over field-weighted term counts (title > tags > body), precomputed and
+stored as integers, so the client only sums them.
+
+Usage
+  python scripts/buildSearchIndex.py
+  python scripts/buildSearchIndex.py --out-dir public/search --shard-kb 24
+  python scripts/buildSearchIndex.py --out-dir /tmp/search --url-prefix /search
+  python scripts/buildSearchIndex.py --self-test
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+import tempfile
+import unicodedata
+from collections import Counter, defaultdict
+from pathlib import Path
+
+script_dir = Path(__file__).parent
+project_root = script_dir.parent
+posts_dir = project_root / 'src' / 'blogs'
+projects_file = project_root / 'src' / 'projects.js'
+
+sys.path.insert(0, str(script_dir))
+sys.path.insert(0, str(posts_dir))
+import medium_to_markdown as m2m  # noqa: E402
+from youtubeStore import STORE_PATH, VideoStore  # noqa: E402
+
+OUT_DIR = project_root / 'public' / 'search'
+URL_PREFIX = '/search'  # where OUT_DIR is served; shard URLs in index.json start with it
+INDEX_VERSION = 1
+SHARD_KB = 24
+
+# Field weights for the term counts that feed BM25
+FIELD_WEIGHTS = {'title': 5, 'tags': 3, 'body': 1}
+BM25_K1 = 1.2
+BM25_B = 0.75
+SCORE_SCALE = 100  # scores are stored as round(bm25 * SCORE_SCALE)
+
+MIN_TOKEN_LEN = 2
+MAX_TOKEN_LEN = 32
+MIN_NUMBER_LEN = 4  # keeps years, drops chapter timestamps like "12:05"
+STOPWORDS = frozenset('''
+a an and are as at be but by can do does for from had has have how i if in into is it its
+me my not of on or our so than that the their them then there these they this to was we
+were what when which who why will with you your
+'''.split())
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+URL_RE = re.compile(r'https?://\S+')
+FENCE_RE = re.compile(r'```.*?```', re.S)
+# Site post blocks (src/blogRender.js): {{code(lang)}} ... {{code}} and {{youtube(url)}} lines
+CODE_BLOCK_RE = re.compile(r'^\{\{code\([^)]*\)\}\}.*?(?:^\s*\{\{code\}\}\s*$|\Z)', re.M | re.S)
+EMBED_RE = re.compile(r'^\{\{youtube\([^)]*\)\}\}\s*$', re.M)
+MATH_RE = re.compile(r'\$\$.*?\$\$|\$[^$\n]+\$', re.S)
+LINK_RE = re.compile(r'!?\[([^\]]*)\]\([^)]*\)')
+# JS object literal -> JSON: strings pass through, bare keys get quoted, comments and
+# trailing commas are dropped
+JS_LITERAL_RE = re.compile(r'''("(?:[^"\\]|\\.)*")|'((?:[^'\\]|\\.)*)'|//[^\n]*|/\*.*?\*/|([A-Za-z_$][\w$]*)(?=\s*:)|,(?=\s*[\]}])''', re.S)
+
+
+# ------------------------------
+# Sources
+# ------------------------------
+
+def read_js_array(path, name):
+    """`export const <name> = [...]` from a data module, for plain object/array literals."""
+    text = Path(path).read_text(encoding='utf-8')
+    start = re.search(rf'export const {name}\s*=\s*\[', text)
+    if not start:
+        raise ValueError(f'{path} has no `export const {name}` array')
+    depth, i = 0, start.end() - 1
+    for match in re.finditer(r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|//[^\n]*|[\[\]]', text[i:]):
+        token = match.group(0)
+        if token == '[':
+            depth += 1
+        elif token == ']':
+            depth -= 1
+            if depth == 0:
+                literal = text[i:i + match.end()]
+                break
+    else:
+        raise ValueError(f'unterminated `{name}` array in {path}')
+
+    def to_json(match):
+        double, single, key = match.group(1), match.group(2), match.group(3)
+        if double is not None:
+            return double
+        if single is not None:
+            return json.dumps(json.loads('"' + single.replace('\\\'', '\'').replace('"', '\\"') + '"'))
+        if key is not None:
+            return json.dumps(key)
+        return ''
+    return json.loads(JS_LITERAL_RE.sub(to_json, literal))
+
+
+def post_documents():
+    for post in m2m.read_post_manifest(posts_dir):
+        body = m2m.read_post_body(posts_dir / f"{post['slug']}.js")
+        yield {
+            'type': 'post',
+            'title': post['title'],
+            'url': f"/#blog/{post['slug']}",
+            'date': post['date'],
+            'fields': {'title': post['title'], 'tags': ' '.join(post['tags']), 'body': f"{post['excerpt']}\n{body}"},
+        }
+
+
+def video_documents(store_path=STORE_PATH):
+    store = VideoStore.load(store_path)
+    for video_id in sorted(store.videos):
+        record = store.get(video_id)
+        yield {
+            'type': 'video',
+            'title': record['title'],
+            'url': f'https://www.youtube.com/watch?v={video_id}',
+            'date': record.get('publishedAt'),
+            'fields': {'title': record['title'], 'tags': '', 'body': record.get('description') or ''},
+        }
+
+
+def project_documents(path=projects_file):
+    for project in read_js_array(path, 'projects'):
+        links = project.get('links') or []
+        yield {
+            'type': 'project',
+            'title': project['name'],
+            'url': links[0]['href'] if links else '/#projects',
+            'date': project.get('date'),
+            'fields': {'title': project['name'], 'tags': ' '.join(project.get('skills') or []), 'body': project.get('desc') or ''},
+        }
+
+
+# ------------------------------
+# Index
+# ------------------------------
+
+def tokenize(text):
+    """Lowercase ASCII-folded word tokens. The limits are written to index.json for query tokenizers."""
+    text = unicodedata.normalize('NFKD', text.lower()).encode('ascii', 'ignore').decode('ascii')
+    return [t for t in TOKEN_RE.findall(text)
+            if MIN_TOKEN_LEN <= len(t) <= MAX_TOKEN_LEN and t not in STOPWORDS
+            and not (t.isdigit() and len(t) < MIN_NUMBER_LEN)]
+
+
+def clean_markdown(text):
+    """Prose only: drop code blocks, embeds, math, URLs and link targets (link text is kept)."""
+    text = CODE_BLOCK_RE.sub(' ', text)
+    text = EMBED_RE.sub(' ', text)
+    text = FENCE_RE.sub(' ', text)
+    text = MATH_RE.sub(' ', text)
+    text = LINK_RE.sub(r' \1 ', text)
+    return URL_RE.sub(' ', text)
+
+
+def weighted_counts(doc):
+    counts = Counter()
+    for field, weight in FIELD_WEIGHTS.items():
+        for token in tokenize(clean_markdown(doc['fields'][field])):
+            counts[token] += weight
+    return counts
+
+
+def build_postings(docs):
+    """term -> [(doc index, integer score)], best first."""
+    counts = [weighted_counts(doc) for doc in docs]
+    lengths = [sum(c.values()) for c in counts]
+    avg_length = (sum(lengths) / len(lengths)) if lengths else 1
+    df = Counter(term for c in counts for term in c)
+    n = len(docs)
+
+    postings = defaultdict(list)
+    for doc_index, (c, length) in enumerate(zip(counts, lengths)):
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+        for term, tf in c.items():
+            idf = math.log(1 + (n - df[term] + 0.5) / (df[term] + 0.5))
+            score = round(idf * tf * (BM25_K1 + 1) / (tf + norm) * SCORE_SCALE)
+            postings[term].append((doc_index, max(score, 1)))
+    for entries in postings.values():
+        entries.sort(key=lambda e: (-e[1], e[0]))
+    return postings
+
+
+def shard_postings(postings, shard_bytes):
+    """Split sorted terms into contiguous shards of roughly `shard_bytes` each."""
+    shards, current, size = [], {}, 0
+    for term in sorted(postings):
+        flat = [value for entry in postings[term] for value in entry]
+        entry_size = len(term) + 6 + len(json.dumps(flat, separators=(',', ':')))
+        if current and size + entry_size > shard_bytes:
+            shards.append(current)
+            current, size = {}, 0
+        current[term] = flat
+        size += entry_size
+    if current:
+        shards.append(current)
+    return shards
+
+
+def _write_if_changed(path, text):
+    data = text.encode('utf-8')
+    try:
+        if Path(path).read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp, 0o644)  # mkstemp creates 0600; these files are served
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return True
+
+
+def write_index(docs, out_dir=OUT_DIR, shard_kb=SHARD_KB, url_prefix=URL_PREFIX):
+    """Write index.json + shard-N.json; returns (shard count, files changed).
+    Shard URLs in the directory are `url_prefix`/shard-N.json, wherever out_dir is."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    shards = shard_postings(build_postings(docs), shard_kb * 1024)
+
+    changed = 0
+    directory = []
+    for n, shard in enumerate(shards):
+        content = json.dumps(shard, ensure_ascii=False, separators=(',', ':')) + '\n'
+        name = f'shard-{n}.json'
+        changed += _write_if_changed(out_dir / name, content)
+        version = hashlib.sha256(content.encode('utf-8')).hexdigest()[:10]
+        directory.append([next(iter(shard)), f"{url_prefix.rstrip('/')}/{name}?v={version}"])
+    for path in out_dir.glob('shard-*.json'):
+        match = re.fullmatch(r'shard-(\d+)\.json', path.name)
+        if match and int(match.group(1)) >= len(shards):
+            path.unlink()
+            changed += 1
+
+    index = {
+        'version': INDEX_VERSION,
+        'minTokenLength': MIN_TOKEN_LEN,
+        'maxTokenLength': MAX_TOKEN_LEN,
+        'minNumberLength': MIN_NUMBER_LEN,
+        'stopwords': sorted(STOPWORDS),
+        # [type, title, url, date] per document; postings refer to positions in this list
+        'docs': [[doc['type'], doc['title'], doc['url'], doc['date']] for doc in docs],
+        # [first term, url] per shard, in term order
+        'shards': directory,
+    }
+    changed += _write_if_changed(out_dir / 'index.json', json.dumps(index, ensure_ascii=False, separators=(',', ':')) + '\n')
+    return len(shards), changed
+
+
+def _run_self_tests():
+    """Offline tests for the tokenizer, BM25 ranking and shard layout."""
+    # tokenize: lowercase, ASCII-folded, stopwords, length and number limits
+    assert tokenize('The Café naïve UNet, a b2 12:05 in 2023!') == ['cafe', 'naive', 'unet', 'b2', '2023']
+    assert tokenize('x' * MAX_TOKEN_LEN + ' ' + 'y' * (MAX_TOKEN_LEN + 1)) == ['x' * MAX_TOKEN_LEN]
+
+    # clean_markdown: code, embeds, math, URLs and link targets go; link text stays
+    body = ('Intro [diffusion paper](https://arxiv.org/abs/1) $x^2$\n{{code(python)}}\nimport torch\n{{code}}\n'
+            '{{youtube(https://youtu.be/abc)}}\n```\nfenced\n```\nsee https://example.com $$\\sum$$ outro')
+    assert tokenize(clean_markdown(body)) == ['intro', 'diffusion', 'paper', 'see', 'outro']
+
+    # read_js_array: single quotes, bare keys, comments and trailing commas
+    with tempfile.TemporaryDirectory() as tmp:
+        module = Path(tmp) / 'projects.js'
+        module.write_text("""export const projects = [
+  // newest first
+  { name: 'It\\'s "quoted"', skills: ['A', "B",], /* note */ links: [{ href: "https://x.y/[1]" }], },
+]
+export const other = []
+""", encoding='utf-8')
+        assert read_js_array(module, 'projects') == [{'name': 'It\'s "quoted"', 'skills': ['A', 'B'], 'links': [{'href': 'https://x.y/[1]'}]}]
+
+    # BM25: title > tags > body for the same term, rarer terms score higher, postings best first
+    def doc(title='', tags='', body=''):
+        return {'type': 'post', 'title': title, 'url': '/', 'date': None, 'fields': {'title': title, 'tags': tags, 'body': body}}
+    docs = [doc(body='attention'), doc(title='attention'), doc(tags='attention'),
+            doc(body='model rotary'), doc(body='model')]
+    postings = build_postings(docs)
+    assert [d for d, _ in postings['attention']] == [1, 2, 0], postings['attention']
+    assert all(score >= 1 and isinstance(score, int) for entries in postings.values() for _, score in entries)
+    assert dict(postings['rotary'])[3] > dict(postings['model'])[3]
+
+    # Shards: contiguous sorted term ranges, each term in exactly one shard
+    many = [doc(title=f'term{n:03d} shared') for n in range(60)]
+    all_postings = build_postings(many)
+    shards = shard_postings(all_postings, 200)
+    terms = [term for shard in shards for term in shard]
+    assert len(shards) > 3 and terms == sorted(all_postings) and len(set(terms)) == len(terms)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        count, changed = write_index(many, tmp, shard_kb=1, url_prefix='/s/')
+        index = json.loads((Path(tmp) / 'index.json').read_text(encoding='utf-8'))
+        assert (index['minTokenLength'], index['maxTokenLength'], index['minNumberLength']) == (MIN_TOKEN_LEN, MAX_TOKEN_LEN, MIN_NUMBER_LEN)
+        assert len(index['docs']) == 60 and len(index['shards']) == count == changed - 1 > 1
+        firsts = [first for first, _ in index['shards']]
+        assert firsts == sorted(firsts) and all(url.startswith(f'/s/shard-{n}.json?v=') for n, (_, url) in enumerate(index['shards']))
+        for n, (first, _) in enumerate(index['shards']):
+            shard = json.loads((Path(tmp) / f'shard-{n}.json').read_text(encoding='utf-8'))
+            assert next(iter(shard)) == first and all(first <= term for term in shard)
+            if n + 1 < count:
+                assert all(term < index['shards'][n + 1][0] for term in shard)
+        # Unchanged input rewrites nothing; a smaller index removes the extra shards
+        assert write_index(many, tmp, shard_kb=1, url_prefix='/s/') == (count, 0)
+        assert write_index(many[:1], tmp, shard_kb=1)[0] == 1 and sorted(p.name for p in Path(tmp).glob('shard-*')) == ['shard-0.json']
+
+    print("All self tests passed.")
+    return 0
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Build the sharded search index over posts, videos and projects')
+    ap.add_argument('--out-dir', default=str(OUT_DIR), help=f'Output directory (default: {OUT_DIR.relative_to(project_root)})')
+    ap.add_argument('--store', default=str(project_root / STORE_PATH), help='YouTube metadata store (youtubeData.jsonl)')
+    ap.add_argument('--url-prefix', default=URL_PREFIX, help=f'URL the output directory is served under (default: {URL_PREFIX})')
+    ap.add_argument('--shard-kb', type=int, default=SHARD_KB, help=f'Target shard size in KB (default: {SHARD_KB})')
+    ap.add_argument('--self-test', action='store_true', help='Run built-in tests and exit')
+    args = ap.parse_args(argv)
+    if args.self_test:
+        return _run_self_tests()
+
+    docs = [*post_documents(), *video_documents(args.store), *project_documents()]
+    shard_count, changed = write_index(docs, Path(args.out_dir).resolve(), args.shard_kb, args.url_prefix)
+    counts = Counter(doc['type'] for doc in docs)
+    print(f"📝 Indexed {counts['post']} posts, {counts['video']} videos, {counts['project']} projects")
+    print(f'✅ {shard_count} shards in {args.out_dir} ({changed} files changed)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Generate every site icon from one master image (scripts/icons/master.png).
+
+Outputs
+- public/favicon.ico:            multi-resolution ICO (16, 32, 48)
+- public/icons/icon-<N>.png/.webp: app icons at every size public/manifest.json declares
+                                  (the manifest's icon list is rewritten to point at them)
+- public/apple-touch-icon.png:   180x180, flattened onto the manifest background colour
+
+The master is decoded once and downscaled step by step from the largest size. Outputs are
+only rewritten when the master (or this script's settings) change; the digest of the last
+run is kept in scripts/icons/outputs.json.
+
+Usage
+  python scripts/generateIcons.py
+  python scripts/generateIcons.py --force
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+# Get script directory
+script_dir = Path(__file__).parent
+project_root = script_dir.parent
+
+# Paths
+master_path = script_dir / 'icons' / 'master.png'
+stamp_path = script_dir / 'icons' / 'outputs.json'
+public_dir = project_root / 'public'
+favicon_path = public_dir / 'favicon.ico'
+icons_dir = public_dir / 'icons'
+apple_touch_path = public_dir / 'apple-touch-icon.png'
+manifest_path = public_dir / 'manifest.json'
+
+# Bump when sizes, formats or encoder settings change so outputs are regenerated
+ICON_VERSION = 1
+ICO_SIZES = (16, 32, 48)
+DEFAULT_APP_SIZES = (192, 512)
+APPLE_TOUCH_SIZE = 180
+WEBP_QUALITY = 90
+
+
+def manifest_sizes(manifest):
+    """Square icon sizes declared in manifest.json ("192x192 512x512" style)."""
+    sizes = set()
+    for icon in manifest.get('icons', []):
+        for size in icon.get('sizes', '').split():
+            width, _, height = size.partition('x')
+            if width.isdigit() and width == height:
+                sizes.add(int(width))
+    return tuple(sorted(sizes)) or DEFAULT_APP_SIZES
+
+
+def icon_url(size, ext):
+    return f"/{icons_dir.relative_to(public_dir).as_posix()}/icon-{size}.{ext}"
+
+
+def _save(image, path, *args, **kwargs):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    image.save(tmp, *args, **kwargs)
+    os.replace(tmp, path)
+
+
+def render_icons(master, app_sizes, background):
+    """Write every output from the decoded master; returns the written paths."""
+    written = []
+    # Largest first, each size resampled from the previous one at most 2x larger
+    # (cheap, and LANCZOS on a near-size source keeps the edges crisp)
+    scaled = {}
+    source = master
+    for size in sorted({*app_sizes, APPLE_TOUCH_SIZE, 256, *ICO_SIZES}, reverse=True):
+        while source.width > size * 2:
+            source = source.resize((source.width // 2, source.height // 2), Image.Resampling.LANCZOS)
+        scaled[size] = source.resize((size, size), Image.Resampling.LANCZOS)
+
+    for size in app_sizes:
+        png, webp = icons_dir / f'icon-{size}.png', icons_dir / f'icon-{size}.webp'
+        _save(scaled[size], png, 'PNG', optimize=True)
+        _save(scaled[size], webp, 'WEBP', quality=WEBP_QUALITY, method=6)
+        written += [png, webp]
+
+    # iOS shows transparent pixels as black and adds its own rounded mask
+    apple = Image.new('RGBA', scaled[APPLE_TOUCH_SIZE].size, background)
+    apple.alpha_composite(scaled[APPLE_TOUCH_SIZE])
+    _save(apple.convert('RGB'), apple_touch_path, 'PNG', optimize=True)
+    written.append(apple_touch_path)
+
+    # Pillow takes each ICO frame from the first image; start from a 256px copy
+    _save(scaled[256], favicon_path, 'ICO', sizes=[(s, s) for s in ICO_SIZES])
+    written.append(favicon_path)
+    return written
+
+
+def update_manifest(manifest, app_sizes):
+    icons = []
+    for size in app_sizes:
+        icons.append({'src': icon_url(size, 'png'), 'sizes': f'{size}x{size}', 'type': 'image/png', 'purpose': 'any'})
+        icons.append({'src': icon_url(size, 'webp'), 'sizes': f'{size}x{size}', 'type': 'image/webp', 'purpose': 'any'})
+    if manifest.get('icons') != icons:
+        manifest['icons'] = icons
+        manifest_path.write_text(json.dumps(manifest, indent=2) + '\n', encoding='utf-8')
+        return True
+    return False
+
+
+def generate_icons(force=False):
+    """Regenerate the icons if the master changed. Returns the written paths ([] when up to date)."""
+    if not master_path.exists():
+        raise FileNotFoundError(f'Master icon not found at {master_path}')
+    manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    app_sizes = manifest_sizes(manifest)
+
+    digest = hashlib.sha256(master_path.read_bytes()).hexdigest()
+    stamp = {'version': ICON_VERSION, 'master': digest, 'appSizes': list(app_sizes),
+             'background': manifest.get('background_color', '#000000')}
+    try:
+        previous = json.loads(stamp_path.read_text(encoding='utf-8'))
+    except (FileNotFoundError, ValueError):
+        previous = None
+    outputs = [favicon_path, apple_touch_path, *(icons_dir / f'icon-{s}.{e}' for s in app_sizes for e in ('png', 'webp'))]
+    if not force and previous == stamp and all(p.exists() for p in outputs):
+        update_manifest(manifest, app_sizes)
+        return []
+
+    with Image.open(master_path) as master:
+        master = master.convert('RGBA')
+    written = render_icons(master, app_sizes, stamp['background'])
+    if update_manifest(manifest, app_sizes):
+        written.append(manifest_path)
+    stamp_path.write_text(json.dumps(stamp, indent=2) + '\n', encoding='utf-8')
+    return written
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Generate favicon, app icons and apple-touch icon from the master image')
+    ap.add_argument('--force', action='store_true', help='Regenerate even if the master is unchanged')
+    args = ap.parse_args(argv)
+    try:
+        written = generate_icons(args.force)
+    except Exception as error:
+        print(f'❌ Error generating icons: {error}')
+        return 1
+    if not written:
+        print('✅ Icons are up to date')
+        return 0
+    for path in written:
+        print(f'📝 {path.relative_to(project_root)}  {path.stat().st_size / 1024:.1f} KB')
+    print(f'✅ Generated {len(written)} icon files')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
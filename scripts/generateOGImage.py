@@ -1,66 +1,312 @@
 #!/usr/bin/env python3
 """
-Generate Open Graph image with black background and centered favicon.
+Generate Open Graph images: the site-wide card plus one card per blog post.
+
+- site:  public/og-image.png, the site icon centered on a black background
+- blog:  public/og/blog/<slug>.png with the post title, date and tags
+
+Cards are rendered in a process pool. Each card's inputs (text, logo and fonts) are hashed,
+and a card is only redrawn when that hash differs from the one recorded in
+public/og/manifest.json. src/ogImages.js maps pages to their card URLs for SEO.jsx.
+
+Usage
+  python scripts/generateOGImage.py                 # every card that changed
+  python scripts/generateOGImage.py --only blog --jobs 4
+  python scripts/generateOGImage.py --force         # redraw everything
 """
-from PIL import Image
+import argparse
+import hashlib
+import json
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+from PIL import Image, ImageDraw, ImageFont
+
 # Get script directory
 script_dir = Path(__file__).parent
 project_root = script_dir.parent
 
+sys.path.insert(0, str(project_root / 'src' / 'blogs'))
+import medium_to_markdown as m2m  # noqa: E402
+
 # Paths
-favicon_path = project_root / 'public' / 'favicon.ico'
+# 512px app icon written by generateIcons.py; small to decode, large enough for every card
+logo_path = project_root / 'public' / 'icons' / 'icon-512.png'
 output_path = project_root / 'public' / 'og-image.png'
+cards_dir = project_root / 'public' / 'og'
+manifest_path = cards_dir / 'manifest.json'
+og_module_path = project_root / 'src' / 'ogImages.js'
 
 # Open Graph standard dimensions
 OG_WIDTH = 1200
 OG_HEIGHT = 630
-FAVICON_SIZE = 400  # Size of the favicon in the center
+FAVICON_SIZE = 400  # Size of the icon in the center
+# Only pages that set og:image get a card; videos have no page of their own on the site
+CARD_KINDS = ('site', 'blog')
+
+# Per-page card layout; bump CARD_VERSION whenever the drawing code changes
+CARD_VERSION = 1
+MARGIN = 72
+LOGO_SIZE = 96
+ACCENT = (59, 0, 102)  # theme-color #3B0066
+TEXT = (255, 255, 255)
+MUTED = (160, 160, 160)
+CHIP_FILL = (28, 28, 28)
+CHIP_OUTLINE = (70, 70, 70)
+TITLE_SIZES = (76, 64, 54, 46)  # tried in order until the title fits in TITLE_MAX_LINES
+TITLE_MAX_LINES = 4
+SITE_LABEL = 'gmongaras.me'
+FONT_CANDIDATES = {
+    'bold': ('DejaVuSans-Bold.ttf', 'Arial Bold.ttf', 'arialbd.ttf', 'Helvetica-Bold.ttf'),
+    'regular': ('DejaVuSans.ttf', 'Arial.ttf', 'arial.ttf', 'Helvetica.ttf'),
+}
+DEFAULT_JOBS = os.cpu_count() or 1
+
+
+# ------------------------------
+# Site card
+# ------------------------------
+
+def load_logo(size):
+    """The site icon as RGBA, shrunk to fit `size` x `size`."""
+    favicon = Image.open(logo_path)
+    # Convert to RGBA if needed (for transparency support)
+    if favicon.mode != 'RGBA':
+        favicon = favicon.convert('RGBA')
+    # Resize favicon while maintaining aspect ratio
+    favicon.thumbnail((size, size), Image.Resampling.LANCZOS)
+    return favicon
+
+
+def render_site_card(favicon):
+    # Calculate position to center the favicon
+    x = (OG_WIDTH - favicon.width) // 2
+    y = (OG_HEIGHT - favicon.height) // 2
+    # Black background; the favicon is its own mask to preserve transparency
+    og_image = Image.new('RGB', (OG_WIDTH, OG_HEIGHT), color='black')
+    og_image.paste(favicon, (x, y), favicon)
+    return og_image
+
+
+# ------------------------------
+# Per-page cards
+# ------------------------------
+
+def resolve_font(style):
+    """Path (or name) of the first available font for `style`; None means Pillow's built-in."""
+    for name in FONT_CANDIDATES[style]:
+        try:
+            ImageFont.truetype(name, 12)
+            return name
+        except OSError:
+            continue
+    return None
+
+
+def _font(name, size):
+    return ImageFont.truetype(name, size) if name else ImageFont.load_default(size)
+
+
+def wrap_text(draw, text, font, width):
+    lines, line = [], ''
+    for word in text.split():
+        candidate = f'{line} {word}'.strip()
+        if not line or draw.textlength(candidate, font=font) <= width:
+            line = candidate
+        else:
+            lines.append(line)
+            line = word
+    if line:
+        lines.append(line)
+    return lines
+
+
+def fit_title(draw, title, font_name, width):
+    """Largest title size that fits; the smallest size is truncated with an ellipsis."""
+    for size in TITLE_SIZES:
+        font = _font(font_name, size)
+        lines = wrap_text(draw, title, font, width)
+        if len(lines) <= TITLE_MAX_LINES:
+            return font, lines
+    lines = lines[:TITLE_MAX_LINES]
+    while lines[-1] and draw.textlength(lines[-1] + '…', font=font) > width:
+        lines[-1] = lines[-1].rsplit(' ', 1)[0] if ' ' in lines[-1] else lines[-1][:-1]
+    lines[-1] += '…'
+    return font, lines
+
+
+def render_card(card, logo, fonts):
+    image = Image.new('RGB', (OG_WIDTH, OG_HEIGHT), color='black')
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((0, 0, 12, OG_HEIGHT), fill=ACCENT)
+    image.paste(logo, (MARGIN, MARGIN), logo)
+
+    label_font = _font(fonts['regular'], 30)
+    draw.text((MARGIN + LOGO_SIZE + 24, MARGIN + LOGO_SIZE // 2), card['label'], font=label_font, fill=MUTED, anchor='lm')
+
+    # Title block, vertically centered in the space between the header and the footer
+    title_font, lines = fit_title(draw, card['title'], fonts['bold'], OG_WIDTH - 2 * MARGIN)
+    line_height = int(title_font.size * 1.2)
+    top = MARGIN + LOGO_SIZE + 40
+    bottom = OG_HEIGHT - MARGIN - 70
+    y = top + max(0, (bottom - top - line_height * len(lines)) // 2)
+    for line in lines:
+        draw.text((MARGIN, y), line, font=title_font, fill=TEXT)
+        y += line_height
+
+    # Footer: date, chips, site name
+    meta_font = _font(fonts['regular'], 28)
+    x, footer_y = MARGIN, OG_HEIGHT - MARGIN - 22
+    if card.get('date'):
+        draw.text((x, footer_y), card['date'], font=meta_font, fill=MUTED, anchor='lm')
+        x += int(draw.textlength(card['date'], font=meta_font)) + 28
+    chip_font = _font(fonts['regular'], 24)
+    site_width = int(draw.textlength(SITE_LABEL, font=meta_font))
+    for chip in card.get('chips', []):
+        width = int(draw.textlength(chip, font=chip_font)) + 32
+        if x + width > OG_WIDTH - MARGIN - site_width - 24:
+            break
+        draw.rounded_rectangle((x, footer_y - 22, x + width, footer_y + 22), radius=22, fill=CHIP_FILL, outline=CHIP_OUTLINE, width=2)
+        draw.text((x + 16, footer_y), chip, font=chip_font, fill=TEXT, anchor='lm')
+        x += width + 12
+    draw.text((OG_WIDTH - MARGIN, footer_y), SITE_LABEL, font=meta_font, fill=MUTED, anchor='rm')
+    # Flat colours and text compress far better as a palette PNG
+    return image.quantize(colors=64, method=Image.Quantize.MEDIANCUT)
+
+
+def collect_cards(kinds=CARD_KINDS):
+    """key -> card spec; keys double as the output path under public/og/."""
+    cards = {}
+    if 'site' in kinds:
+        cards['site'] = {'kind': 'site'}
+    if 'blog' in kinds:
+        posts_dir = project_root / 'src' / 'blogs'
+        for post in m2m.read_post_manifest(posts_dir):
+            cards[f"blog/{post['slug']}"] = {
+                'kind': 'blog', 'label': 'Blog', 'title': post['title'],
+                'date': post['date'], 'chips': post['tags'],
+            }
+    return cards
 
-def generate_og_image():
+
+def card_path(key):
+    return output_path if key == 'site' else cards_dir / f'{key}.png'
+
+
+def card_url(key):
+    return '/' + card_path(key).relative_to(project_root / 'public').as_posix()
+
+
+def input_hash(card, logo_digest, fonts):
+    payload = json.dumps([CARD_VERSION, card, logo_digest, fonts, OG_WIDTH, OG_HEIGHT], sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+# Worker state: the icon is decoded once per process, not once per card
+_worker = {}
+
+
+def _init_worker(fonts):
+    _worker['fonts'] = fonts
+    _worker['logo'] = load_logo(LOGO_SIZE)
+    _worker['site_logo'] = load_logo(FAVICON_SIZE)
+
+
+def _render_one(key, card):
+    """Process-pool worker: draw one card and write it atomically."""
+    if card['kind'] == 'site':
+        image = render_site_card(_worker['site_logo'])
+    else:
+        image = render_card(card, _worker['logo'], _worker['fonts'])
+    path = card_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix('.tmp.png')
+    image.save(tmp, 'PNG', optimize=True)
+    os.replace(tmp, path)
+    return key
+
+
+def load_manifest():
     try:
-        # Check if favicon exists
-        if not favicon_path.exists():
-            raise FileNotFoundError(f'Favicon not found at {favicon_path}')
-
-        # Load and resize the favicon
-        favicon = Image.open(favicon_path)
-        
-        # Convert to RGBA if needed (for transparency support)
-        if favicon.mode != 'RGBA':
-            favicon = favicon.convert('RGBA')
-        
-        # Resize favicon while maintaining aspect ratio
-        favicon.thumbnail((FAVICON_SIZE, FAVICON_SIZE), Image.Resampling.LANCZOS)
-        
-        # Get favicon dimensions after resize
-        favicon_width, favicon_height = favicon.size
-        
-        # Calculate position to center the favicon
-        x = (OG_WIDTH - favicon_width) // 2
-        y = (OG_HEIGHT - favicon_height) // 2
-        
-        # Create the OG image: black background
-        og_image = Image.new('RGB', (OG_WIDTH, OG_HEIGHT), color='black')
-        
-        # Paste the favicon onto the black background
-        # Use the favicon as a mask to preserve transparency
-        og_image.paste(favicon, (x, y), favicon if favicon.mode == 'RGBA' else None)
-        
-        # Save the image
-        og_image.save(output_path, 'PNG')
-        
-        print(f'✅ Open Graph image generated successfully at {output_path}')
-        print(f'   Dimensions: {OG_WIDTH}x{OG_HEIGHT}px')
-        print(f'   Favicon size: {favicon_width}x{favicon_height}px (centered)')
-        
+        return json.loads(manifest_path.read_text(encoding='utf-8'))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def write_og_module(manifest):
+    """src/ogImages.js: card URLs for the pages SEO.jsx renders (blog posts)."""
+    lines = [
+        '// This file is automatically generated by scripts/generateOGImage.py',
+        '// Do not edit manually - it will be overwritten',
+        '',
+        'export const ogImages = {',
+        *(f'  {json.dumps(key)}: {json.dumps(f"{card_url(key)}?v={digest[:10]}")},'
+          for key, digest in sorted(manifest.items()) if key.startswith('blog/')),
+        '}',
+        '',
+    ]
+    content = '\n'.join(lines)
+    if not og_module_path.exists() or og_module_path.read_text(encoding='utf-8') != content:
+        og_module_path.write_text(content, encoding='utf-8')
+
+
+def generate_cards(kinds=CARD_KINDS, jobs=DEFAULT_JOBS, force=False):
+    """Render every card whose input hash changed. Returns (rendered, skipped, failed) key lists."""
+    if not logo_path.exists():
+        raise FileNotFoundError(f'Site icon not found at {logo_path} (run scripts/generateIcons.py)')
+    fonts = {style: resolve_font(style) for style in FONT_CANDIDATES}
+    logo_digest = hashlib.sha256(logo_path.read_bytes()).hexdigest()
+
+    cards = collect_cards(kinds)
+    manifest = load_manifest()
+    hashes = {key: input_hash(card, logo_digest, fonts) for key, card in cards.items()}
+    todo = [key for key in cards
+            if force or manifest.get(key) != hashes[key] or not card_path(key).exists()]
+    skipped = [key for key in cards if key not in todo]
+
+    rendered, failed = [], []
+    if todo:
+        with ProcessPoolExecutor(max_workers=max(1, min(jobs, len(todo))),
+                                 initializer=_init_worker, initargs=(fonts,)) as pool:
+            futures = {pool.submit(_render_one, key, cards[key]): key for key in todo}
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    future.result()
+                    manifest[key] = hashes[key]
+                    rendered.append(key)
+                except Exception as error:
+                    print(f'❌ {key}: {error}')
+                    failed.append(key)
+
+    # Drop cards whose post no longer exists (only within the kinds we rebuilt)
+    for key in [k for k in manifest if k.split('/', 1)[0] in kinds and k not in cards]:
+        card_path(key).unlink(missing_ok=True)
+        del manifest[key]
+
+    cards_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps(dict(sorted(manifest.items())), indent=2) + '\n', encoding='utf-8')
+    write_og_module(manifest)
+    return rendered, skipped, failed
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Generate Open Graph cards for the site and blog posts')
+    ap.add_argument('--only', choices=CARD_KINDS, action='append', help='Card kinds to build (repeatable; default: all)')
+    ap.add_argument('--jobs', type=int, default=DEFAULT_JOBS, help=f'Render processes (default: {DEFAULT_JOBS})')
+    ap.add_argument('--force', action='store_true', help='Redraw every card, ignoring the input hashes')
+    args = ap.parse_args(argv)
+
+    try:
+        rendered, skipped, failed = generate_cards(tuple(args.only or CARD_KINDS), args.jobs, args.force)
     except Exception as error:
-        print(f'❌ Error generating OG image: {error}')
-        import sys
-        sys.exit(1)
+        print(f'❌ Error generating OG images: {error}')
+        return 1
+    print(f'✅ Rendered {len(rendered)} cards, {len(skipped)} unchanged, {len(failed)} failed')
+    return 1 if failed else 0
 
-if __name__ == '__main__':
-    generate_og_image()
 
+if __name__ == '__main__':
+    sys.exit(main())
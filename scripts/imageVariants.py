@@ -0,0 +1,104 @@
+# Responsive image variants: one decode per source, resized to each width and encoded as
+# WebP/AVIF next to it. Shared by scripts/optimizeImages.py (project and profile images) and
+# src/blogs/medium_to_markdown.py --transcode (imported blog images).
+#
+# Pillow is optional at import time; available_formats() returns nothing without it.
+
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+try:
+    from PIL import Image, features as pil_features
+except ImportError:  # pragma: no cover - optional dependency import guard
+    Image = None
+    pil_features = None
+
+# Output format name -> Pillow encoder
+TRANSCODE_FORMATS = {'webp': 'WEBP', 'avif': 'AVIF'}
+DEFAULT_QUALITY = 80
+DEFAULT_JOBS = os.cpu_count() or 1
+
+
+def run_pool(fn, items, jobs, *args):
+    """Map fn(item, *args) over items on a process pool (inline when jobs <= 1); failures are warned and dropped."""
+    results = {}
+    if jobs > 1 and len(items) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {pool.submit(fn, item, *args): item for item in items}
+            for fut in as_completed(futures):
+                try:
+                    results[futures[fut]] = fut.result()
+                except Exception as e:
+                    sys.stderr.write(f"Warning: could not process {futures[fut]}: {e}\n")
+    else:
+        for item in items:
+            try:
+                results[item] = fn(item, *args)
+            except Exception as e:
+                sys.stderr.write(f"Warning: could not process {item}: {e}\n")
+    return results
+
+
+def save_atomic(im, out_path, fmt, **params):
+    out_path = Path(out_path)
+    fd, tmp = tempfile.mkstemp(dir=out_path.parent, prefix='.tmp-')
+    os.close(fd)
+    try:
+        im.save(tmp, fmt, **params)
+        os.replace(tmp, out_path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def variant_name(path, width, fmt):
+    """`fig.png` -> `fig-png-480.webp`; the source extension keeps `a.png` and `a.jpg` apart."""
+    path = Path(path)
+    ext = path.suffix.lstrip('.').lower()
+    return f"{path.stem}-{ext}-{width}.{fmt}" if ext else f"{path.stem}-{width}.{fmt}"
+
+
+def encode_variants(src, formats, widths, quality=DEFAULT_QUALITY):
+    """Process-pool worker: decode one image once and write `<stem>-<ext>-<width>.<fmt>` for every target.
+
+    Returns {'width', 'height', 'variants': {fmt: [(name, width), ...]}} with widths ascending.
+    Widths larger than the source are clamped to the source width (never upscaled).
+    Animated images are left alone ({'skipped': 'animated'}).
+    """
+    path = Path(src)
+    with Image.open(path) as im:
+        if getattr(im, 'is_animated', False):
+            return {'skipped': 'animated'}
+        im.load()
+        if im.mode not in ('RGB', 'RGBA'):
+            has_alpha = 'A' in im.getbands() or 'transparency' in im.info
+            im = im.convert('RGBA' if has_alpha else 'RGB')
+        width, height = im.size
+        variants = {fmt: [] for fmt in formats}
+        for w in sorted({min(w, width) for w in widths}):
+            frame = im if w == width else im.resize((w, max(1, round(height * w / width))), Image.Resampling.LANCZOS)
+            for fmt in formats:
+                name = variant_name(path, w, fmt)
+                save_atomic(frame, path.with_name(name), TRANSCODE_FORMATS[fmt], quality=quality)
+                variants[fmt].append((name, w))
+    return {'width': width, 'height': height, 'variants': variants}
+
+
+def available_formats(formats):
+    """Drop formats this Pillow build cannot encode (AVIF needs Pillow >= 11.2 with libavif)."""
+    if Image is None:
+        return ()
+    keep = []
+    for fmt in formats:
+        try:
+            ok = fmt in TRANSCODE_FORMATS and pil_features.check(fmt)
+        except Exception:
+            ok = False
+        if ok:
+            keep.append(fmt)
+        else:
+            sys.stderr.write(f"Warning: Pillow cannot encode {fmt}; skipping it\n")
+    return tuple(keep)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Responsive AVIF/WebP variants for the images referenced by src/projects.js and src/data.js.
+
+Every "/path.ext" image string in those modules is resized to the widths its cards are
+displayed at (1x and 2x) and written next to the original as <stem>-<ext>-<width>.<fmt> by
+scripts/imageVariants.py (the encoder the blog transcoder also uses). Images are encoded in
+a process pool.
+
+src/imageVariants.js maps each original URL to its size and srcset per format; the
+frontend renders <picture> sources from it and keeps the original as the fallback.
+Each entry records the source's content hash, so unchanged images are skipped and a
+re-run does no image work at all.
+
+Usage
+  python scripts/optimizeImages.py
+  python scripts/optimizeImages.py --jobs 4 --formats webp
+  python scripts/optimizeImages.py --force
+"""
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+import imageVariants
+
+script_dir = Path(__file__).parent
+project_root = script_dir.parent
+public_dir = project_root / 'public'
+module_path = project_root / 'src' / 'imageVariants.js'
+
+# Data module -> widths its images are displayed at (CSS px at 1x, plus 2x screens)
+SOURCES = {
+    'src/projects.js': (320, 640),   # project cards: w-80 image box
+    'src/data.js': (320, 480, 640, 960),  # profile photo: 20rem, wider on large screens
+}
+FORMATS = ('avif', 'webp')
+QUALITY = imageVariants.DEFAULT_QUALITY
+HASH_LEN = 16
+CHUNK_SIZE = 1 << 20
+
+IMAGE_REF_RE = re.compile(r'"(/[^"\s]+\.(?:png|jpe?g|webp|gif))"', re.I)
+ENTRY_RE = re.compile(r'^  ("[^"]+"): (\{.*\}),?$', re.M)
+
+
+def collect_references(sources=SOURCES):
+    """Image URL -> widths, merged across every module that references it."""
+    refs = {}
+    for module, widths in sources.items():
+        text = (project_root / module).read_text(encoding='utf-8')
+        for url in IMAGE_REF_RE.findall(text):
+            refs[url] = tuple(sorted({*refs.get(url, ()), *widths}))
+    return refs
+
+
+def source_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:HASH_LEN]
+
+
+def load_entries():
+    try:
+        text = module_path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return {}
+    return {json.loads(url): json.loads(entry) for url, entry in ENTRY_RE.findall(text)}
+
+
+def variant_files(url, entry):
+    """Public paths of every variant an entry points at."""
+    files = []
+    for srcset in (entry.get('srcset') or {}).values():
+        for candidate in srcset.split(','):
+            files.append(public_dir / candidate.split()[0].lstrip('/'))
+    return files
+
+
+def up_to_date(url, entry, digest, widths, formats):
+    if entry is None or entry.get('hash') != digest or entry.get('widths') != list(widths):
+        return False
+    # Animated images have no srcset; everything else must have every requested format
+    srcset = entry.get('srcset')
+    if srcset is not None and sorted(srcset) != sorted(formats):
+        return False
+    return all(path.exists() for path in variant_files(url, entry))
+
+
+def write_module(entries):
+    lines = [
+        '// This file is automatically generated by scripts/optimizeImages.py',
+        '// Do not edit manually - it will be overwritten',
+        '',
+        'export const imageVariants = {',
+        *(f'  {json.dumps(url)}: {json.dumps(entries[url], ensure_ascii=False)},' for url in sorted(entries)),
+        '}',
+        '',
+    ]
+    content = '\n'.join(lines)
+    if not module_path.exists() or module_path.read_text(encoding='utf-8') != content:
+        module_path.write_text(content, encoding='utf-8')
+        return True
+    return False
+
+
+def optimize_images(formats=FORMATS, jobs=imageVariants.DEFAULT_JOBS, quality=QUALITY, force=False):
+    """Encode every referenced image whose source changed. Returns (encoded, skipped, missing) URL lists."""
+    formats = imageVariants.available_formats(tuple(formats))
+    previous = load_entries()
+    refs = collect_references()
+
+    entries, todo, skipped, missing = {}, {}, [], []
+    for url, widths in refs.items():
+        path = public_dir / url.lstrip('/')
+        if not path.exists():
+            missing.append(url)
+            continue
+        digest = source_hash(path)
+        if not force and up_to_date(url, previous.get(url), digest, widths, formats):
+            entries[url] = previous[url]
+            skipped.append(url)
+        else:
+            todo.setdefault(widths, []).append((url, path, digest))
+
+    encoded = []
+    for widths, items in todo.items():
+        results = imageVariants.run_pool(imageVariants.encode_variants, [str(path) for _, path, _ in items], jobs, formats, widths, quality)
+        for url, path, digest in items:
+            info = results.get(str(path))
+            if info is None:
+                continue
+            folder = url.rsplit('/', 1)[0]
+            entry = {'hash': digest, 'widths': list(widths)}
+            if 'variants' in info:
+                entry.update(width=info['width'], height=info['height'], srcset={
+                    fmt: ', '.join(f'{folder}/{name} {w}w' for name, w in variants)
+                    for fmt, variants in info['variants'].items()
+                })
+            # Animated GIFs are left as they are (no srcset); the original is served
+            old = previous.get(url)
+            if old is not None:
+                for stale in set(variant_files(url, old)) - set(variant_files(url, entry)):
+                    stale.unlink(missing_ok=True)
+            entries[url] = entry
+            encoded.append(url)
+
+    # Variants of images no longer referenced anywhere
+    for url in set(previous) - set(entries):
+        for stale in variant_files(url, previous[url]):
+            stale.unlink(missing_ok=True)
+
+    write_module(entries)
+    return encoded, skipped, missing
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Generate responsive AVIF/WebP variants for project and profile images')
+    ap.add_argument('--formats', default=','.join(FORMATS), help=f"Comma-separated formats (default: {','.join(FORMATS)})")
+    ap.add_argument('--jobs', type=int, default=imageVariants.DEFAULT_JOBS, help=f'Encoder processes (default: {imageVariants.DEFAULT_JOBS})')
+    ap.add_argument('--quality', type=int, default=QUALITY, help=f'Encoder quality 0-100 (default: {QUALITY})')
+    ap.add_argument('--force', action='store_true', help='Re-encode every image, ignoring the source hashes')
+    args = ap.parse_args(argv)
+
+    formats = tuple(f.strip().lower() for f in args.formats.split(',') if f.strip())
+    encoded, skipped, missing = optimize_images(formats, args.jobs, args.quality, args.force)
+    for url in missing:
+        print(f'[SKIPPED] {url} (file not found)')
+    print(f'✅ Encoded {len(encoded)} images, {len(skipped)} unchanged')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
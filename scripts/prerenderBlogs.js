@@ -0,0 +1,119 @@
+import fs from 'fs'
+import path from 'path'
+import { fileURLToPath, pathToFileURL } from 'url'
+import katex from 'katex'
+import { contentKey, renderContent } from '../src/blogRender.js'
+
+const __filename = fileURLToPath(import.meta.url)
+const __dirname = path.dirname(__filename)
+
+const BLOGS_DIR = path.join(__dirname, '../src/blogs')
+const OUTPUT_DIR = path.join(BLOGS_DIR, 'prerendered')
+const PUBLIC_DIR = path.join(__dirname, '../public')
+const IMAGE_MANIFEST = 'images.json'
+const IMAGE_META_FIELDS = ['width', 'height', 'placeholder']
+
+// <folder>/images.json (medium_to_markdown.py --image-metadata) maps file name ->
+// { width, height, placeholder }. Copied onto image blocks so the frontend can reserve
+// the box on first paint instead of fetching the manifest after mount.
+function imageMetaLookup(publicDir = PUBLIC_DIR) {
+  const manifests = new Map()
+  const manifest = (folder) => {
+    if (!manifests.has(folder)) {
+      let entries = {}
+      try {
+        entries = JSON.parse(fs.readFileSync(path.join(publicDir, folder, IMAGE_MANIFEST), 'utf-8'))
+      } catch {
+        // No manifest (or an unreadable one): images in this folder just have no size
+      }
+      manifests.set(folder, entries)
+    }
+    return manifests.get(folder)
+  }
+  return (src) => {
+    if (!src || !src.startsWith('/')) return {}
+    const cut = src.lastIndexOf('/')
+    const entry = manifest(src.slice(0, cut))[src.slice(cut + 1)] || {}
+    return Object.fromEntries(IMAGE_META_FIELDS.filter(field => entry[field] != null).map(field => [field, entry[field]]))
+  }
+}
+
+function imageMetaChanged(blocks, lookup) {
+  return blocks.some(block => block.type === 'image' &&
+    IMAGE_META_FIELDS.some(field => block[field] !== lookup(block.src)[field]))
+}
+
+function attachImageMeta(blocks, lookup) {
+  return blocks.map(block => (block.type === 'image' ? { ...block, ...lookup(block.src) } : block))
+}
+
+// Site posts: the src/blogs/index.js manifest plus one <slug>.js body module each
+async function loadPostModules() {
+  const { posts, loadPostBody } = await import(pathToFileURL(path.join(BLOGS_DIR, 'index.js')).href)
+  return Promise.all(posts.map(async post => ({
+    slug: post.slug,
+    body: await loadPostBody(post.slug),
+    source: `${post.slug}.js`,
+  })))
+}
+
+// Markdown written by medium_to_markdown.py: optional YAML front matter, slug from the file name
+function loadMarkdownFile(file) {
+  const text = fs.readFileSync(file, 'utf-8')
+  const match = text.match(/^---\n[\s\S]*?\n---\n/)
+  return {
+    slug: path.basename(file, path.extname(file)),
+    body: match ? text.slice(match[0].length) : text,
+    source: file,
+  }
+}
+
+function prerenderPost(post, outputDir, lookup = imageMetaLookup()) {
+  const outputPath = path.join(outputDir, `${post.slug}.json`)
+  const key = contentKey(post.body)
+  if (fs.existsSync(outputPath)) {
+    try {
+      const existing = JSON.parse(fs.readFileSync(outputPath, 'utf-8'))
+      if (existing.key === key && existing.katex === katex.version && !imageMetaChanged(existing.blocks, lookup)) {
+        return false
+      }
+    } catch {
+      // Unreadable output is simply rebuilt
+    }
+  }
+  const blocks = attachImageMeta(renderContent(post.body).blocks, lookup)
+  const json = JSON.stringify({ slug: post.slug, key, katex: katex.version, blocks })
+  const tmpPath = `${outputPath}.tmp`
+  fs.writeFileSync(tmpPath, json + '\n')
+  fs.renameSync(tmpPath, outputPath)
+  return true
+}
+
+async function prerenderBlogs(markdownFiles = [], outputDir = OUTPUT_DIR) {
+  const posts = markdownFiles.length
+    ? markdownFiles.map(loadMarkdownFile)
+    : await loadPostModules()
+  fs.mkdirSync(outputDir, { recursive: true })
+
+  const lookup = imageMetaLookup()
+  let rendered = 0
+  for (const post of posts) {
+    const start = performance.now()
+    if (prerenderPost(post, outputDir, lookup)) {
+      rendered++
+      console.log(`📝 ${post.slug} (${(performance.now() - start).toFixed(0)} ms)`)
+    }
+  }
+  console.log(`✅ Prerendered ${rendered} of ${posts.length} posts into ${outputDir} (${posts.length - rendered} unchanged)`)
+  return rendered
+}
+
+// Run if called directly: node scripts/prerenderBlogs.js [post.md ...]
+if (import.meta.url === `file://${process.argv[1]}`) {
+  prerenderBlogs(process.argv.slice(2)).catch(error => {
+    console.error(`❌ ${error.message}`)
+    process.exit(1)
+  })
+}
+
+export { prerenderBlogs, prerenderPost }
@@ -0,0 +1,267 @@
+# Machine-readable store for YouTube video metadata (scripts/youtubeData.jsonl).
+#
+# One JSON object per line, keyed by videoId, holding raw values: numeric views/likes,
+# duration in seconds, the full description and when the record was last fetched.
+# src/youtubeData.js is generated from this file by GetYoutueData.py.
+# Offline self-tests: python scripts/youtubeStore.py --self-test
+
+import json
+import os
+import re
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+STORE_PATH = 'scripts/youtubeData.jsonl'
+
+FIELDS = ('videoId', 'title', 'description', 'durationSeconds', 'publishedAt', 'views', 'likes', 'fetchedAt')
+
+# Refresh TTL by video age: (videos published within this many days, refetch after this many days).
+# Recent uploads gain views quickly; years-old ones barely move.
+REFRESH_TIERS = ((7, 1), (30, 3), (365, 14))
+REFRESH_TTL_OLD_DAYS = 60
+
+# Shape of the records GetYoutueData.py used to write into src/youtubeData.js
+LEGACY_VIDEO_PATTERN = re.compile(
+    r'{\s*title:\s*"((?:[^"\\]|\\.)*)",\s*description:\s*"((?:[^"\\]|\\.)*)",\s*videoId:\s*"([^"]*)",'
+    r'\s*thumbnail:\s*"[^"]*",\s*duration:\s*"([^"]*)",\s*publishedAt:\s*"([^"]*)",'
+    r'\s*views:\s*"([^"]*)",\s*likes:\s*"([^"]*)"\s*}',
+    re.DOTALL,
+)
+
+
+def utc_now():
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+
+def _parse_time(value):
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def refresh_ttl(record, now):
+    """How long a record's stats stay fresh, based on how old the video is."""
+    published = _parse_time(record.get('publishedAt'))
+    if published is not None:
+        age_days = (now - published).days
+        for max_age_days, ttl_days in REFRESH_TIERS:
+            if age_days <= max_age_days:
+                return timedelta(days=ttl_days)
+    return timedelta(days=REFRESH_TTL_OLD_DAYS)
+
+
+def parse_count(text):
+    """Inverse of the "10.6K" / "1.2M" display format (approximate); None when unknown."""
+    match = re.fullmatch(r'([\d.]+)([KM]?)', (text or '').strip())
+    if not match:
+        return None
+    scale = {'': 1, 'K': 1_000, 'M': 1_000_000}[match.group(2)]
+    return int(round(float(match.group(1)) * scale))
+
+
+def parse_duration(text):
+    """"1:02:03" / "42:04" -> seconds; None when unknown."""
+    parts = (text or '').split(':')
+    if not all(p.isdigit() for p in parts):
+        return None
+    seconds = 0
+    for part in parts:
+        seconds = seconds * 60 + int(part)
+    return seconds
+
+
+class VideoStore:
+    """In-memory index over youtubeData.jsonl: O(1) lookups and merges by videoId."""
+
+    def __init__(self, path=STORE_PATH):
+        self.path = path
+        self.videos = {}
+
+    @classmethod
+    def load(cls, path=STORE_PATH):
+        store = cls(path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        store.videos[record['videoId']] = record
+        except FileNotFoundError:
+            pass
+        return store
+
+    def __contains__(self, video_id):
+        return video_id in self.videos
+
+    def __len__(self):
+        return len(self.videos)
+
+    def get(self, video_id):
+        return self.videos.get(video_id)
+
+    def upsert(self, record):
+        """Insert or update a record; fields missing from `record` keep their stored values."""
+        merged = {**self.videos.get(record['videoId'], {}), **record}
+        self.videos[record['videoId']] = {field: merged.get(field) for field in FIELDS}
+
+    def stale(self, video_ids, limit=None, now=None, ttl_scale=1.0):
+        """Video IDs whose stats are past their TTL, most overdue first, at most `limit`.
+
+        Never-fetched (imported) records come first. `ttl_scale` stretches or shrinks
+        every tier, e.g. 0 makes everything due for a forced full refresh.
+        """
+        now = now or datetime.now(timezone.utc)
+        due = []
+        for video_id in video_ids:
+            record = self.videos.get(video_id)
+            if record is None:
+                continue
+            fetched = _parse_time(record.get('fetchedAt'))
+            if fetched is None:
+                due.append((float('inf'), video_id))
+                continue
+            ttl = refresh_ttl(record, now) * ttl_scale
+            overdue = (now - fetched) / ttl if ttl else float('inf')
+            if overdue >= 1:
+                due.append((overdue, video_id))
+        # Stable for ties, so equally stale videos keep videos.txt order
+        due.sort(key=lambda item: -item[0])
+        return [video_id for _, video_id in due[:limit]]
+
+    def save(self):
+        """Write the store atomically, one record per line, sorted by videoId for stable diffs."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                for video_id in sorted(self.videos):
+                    f.write(json.dumps(self.videos[video_id], ensure_ascii=False) + '\n')
+            os.chmod(tmp, 0o644)  # mkstemp creates 0600
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def import_legacy_js(self, js_path):
+        """One-time bootstrap from a previously generated youtubeData.js.
+
+        Counts come back approximate and descriptions truncated, so imported records get
+        fetchedAt=None and are the first candidates for a refresh.
+        """
+        try:
+            with open(js_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except FileNotFoundError:
+            return 0
+        imported = 0
+        for title, description, video_id, duration, published, views, likes in LEGACY_VIDEO_PATTERN.findall(content):
+            if video_id in self.videos:
+                continue
+            self.upsert({
+                'videoId': video_id,
+                'title': json.loads(f'"{title}"', strict=False),
+                'description': json.loads(f'"{description}"', strict=False),
+                'durationSeconds': parse_duration(duration),
+                'publishedAt': published if published != 'Unknown' else None,
+                'views': parse_count(views),
+                'likes': parse_count(likes),
+                'fetchedAt': None,
+            })
+            imported += 1
+        return imported
+
+
+def _run_self_tests():
+    """Offline tests for the store format, the legacy youtubeData.js import and the refresh TTLs."""
+    with tempfile.TemporaryDirectory() as tmp:
+        # JSONL round trip: sorted by videoId, unicode kept, unknown fields dropped
+        path = os.path.join(tmp, 'youtubeData.jsonl')
+        store = VideoStore(path)
+        store.upsert({'videoId': 'b', 'title': 'Zweiter Ä "quoted"', 'views': 12, 'extra': 1})
+        store.upsert({'videoId': 'a', 'title': 'First', 'description': 'line 1\nline 2', 'fetchedAt': '2025-01-02T00:00:00+00:00'})
+        store.save()
+        with open(path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        assert [json.loads(line)['videoId'] for line in lines] == ['a', 'b'] and 'Ä' in lines[1]
+        loaded = VideoStore.load(path)
+        assert loaded.videos == store.videos and len(loaded) == 2 and 'a' in loaded
+        assert list(loaded.get('b')) == list(FIELDS) and loaded.get('b')['views'] == 12
+        assert loaded.get('b')['description'] is None and 'extra' not in loaded.get('b')
+
+        # upsert merges: fields missing from the update keep their stored values
+        loaded.upsert({'videoId': 'a', 'views': 5})
+        assert loaded.get('a')['title'] == 'First' and loaded.get('a')['views'] == 5
+        assert VideoStore.load(os.path.join(tmp, 'missing.jsonl')).videos == {}
+
+        # Legacy youtubeData.js import: escapes, approximate counts, unknown dates, existing records kept
+        js_path = os.path.join(tmp, 'youtubeData.js')
+        with open(js_path, 'w', encoding='utf-8') as f:
+            f.write(
+                'export const youtubeVideos = [\n'
+                '  {\n    title: "Say \\"hi\\"",\n    description: "a\\nb",\n    videoId: "new1",\n'
+                '    thumbnail: "https://img.youtube.com/vi/new1/maxresdefault.jpg",\n    duration: "1:02:03",\n'
+                '    publishedAt: "2024-05-01",\n    views: "10.6K",\n    likes: "1.2M"\n  },\n'
+                '  {\n    title: "Old",\n    description: "",\n    videoId: "a",\n    thumbnail: "",\n'
+                '    duration: "Unknown",\n    publishedAt: "Unknown",\n    views: "Unknown",\n    likes: "7"\n  }\n'
+                '];\n'
+            )
+        assert loaded.import_legacy_js(js_path) == 1
+        record = loaded.get('new1')
+        assert record['title'] == 'Say "hi"' and record['description'] == 'a\nb'
+        assert record['durationSeconds'] == 3723 and record['publishedAt'] == '2024-05-01'
+        assert record['views'] == 10_600 and record['likes'] == 1_200_000 and record['fetchedAt'] is None
+        assert loaded.get('a')['title'] == 'First'
+        assert loaded.import_legacy_js(os.path.join(tmp, 'nope.js')) == 0
+        assert parse_count('Unknown') is None and parse_duration('42:04') == 2524 and parse_duration('') is None
+
+    # refresh_ttl tier boundaries: an age of exactly N days still belongs to the N-day tier
+    now = datetime(2025, 6, 1, 12, tzinfo=timezone.utc)
+
+    def aged(days, **fields):
+        return {'publishedAt': (now - timedelta(days=days)).isoformat(), **fields}
+
+    expected = {0: 1, 7: 1, 8: 3, 30: 3, 31: 14, 365: 14, 366: REFRESH_TTL_OLD_DAYS}
+    for days, ttl_days in expected.items():
+        assert refresh_ttl(aged(days), now) == timedelta(days=ttl_days), days
+    assert refresh_ttl({'publishedAt': None}, now) == timedelta(days=REFRESH_TTL_OLD_DAYS)
+    assert refresh_ttl({'publishedAt': '2025-05-30'}, now) == timedelta(days=1)  # naive dates are UTC
+
+    # stale(): never-fetched first, then by how many TTLs overdue; fresh and unknown IDs left out
+    store = VideoStore()
+    fetched = lambda days: (now - timedelta(days=days)).isoformat()
+    records = {
+        'fresh': aged(3, fetchedAt=fetched(0.5)),         # 0.5 of a 1-day TTL
+        'new-2x': aged(3, fetchedAt=fetched(2)),          # 2 TTLs overdue
+        'mid-1x': aged(20, fetchedAt=fetched(3)),         # exactly due (3-day TTL)
+        'old-3x': aged(1000, fetchedAt=fetched(180)),     # 3 TTLs overdue
+        'imported': aged(1000, fetchedAt=None),
+        'old-fresh': aged(1000, fetchedAt=fetched(59)),
+    }
+    for video_id, record in records.items():
+        store.upsert({'videoId': video_id, **record})
+    order = ['fresh', 'mid-1x', 'old-3x', 'new-2x', 'missing', 'imported', 'old-fresh']
+    assert store.stale(order, now=now) == ['imported', 'old-3x', 'new-2x', 'mid-1x']
+    assert store.stale(order, limit=2, now=now) == ['imported', 'old-3x']
+    # Ties keep the caller's (videos.txt) order
+    store.upsert({'videoId': 'old-3x-b', **records['old-3x']})
+    assert store.stale(['old-3x-b', 'old-3x'], now=now) == ['old-3x-b', 'old-3x']
+    # ttl_scale stretches every tier; 0 makes everything due (--refresh-all)
+    assert store.stale(order, now=now, ttl_scale=2) == ['imported', 'old-3x', 'new-2x']
+    assert set(store.stale(order, now=now, ttl_scale=0)) == set(records)
+
+    print("All self tests passed.")
+    return 0
+
+
+if __name__ == '__main__':
+    import argparse
+    import sys
+
+    ap = argparse.ArgumentParser(description='YouTube metadata store (scripts/youtubeData.jsonl)')
+    ap.add_argument('--self-test', action='store_true', help='Run built-in tests and exit')
+    if not ap.parse_args().self_test:
+        ap.print_help()
+        sys.exit(0)
+    sys.exit(_run_self_tests())
@@ -0,0 +1,190 @@
+# Local thumbnail cache for the YouTube cards.
+#
+# Each video's thumbnail is downloaded once, resized to the card's display widths and
+# encoded as WebP under public/youtube/thumbs/<videoId>-<width>.webp. The originals are
+# kept in .youtube_cache/ (not committed) so new widths can be added without refetching.
+#
+# requests and Pillow are imported only when thumbnails are actually fetched, so
+# GetYoutueData.py --no-thumbnails runs without them.
+#
+# Offline self-tests (local stand-in image server): python scripts/youtubeThumbnails.py --self-test
+
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+THUMBS_DIR = 'public/youtube/thumbs'
+CACHE_DIR = '.youtube_cache/thumbnails'
+THUMBNAIL_BASE = 'https://img.youtube.com/vi'
+# maxresdefault is missing for some (older/low-res) uploads; hqdefault always exists
+SOURCE_NAMES = ('maxresdefault.jpg', 'hqdefault.jpg')
+# Cards are w-80 (320px) with a 16:9 crop; 640 covers 2x screens
+WIDTHS = (320, 640)
+ASPECT = (16, 9)
+QUALITY = 75
+
+def variant_path(video_id, width, thumbs_dir=THUMBS_DIR):
+    return os.path.join(thumbs_dir, f"{video_id}-{width}.webp")
+
+def local_thumbnail(video_id, thumbs_dir=THUMBS_DIR):
+    """Public URL of the largest local variant, or None if the video has not been cached yet"""
+    if all(os.path.exists(variant_path(video_id, w, thumbs_dir)) for w in WIDTHS):
+        return f"/{os.path.relpath(thumbs_dir, 'public')}/{video_id}-{max(WIDTHS)}.webp"
+    return None
+
+def _download_source(session, video_id, base_url, cache_dir, timeout):
+    cached = os.path.join(cache_dir, f"{video_id}.jpg")
+    if os.path.exists(cached):
+        with open(cached, 'rb') as f:
+            return f.read()
+    for name in SOURCE_NAMES:
+        resp = session.get(f"{base_url}/{video_id}/{name}", timeout=timeout)
+        if resp.status_code == 404:
+            continue
+        resp.raise_for_status()
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = cached + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(resp.content)
+        os.replace(tmp, cached)
+        return resp.content
+    raise FileNotFoundError(f"no thumbnail for {video_id}")
+
+def _encode_variants(data, video_id, thumbs_dir):
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as im:
+        im = im.convert('RGB')
+        # Center-crop to 16:9 (hqdefault is 4:3 with letterbox bars)
+        w, h = im.size
+        target_h = min(h, w * ASPECT[1] // ASPECT[0])
+        target_w = min(w, target_h * ASPECT[0] // ASPECT[1])
+        left, top = (w - target_w) // 2, (h - target_h) // 2
+        im = im.crop((left, top, left + target_w, top + target_h))
+        for width in WIDTHS:
+            size = (min(width, im.width), round(min(width, im.width) * ASPECT[1] / ASPECT[0]))
+            out = variant_path(video_id, width, thumbs_dir)
+            tmp = out + '.tmp'
+            im.resize(size, Image.Resampling.LANCZOS).save(tmp, 'WEBP', quality=QUALITY, method=6)
+            os.replace(tmp, out)
+
+def cache_thumbnails(video_ids, base_url=THUMBNAIL_BASE, workers=8, timeout=30,
+                     thumbs_dir=THUMBS_DIR, cache_dir=CACHE_DIR):
+    """Download and encode thumbnails for videos that have no local variants yet.
+
+    Returns (cached, failed) lists of video IDs. Videos already cached are skipped
+    without any network access.
+    """
+    todo = [video_id for video_id in video_ids if local_thumbnail(video_id, thumbs_dir) is None]
+    if not todo:
+        return [], []
+    import requests
+
+    os.makedirs(thumbs_dir, exist_ok=True)
+    cached, failed = [], []
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        def work(video_id):
+            _encode_variants(_download_source(session, video_id, base_url, cache_dir, timeout), video_id, thumbs_dir)
+        futures = {pool.submit(work, video_id): video_id for video_id in todo}
+        for future in as_completed(futures):
+            video_id = futures[future]
+            try:
+                future.result()
+                cached.append(video_id)
+            except Exception as e:
+                print(f"[FAILED] Thumbnail for {video_id}: {e}")
+                failed.append(video_id)
+    return cached, failed
+
+def _run_self_tests():
+    """Offline tests against a local stand-in for img.youtube.com (needs Pillow)."""
+    import tempfile
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from PIL import Image
+
+    def jpeg(size, bars=0):
+        im = Image.new('RGB', size, (200, 0, 0))
+        if bars:  # hqdefault-style letterbox: black bars above and below a 16:9 picture
+            im.paste((0, 0, 0), (0, 0, size[0], bars))
+            im.paste((0, 0, 0), (0, size[1] - bars, size[0], size[1]))
+        buf = io.BytesIO()
+        im.save(buf, 'JPEG', quality=95)
+        return buf.getvalue()
+
+    files = {
+        '/vi/hires/maxresdefault.jpg': jpeg((1280, 720)),
+        '/vi/lores/hqdefault.jpg': jpeg((480, 360), bars=45),  # no maxresdefault: 404 first
+    }
+    requested = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requested.append(self.path)
+            body = files.get(self.path)
+            self.send_response(200 if body else 404)
+            self.send_header('Content-Length', str(len(body or b'')))
+            self.end_headers()
+            self.wfile.write(body or b'')
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/vi"
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            thumbs_dir, cache_dir = os.path.join(tmp, 'thumbs'), os.path.join(tmp, 'cache')
+            run = lambda ids: cache_thumbnails(ids, base_url, workers=2, timeout=5, thumbs_dir=thumbs_dir, cache_dir=cache_dir)
+
+            cached, failed = run(['hires', 'lores', 'gone'])
+            assert sorted(cached) == ['hires', 'lores'] and failed == ['gone']
+            assert sorted(requested) == sorted([
+                '/vi/hires/maxresdefault.jpg',
+                '/vi/lores/maxresdefault.jpg', '/vi/lores/hqdefault.jpg',
+                '/vi/gone/maxresdefault.jpg', '/vi/gone/hqdefault.jpg',
+            ]), requested
+
+            # 16:9 at both widths; the 4:3 fallback is cropped to 16:9 and never upscaled
+            sizes = {}
+            for video_id in ('hires', 'lores'):
+                for width in WIDTHS:
+                    with Image.open(variant_path(video_id, width, thumbs_dir)) as im:
+                        assert im.format == 'WEBP'
+                        sizes[video_id, width] = im.size
+                        if video_id == 'lores':
+                            # The letterbox bars are cropped away: the edges are the picture's red
+                            r, g, b = im.convert('RGB').getpixel((im.width // 2, 0))
+                            assert r > 150 and g < 60, (r, g, b)
+            assert sizes == {('hires', 320): (320, 180), ('hires', 640): (640, 360),
+                             ('lores', 320): (320, 180), ('lores', 640): (480, 270)}, sizes
+            assert local_thumbnail('hires', thumbs_dir) and local_thumbnail('gone', thumbs_dir) is None
+
+            # Second run: cached videos make no requests (only the missing one is retried)
+            requested.clear()
+            cached, failed = run(['hires', 'lores'])
+            assert (cached, failed, requested) == ([], [], [])
+
+            # A lost variant is re-encoded from the cached original, still without a request
+            os.remove(variant_path('hires', 320, thumbs_dir))
+            cached, failed = run(['hires'])
+            assert (cached, failed, requested) == (['hires'], [], [])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print("All self tests passed.")
+    return 0
+
+
+if __name__ == '__main__':
+    import argparse
+    import sys
+
+    ap = argparse.ArgumentParser(description='Local WebP thumbnail cache for the YouTube cards')
+    ap.add_argument('--self-test', action='store_true', help='Run built-in tests against a local image server and exit')
+    if not ap.parse_args().self_test:
+        ap.print_help()
+        sys.exit(0)
+    sys.exit(_run_self_tests())
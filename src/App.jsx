@@ -3,14 +3,15 @@ import { createPortal } from "react-dom"
 import { Menu, X, Mail, ExternalLink, FileText, GraduationCap, Briefcase, BookOpen, Cpu, Phone, BookAudio, ChevronLeft, ChevronRight, ChevronDown } from "lucide-react"
 import { FaXTwitter, FaLinkedin, FaYoutube, FaGithub } from "react-icons/fa6"
 import { SiHuggingface } from "react-icons/si"
-import { profile, education, skills, experience, publications, articles, youtubeVideos, NeedleInAHaystackNote } from "./data"
+import { profile, education, skills, experience, publications, articles, youtubeVideos, youtubePages, NeedleInAHaystackNote } from "./data"
 import { projects } from "./projects"
-import { posts } from "./blogs"
+import { posts, loadPostBody } from "./blogs"
 import GraphBackground from "./GraphBackground"
 import SEO from "./components/SEO"
+import { ogImages } from "./ogImages"
+import { imageVariants } from "./imageVariants"
 import { motion, AnimatePresence } from "framer-motion"
-import 'katex/dist/katex.min.css'
-import katex from 'katex'
+import { contentKey } from "./blogContentKey"
 
 
 const TypingAnimation = () => {
@@ -478,8 +479,10 @@ const Header = ({ onMobileMenuToggle }) => {
         {/* Brand */}
         <a href="/" className="flex items-center gap-2 tracking-wide hover:opacity-90">
           <img
-            src="/favicon.ico"
+            src="/icons/icon-192.webp"
             alt="Icon"
+            width={64}
+            height={64}
             loading="eager"
             className="h-10 w-10 md:h-16 md:w-16 rounded-md object-cover shadow-sm"
           />
@@ -776,13 +779,20 @@ const ProfilePhoto = () => (
       style={{ background: 'var(--gradient-pfp)' }}
       aria-hidden
     />
-    <img
-      src="/me.jpg"
-      alt="Portrait of Gabriel Mongaras"
-      loading="eager"
-      decoding="async"
-      className="relative w-full aspect-square object-cover rounded-2xl ring-1 ring-white/10 shadow-2xl"
-    />
+    <picture>
+      {imageSources(profile.photo).map(({ type, srcSet }) => (
+        <source key={type} type={type} srcSet={srcSet} sizes="(min-width: 1024px) 480px, 320px" />
+      ))}
+      <img
+        src={profile.photo}
+        alt="Portrait of Gabriel Mongaras"
+        width={imageVariants[profile.photo]?.width}
+        height={imageVariants[profile.photo]?.height}
+        loading="eager"
+        decoding="async"
+        className="relative w-full aspect-square object-cover rounded-2xl ring-1 ring-white/10 shadow-2xl"
+      />
+    </picture>
   </div>
 )
 
@@ -1152,6 +1162,8 @@ const Projects = () => {
                     <div className="w-full h-48 rounded-lg overflow-hidden bg-gradient-to-br from-white/5 to-white/2 flex items-center justify-center">
                       <LazyImage
                         src={p.image}
+                        sources={imageSources(p.image)}
+                        sizes="320px"
                         alt={p.name}
                         className="max-w-full max-h-full object-contain transition-transform duration-300 ease-out group-hover:scale-105"
                         onError={() => handleImageError(idx)}
@@ -1212,251 +1224,6 @@ const Publications = () => (
   </section>
 )
 
-// Token types for the parser
-const TOKEN_TYPES = {
-  HEADER_1: 'HEADER_1',
-  HEADER_2: 'HEADER_2', 
-  HEADER_3: 'HEADER_3',
-  LATEX_BLOCK: 'LATEX_BLOCK',
-  LATEX_INLINE: 'LATEX_INLINE',
-  ORDERED_LIST: 'ORDERED_LIST',
-  UNORDERED_LIST: 'UNORDERED_LIST',
-  IMAGE: 'IMAGE',
-  CODE_BLOCK: 'CODE_BLOCK',
-  YOUTUBE: 'YOUTUBE',
-  TEXT: 'TEXT'
-}
-
-// Tokenizer - converts markdown text into structured tokens
-const tokenizeContent = (text) => {
-  const tokens = []
-  const lines = text.split(/(?<!\\)\n/)
-  let i = 0
-
-  while (i < lines.length) {
-    const line = lines[i]
-    
-    // Headers
-    if (line.match(/^###\s+(.+)/)) {
-      tokens.push({ type: TOKEN_TYPES.HEADER_3, content: line.replace(/^###\s+/, '') })
-      // Skip any empty lines immediately after the header
-      i++
-      while (i < lines.length && !lines[i].trim()) {
-        i++
-      }
-      i-- // Back up one since we'll increment at end of loop
-    } else if (line.match(/^##\s+(.+)/)) {
-      tokens.push({ type: TOKEN_TYPES.HEADER_2, content: line.replace(/^##\s+/, '') })
-      // Skip any empty lines immediately after the header
-      i++
-      while (i < lines.length && !lines[i].trim()) {
-        i++
-      }
-      i-- // Back up one since we'll increment at end of loop
-    } else if (line.match(/^#\s+(.+)/)) {
-      tokens.push({ type: TOKEN_TYPES.HEADER_1, content: line.replace(/^#\s+/, '') })
-      // Skip any empty lines immediately after the header
-      i++
-      while (i < lines.length && !lines[i].trim()) {
-        i++
-      }
-      i-- // Back up one since we'll increment at end of loop
-    }
-    // Lists - collect multiple lines including nested lists
-    else if (line.match(/^\d+\.\s+/)) {
-      const listItems = [line]
-      i++
-      while (i < lines.length && (lines[i].match(/^\d+\.\s+/) || lines[i].match(/^\s+\d+\.\s+/) || lines[i].trim() === '')) {
-        if (lines[i].trim() !== '') {
-          listItems.push(lines[i])
-        }
-        i++
-      }
-      i-- // Back up one since we'll increment at end of loop
-      tokens.push({ type: TOKEN_TYPES.ORDERED_LIST, content: listItems })
-    } else if (line.match(/^[-*]\s+/)) {
-      const listItems = [line]
-      i++
-      while (i < lines.length && (lines[i].match(/^[-*]\s+/) || lines[i].match(/^\s+[-*]\s+/) || lines[i].trim() === '')) {
-        if (lines[i].trim() !== '') {
-          listItems.push(lines[i])
-        }
-        i++
-      }
-      i-- // Back up one since we'll increment at end of loop
-      tokens.push({ type: TOKEN_TYPES.UNORDERED_LIST, content: listItems })
-    }
-    // Code blocks - detect LaTeX-style {{code(language)}} pattern
-    else if (line.match(/^\{\{code\(([^)]*)\)\}\}/)) {
-      const match = line.match(/^\{\{code\(([^)]*)\)\}\}/)
-      const language = match[1].trim() || 'text'
-      const codeLines = []
-      i++
-      
-      // Collect all lines until we find the closing {{code}}
-      while (i < lines.length && !lines[i].trim().match(/^\{\{code\}\}$/)) {
-        codeLines.push(lines[i])
-        i++
-      }
-      
-      // Skip the closing line
-      if (i < lines.length) {
-        i++
-      }
-      
-      tokens.push({ 
-        type: TOKEN_TYPES.CODE_BLOCK, 
-        content: { 
-          code: codeLines.join('\n'), 
-          language: language 
-        }
-      })
-      
-      // Skip any empty lines immediately after the code block
-      while (i < lines.length && !lines[i].trim()) {
-        i++
-      }
-      i-- // Back up one since we'll increment at end of loop
-    }
-    // YouTube videos - detect {{youtube(url)}} syntax
-    else if (line.match(/^\{\{youtube\(([^)]+)\)\}\}$/)) {
-      const match = line.match(/^\{\{youtube\(([^)]+)\)\}\}$/)
-      const url = match[1]
-      
-      // Extract video ID from various YouTube URL formats
-      let videoId = null
-      if (url.includes('youtube.com/watch?v=')) {
-        videoId = url.match(/[?&]v=([a-zA-Z0-9_-]{11})/)?.[1]
-      } else if (url.includes('youtu.be/')) {
-        videoId = url.match(/youtu\.be\/([a-zA-Z0-9_-]{11})/)?.[1]
-      } else if (url.match(/^[a-zA-Z0-9_-]{11}$/)) {
-        // Direct video ID
-        videoId = url
-      }
-      
-      if (videoId) {
-        tokens.push({ 
-          type: TOKEN_TYPES.YOUTUBE, 
-          content: { videoId: videoId, url: url }
-        })
-        
-        // Skip any empty lines immediately after the YouTube video
-        i++
-        while (i < lines.length && !lines[i].trim()) {
-          i++
-        }
-        i-- // Back up one since we'll increment at end of loop
-      } else {
-        // If we can't parse the URL, treat it as regular text
-        tokens.push({ type: TOKEN_TYPES.TEXT, content: line })
-      }
-    }
-    // Images
-    else if (line.match(/!\[([^\]]*)\]\(([^)\s]+)(?:\s+"([^"]*)")?\)/)) {
-      const match = line.match(/!\[([^\]]*)\]\(([^)\s]+)(?:\s+"([^"]*)")?\)/)
-      tokens.push({ 
-        type: TOKEN_TYPES.IMAGE, 
-        content: { alt: match[1], src: match[2], caption: match[3] }
-      })
-      
-      // Skip any empty lines immediately after the image
-      i++
-      while (i < lines.length && !lines[i].trim()) {
-        i++
-      }
-      i-- // Back up one since we'll increment at end of loop
-    }
-    // Regular text
-    else if (line.trim()) {
-      tokens.push({ type: TOKEN_TYPES.TEXT, content: line })
-    } else {
-      // Empty line - only add if it's not immediately after an image, header, or YouTube video
-      const prevToken = tokens[tokens.length - 1]
-      if (!prevToken || (prevToken.type !== TOKEN_TYPES.IMAGE && 
-          prevToken.type !== TOKEN_TYPES.HEADER_1 && 
-          prevToken.type !== TOKEN_TYPES.HEADER_2 && 
-          prevToken.type !== TOKEN_TYPES.HEADER_3 &&
-          prevToken.type !== TOKEN_TYPES.YOUTUBE)) {
-        tokens.push({ type: TOKEN_TYPES.TEXT, content: '' })
-      }
-    }
-    
-    i++
-  }
-  
-  return tokens
-}
-
-// Helper function to escape HTML entities
-const escapeHtml = (text) => {
-  return text
-    .replace(/&/g, '&amp;')
-    .replace(/</g, '&lt;')
-    .replace(/>/g, '&gt;')
-    .replace(/"/g, '&quot;')
-    .replace(/'/g, '&#39;')
-}
-
-// Individual renderer components
-const HeaderRenderer = ({ level, content }) => {
-  const classes = {
-    1: "text-3xl font-bold mt-8 mb-6 text-white",
-    2: "text-2xl font-bold mt-8 mb-4 text-white", 
-    3: "text-xl font-bold mt-8 mb-4 text-white"
-  }
-  
-  // Process LaTeX in header content
-  const processedContent = escapeHtml(content)
-    .replace(/\[([^\]]+)\]\(([^)\s]+)\)/g, '<a href="$2" target="_blank" rel="noreferrer" class="underline">$1</a>')
-    .replace(/\*\*(.*?)\*\*/g, '<strong>$1</strong>')
-    .replace(/\*(.*?)\*/g, '<em>$1</em>')
-    .replace(/`(.*?)`/g, '<code class="bg-white/10 px-1 py-0.5 rounded text-sm">$1</code>')
-    // Process LaTeX inline
-    .replace(/\$([^$]+)\$/g, (match, latex) => {
-      try {
-        return katex.renderToString(latex, { displayMode: false })
-      } catch (error) {
-        return `<span class="text-red-400">LaTeX Error: ${latex}</span>`
-      }
-    })
-    // Process LaTeX blocks
-    .replace(/\$\$([^$]+)\$\$/g, (match, latex) => {
-      try {
-        const rendered = katex.renderToString(latex, { displayMode: true })
-        return `<div class="my-6 text-center">${rendered}</div>`
-      } catch (error) {
-        return `<div class="my-6 text-center text-red-400">LaTeX Error: ${latex}</div>`
-      }
-    })
-  
-  const Tag = `h${level}`
-  return (
-    <Tag 
-      className={classes[level]}
-      dangerouslySetInnerHTML={{ __html: processedContent }}
-    />
-  )
-}
-
-const LaTeXRenderer = ({ content, displayMode = false }) => {
-  try {
-    const rendered = katex.renderToString(content, { displayMode })
-    return (
-      <div 
-        dangerouslySetInnerHTML={{ __html: rendered }}
-        className={displayMode ? "my-6 text-center" : ""}
-      />
-    )
-  } catch (error) {
-    console.error('LaTeX rendering error:', error)
-    return (
-      <span className={displayMode ? "my-6 text-center text-red-400" : "text-red-400"}>
-        LaTeX Error: {content}
-      </span>
-    )
-  }
-}
-
 const CodeBlockRenderer = ({ code, language = 'text' }) => {
   const [copied, setCopied] = React.useState(false)
 
@@ -1510,104 +1277,21 @@ const CodeBlockRenderer = ({ code, language = 'text' }) => {
   )
 }
 
-const ListRenderer = ({ items, ordered = false }) => {
-  const processListItem = (item) => {
-    const content = item.replace(/^\s*[-*]\s+|^\s*\d+\.\s+/, '')
-    
-    // Process inline formatting and LaTeX
-    const processedContent = escapeHtml(content)
-      .replace(/\[([^\]]+)\]\(([^)\s]+)\)/g, '<a href="$2" target="_blank" rel="noreferrer" class="underline">$1</a>')
-      .replace(/\*\*(.*?)\*\*/g, '<strong>$1</strong>')
-      .replace(/\*(.*?)\*/g, '<em>$1</em>')
-      .replace(/`(.*?)`/g, '<code class="bg-white/10 px-1 py-0.5 rounded text-sm">$1</code>')
-      // Process LaTeX inline
-      .replace(/\$([^$]+)\$/g, (match, latex) => {
-        try {
-          return katex.renderToString(latex, { displayMode: false })
-        } catch (error) {
-          return `<span class="text-red-400">LaTeX Error: ${latex}</span>`
-        }
-      })
-      // Process LaTeX blocks
-      .replace(/\$\$([^$]+)\$\$/g, (match, latex) => {
-        try {
-          const rendered = katex.renderToString(latex, { displayMode: true })
-          return `<div class="my-6 text-center">${rendered}</div>`
-        } catch (error) {
-          return `<div class="my-6 text-center text-red-400">LaTeX Error: ${latex}</div>`
-        }
-      })
-      .replace(/\n\n+/g, '<br><br>')
-      .replace(/\n/g, '<br>')
-    
-    return processedContent
-  }
-
-  const parseNestedList = (items, ordered = false, level = 0) => {
-    const result = []
-    let i = 0
-
-    while (i < items.length) {
-      const item = items[i]
-      const indentMatch = item.match(/^(\s*)/)
-      const currentIndent = indentMatch ? indentMatch[1].length : 0
-      
-      // Extract content without list marker
-      const content = item.replace(/^\s*[-*]\s+|^\s*\d+\.\s+/, '')
-      
-      // Check if this item has nested children
-      const children = []
-      let j = i + 1
-      while (j < items.length) {
-        const nextItem = items[j]
-        const nextIndentMatch = nextItem.match(/^(\s*)/)
-        const nextIndent = nextIndentMatch ? nextIndentMatch[1].length : 0
-        
-        if (nextIndent > currentIndent) {
-          children.push(nextItem)
-          j++
-        } else {
-          break
-        }
-      }
-      
-      // Create the list item
-      const listItem = (
-        <li key={i} className="mb-1 pl-2">
-          <div 
-            dangerouslySetInnerHTML={{ __html: processListItem(item) }}
-            style={{ display: 'contents' }}
-          />
-          {children.length > 0 && (
-            <div className="ml-4 mt-1">
-              {parseNestedList(children, ordered, level + 1)}
-            </div>
-          )}
-        </li>
-      )
-      
-      result.push(listItem)
-      i = j
-    }
-    
-    const listClass = ordered 
-      ? "list-decimal list-outside mb-4 space-y-1 ml-6"
-      : "list-disc list-outside mb-4 space-y-1 ml-6"
-    
-    const Tag = ordered ? 'ol' : 'ul'
-    
-    return (
-      <Tag className={listClass}>
-        {result}
-      </Tag>
-    )
-  }
-  
-  return parseNestedList(items, ordered)
+// Resized AVIF/WebP variants of a static image (scripts/optimizeImages.py), best format first;
+// the original stays the <img> fallback
+const imageSources = (src) => {
+  const srcset = imageVariants[src]?.srcset || {}
+  return [
+    srcset.avif && { type: 'image/avif', srcSet: srcset.avif },
+    srcset.webp && { type: 'image/webp', srcSet: srcset.webp },
+  ].filter(Boolean)
 }
 
 // LazyImage component with intersection observer
-const LazyImage = ({ src, alt, className, onError, ...props }) => {
+// When width/height are known, the box is reserved up front (no layout shift) and the
+// blurred placeholder is shown until the real image has loaded. `sources` (see
+// imageSources) wraps the image in a <picture> so the browser can pick a smaller format
+const LazyImage = ({ src, alt, className, onError, width, height, placeholder, sources, sizes, ...props }) => {
   const [isLoaded, setIsLoaded] = useState(false)
   const [isInView, setIsInView] = useState(false)
   const [hasError, setHasError] = useState(false)
@@ -1641,18 +1325,39 @@ const LazyImage = ({ src, alt, className, onError, ...props }) => {
     }
   }
 
+  const hasSize = Boolean(width && height)
+  const boxStyle = hasSize ? {
+    aspectRatio: `${width} / ${height}`,
+    width: `${width}px`,
+    maxWidth: '100%',
+    ...(placeholder && !isLoaded ? { backgroundImage: `url(${placeholder})`, backgroundSize: 'cover' } : {}),
+  } : undefined
+
+  const image = (
+    <img
+      src={src}
+      alt={alt}
+      width={width}
+      height={height}
+      sizes={sizes}
+      decoding="async"
+      onLoad={() => setIsLoaded(true)}
+      onError={handleError}
+      className={`transition-opacity duration-300 ${hasSize ? 'w-full h-auto ' : ''}${isLoaded ? 'opacity-100' : 'opacity-0'}`}
+      {...props}
+    />
+  )
+
   return (
-    <div ref={imgRef} className={className}>
-      {isInView && !hasError && (
-        <img
-          src={src}
-          alt={alt}
-          onLoad={() => setIsLoaded(true)}
-          onError={handleError}
-          className={`transition-opacity duration-300 ${isLoaded ? 'opacity-100' : 'opacity-0'}`}
-          {...props}
-        />
-      )}
+    <div ref={imgRef} className={className} style={boxStyle}>
+      {isInView && !hasError && (sources?.length ? (
+        <picture>
+          {sources.map(({ type, srcSet }) => (
+            <source key={type} type={type} srcSet={srcSet} sizes={sizes} />
+          ))}
+          {image}
+        </picture>
+      ) : image)}
       {!isLoaded && isInView && !hasError && (
         <div className="absolute inset-0 bg-white/5 rounded-lg animate-pulse flex items-center justify-center">
           <div className="w-8 h-8 border-2 border-white/20 border-t-white/60 rounded-full animate-spin"></div>
@@ -1662,44 +1367,46 @@ const LazyImage = ({ src, alt, className, onError, ...props }) => {
   )
 }
 
-const ImageRenderer = ({ alt, src, caption }) => {
-  // Process LaTeX in caption content
-  const processedCaption = caption ? escapeHtml(caption)
-    .replace(/\[([^\]]+)\]\(([^)\s]+)\)/g, '<a href="$2" target="_blank" rel="noreferrer" class="underline">$1</a>')
-    .replace(/\*\*(.*?)\*\*/g, '<strong>$1</strong>')
-    .replace(/\*(.*?)\*/g, '<em>$1</em>')
-    .replace(/`(.*?)`/g, '<code class="bg-white/10 px-1 py-0.5 rounded text-sm">$1</code>')
-    // Process LaTeX inline
-    .replace(/\$([^$]+)\$/g, (match, latex) => {
-      try {
-        return katex.renderToString(latex, { displayMode: false })
-      } catch (error) {
-        return `<span class="text-red-400">LaTeX Error: ${latex}</span>`
-      }
-    })
-    // Process LaTeX blocks
-    .replace(/\$\$([^$]+)\$\$/g, (match, latex) => {
-      try {
-        const rendered = katex.renderToString(latex, { displayMode: true })
-        return `<div class="my-6 text-center">${rendered}</div>`
-      } catch (error) {
-        return `<div class="my-6 text-center text-red-400">LaTeX Error: ${latex}</div>`
-      }
-    }) : null
+// width/height/placeholder come from the post's images.json, copied onto the image
+// block at build time by scripts/prerenderBlogs.js
+const ImageRenderer = ({ alt, src, captionHtml, width, height, placeholder }) => {
+  // Animations converted to video by medium_to_markdown.py (--animations video) ship as
+  // x.mp4 + x.webm + x.poster.webp; play them like a muted, looping GIF
+  const isVideo = /\.(mp4|webm)$/i.test(src)
+  const videoBase = isVideo ? src.replace(/\.(mp4|webm)$/i, '') : null
 
   return (
     <div className="mb-4 my-4 text-center">
       <div className="group relative inline-block overflow-visible rounded-lg p-2">
-        <LazyImage 
-          src={src} 
-          alt={alt} 
-          className="max-w-full h-auto rounded-lg mx-auto shadow-lg transition-transform duration-300 ease-out group-hover:scale-105" 
-        />
+        {isVideo ? (
+          <video
+            autoPlay
+            loop
+            muted
+            playsInline
+            preload="none"
+            poster={`${videoBase}.poster.webp`}
+            aria-label={alt}
+            className="max-w-full h-auto rounded-lg mx-auto shadow-lg transition-transform duration-300 ease-out group-hover:scale-105"
+          >
+            <source src={`${videoBase}.webm`} type="video/webm" />
+            <source src={`${videoBase}.mp4`} type="video/mp4" />
+          </video>
+        ) : (
+          <LazyImage
+            src={src}
+            alt={alt}
+            width={width}
+            height={height}
+            placeholder={placeholder}
+            className="max-w-full h-auto rounded-lg mx-auto shadow-lg transition-transform duration-300 ease-out group-hover:scale-105"
+          />
+        )}
       </div>
-      {processedCaption && (
+      {captionHtml && (
         <p 
           className="text-sm text-white/60 text-center mt-2 italic"
-          dangerouslySetInnerHTML={{ __html: processedCaption }}
+          dangerouslySetInnerHTML={{ __html: captionHtml }}
         />
       )}
     </div>
@@ -1723,92 +1430,49 @@ const YouTubeRenderer = ({ videoId }) => {
   )
 }
 
-const TextRenderer = ({ content }) => {
-  // No content is replaced with a line break. Note that I want it to be slightly smaller so I
-  // use a paragraph with no text and some padding
-  // if (!content.trim()) return <br />
-  if (!content.trim()) return <p class="mb-4"></p>
-  
-  // Process inline formatting
-  const processedContent = escapeHtml(content)
-    .replace(/\[([^\]]+)\]\(([^)\s]+)\)/g, '<a href="$2" target="_blank" rel="noreferrer" class="underline">$1</a>')
-    .replace(/\*\*(.*?)\*\*/g, '<strong>$1</strong>')
-    .replace(/\*(.*?)\*/g, '<em>$1</em>')
-    .replace(/`(.*?)`/g, '<code class="bg-white/10 px-1 py-0.5 rounded text-sm">$1</code>')
-    // Process LaTeX inline
-    .replace(/\$([^$]+)\$/g, (match, latex) => {
-      try {
-        return katex.renderToString(latex, { displayMode: false })
-      } catch (error) {
-        return `<span class="text-red-400">LaTeX Error: ${latex}</span>`
-      }
-    })
-    // Process LaTeX blocks
-    .replace(/\$\$([^$]+)\$\$/g, (match, latex) => {
-      try {
-        const rendered = katex.renderToString(latex, { displayMode: true })
-        return `<div class="my-6 text-center">${rendered}</div>`
-      } catch (error) {
-        return `<div class="my-6 text-center text-red-400">LaTeX Error: ${latex}</div>`
-      }
-    })
-    // Handle double newlines as paragraph breaks with more spacing
-    .replace(/\n\n+/g, '')
-    // Handle single newlines as line breaks
-    .replace(/\n/g, '')
-  
-  return (
-    <div 
-      dangerouslySetInnerHTML={{ __html: processedContent }}
-      style={{ display: 'contents' }}
-    />
-  )
-}
-
-// Main content renderer with memoization
-const ContentRenderer = React.memo(({ content }) => {
-  const tokens = React.useMemo(() => tokenizeContent(content), [content])
-  
+// Main content renderer with memoization. Static markup (headers, lists, text, math)
+// arrives as finished HTML blocks, either prerendered at build time
+// (scripts/prerenderBlogs.js) or rendered in the browser by usePostContent.
+const ContentRenderer = React.memo(({ blocks }) => {
   return (
     <div>
-      {tokens.map((token, index) => {
-        switch (token.type) {
-          case TOKEN_TYPES.HEADER_1:
-            return <HeaderRenderer key={index} level={1} content={token.content} />
-          case TOKEN_TYPES.HEADER_2:
-            return <HeaderRenderer key={index} level={2} content={token.content} />
-          case TOKEN_TYPES.HEADER_3:
-            return <HeaderRenderer key={index} level={3} content={token.content} />
-          case TOKEN_TYPES.ORDERED_LIST:
-            return <ListRenderer key={index} items={token.content} ordered={true} />
-          case TOKEN_TYPES.UNORDERED_LIST:
-            return <ListRenderer key={index} items={token.content} ordered={false} />
-          case TOKEN_TYPES.IMAGE:
+      {blocks.map((block, index) => {
+        switch (block.type) {
+          case 'html':
+            return (
+              <div
+                key={index}
+                dangerouslySetInnerHTML={{ __html: block.html }}
+                style={{ display: 'contents' }}
+              />
+            )
+          case 'image':
             return (
               <ImageRenderer 
                 key={index} 
-                alt={token.content.alt} 
-                src={token.content.src} 
-                caption={token.content.caption} 
+                alt={block.alt} 
+                src={block.src} 
+                captionHtml={block.captionHtml} 
+                width={block.width}
+                height={block.height}
+                placeholder={block.placeholder}
               />
             )
-          case TOKEN_TYPES.CODE_BLOCK:
+          case 'code':
             return (
               <CodeBlockRenderer 
                 key={index} 
-                code={token.content.code} 
-                language={token.content.language} 
+                code={block.code} 
+                language={block.language} 
               />
             )
-          case TOKEN_TYPES.YOUTUBE:
+          case 'youtube':
             return (
               <YouTubeRenderer 
                 key={index} 
-                videoId={token.content.videoId} 
+                videoId={block.videoId} 
               />
             )
-          case TOKEN_TYPES.TEXT:
-            return <TextRenderer key={index} content={token.content} />
           default:
             return null
         }
@@ -1817,9 +1481,63 @@ const ContentRenderer = React.memo(({ content }) => {
   )
 })
 
+// Post bodies (src/blogs/<slug>.js) and their prerendered blocks
+// (src/blogs/prerendered/<slug>.json) are separate chunks, fetched together when a post is opened
+const prerenderedPosts = import.meta.glob('./blogs/prerendered/*.json', { import: 'default' })
+
+// KaTeX's stylesheet is needed by prerendered math too; KaTeX itself (with the Markdown
+// renderer) is only loaded when a post has no up-to-date prerendered copy
+const loadKatexCss = () => import('katex/dist/katex.min.css')
+
+// A stale prerender (body edited since the last build) still knows the image sizes;
+// carry them over by src so the fresh blocks keep their reserved boxes
+const withImageMeta = (blocks, previous) => {
+  const meta = new Map((previous || []).filter((block) => block.type === 'image').map((block) => [block.src, block]))
+  return blocks.map((block) => {
+    const known = block.type === 'image' && meta.get(block.src)
+    return known ? { ...block, width: known.width, height: known.height, placeholder: known.placeholder } : block
+  })
+}
+
+const loadPostBlocks = async (slug) => {
+  const loadRendered = prerenderedPosts[`./blogs/prerendered/${slug}.json`]
+  const [body, rendered] = await Promise.all([
+    loadPostBody(slug).catch(() => null),
+    loadRendered ? loadRendered().catch(() => null) : null,
+    loadKatexCss().catch(() => null),
+  ])
+  if (body == null) return null
+  if (rendered && rendered.key === contentKey(body)) return rendered.blocks
+  const { renderContent } = await import('./blogRender')
+  return withImageMeta(renderContent(body).blocks, rendered?.blocks)
+}
+
+const usePostContent = (slug) => {
+  const [state, setState] = useState({ slug: null, blocks: null })
+
+  useEffect(() => {
+    let active = true
+    loadPostBlocks(slug)
+      .catch(() => null)
+      .then((blocks) => {
+        if (active) setState({ slug, blocks })
+      })
+    return () => { active = false }
+  }, [slug])
+
+  return state.slug === slug ? state : { slug, blocks: null, loading: true }
+}
+
 // Main LaTeX renderer component
-const LatexRenderer = ({ content }) => {
-  return <ContentRenderer content={content} />
+const LatexRenderer = ({ slug }) => {
+  const { blocks, loading } = usePostContent(slug)
+  if (loading) {
+    return <p className="text-white/60">Loading…</p>
+  }
+  if (blocks == null) {
+    return <p className="text-white/60">This post could not be loaded.</p>
+  }
+  return <ContentRenderer blocks={blocks} />
 }
 
 const BlogPost = ({ post }) => {
@@ -1861,9 +1579,10 @@ const BlogPost = ({ post }) => {
       "@type": "WebPage",
       "@id": `https://gmongaras.me/#blog/${post.slug}`
     },
+    "image": `https://gmongaras.me${ogImages[`blog/${post.slug}`] || '/og-image.png'}`,
     "keywords": post.tags.join(", "),
     "articleSection": "Technology",
-    "wordCount": post.body.split(' ').length
+    "timeRequired": `PT${post.readingTime}M`
   }
 
   return (
@@ -1873,6 +1592,7 @@ const BlogPost = ({ post }) => {
         description={post.excerpt}
         keywords={post.tags}
         url={`/#blog/${post.slug}`}
+        image={ogImages[`blog/${post.slug}`]}
         type="article"
         structuredData={blogStructuredData}
       />
@@ -1898,6 +1618,7 @@ const BlogPost = ({ post }) => {
                   month: 'long', 
                   day: 'numeric' 
                 })}</time>
+                <span>{post.readingTime} min read</span>
                 <div className="flex gap-2">
                   {post.tags.map((tag, i) => (
                     <span key={i} className="chip text-xs">{tag}</span>
@@ -1907,7 +1628,7 @@ const BlogPost = ({ post }) => {
             </header>
 
             <div className="prose prose-invert max-w-none">
-              <LatexRenderer content={post.body} />
+              <LatexRenderer slug={post.slug} />
             </div>
           </article>
         </div>
@@ -1926,7 +1647,7 @@ const Blogs = () => {
             <Card>
               <div className="flex-1 min-w-0">
                 <h3 className="font-semibold break-words">{post.title}</h3>
-                <p className="text-sm text-white/60 mt-1">{post.date}</p>
+                <p className="text-sm text-white/60 mt-1">{post.date} · {post.readingTime} min read</p>
                 <p className="mt-3 text-white/90 break-words">{post.excerpt}</p>
                 <div className="mt-3 flex flex-wrap gap-2">
                   {post.tags.map((tag, i) => (
@@ -1955,16 +1676,79 @@ const Blogs = () => {
   )
 }
 
+// youtubeData.js only carries what a card needs for layout; descriptions and stats are in
+// public/youtube/page-N.json (written by scripts/GetYoutueData.py). One fetch per page.
+const youtubePageLoads = new Map()
+
+const loadYoutubePage = (page) => {
+  if (!youtubePageLoads.has(page)) {
+    youtubePageLoads.set(
+      page,
+      fetch(youtubePages[page])
+        .then((res) => (res.ok ? res.json() : []))
+        .catch(() => [])
+    )
+  }
+  return youtubePageLoads.get(page)
+}
+
+// Local thumbnails (scripts/youtubeThumbnails.py) come as <id>-320.webp / <id>-640.webp
+const youtubeThumbnailSrcSet = (thumbnail) => {
+  const match = thumbnail.match(/^(\/youtube\/thumbs\/.+)-640\.webp$/)
+  return match ? `${match[1]}-320.webp 320w, ${thumbnail} 640w` : undefined
+}
+
 const Media = () => {
   const [sortBy, setSortBy] = useState('time') // 'time', 'likes', 'views'
   const [isSorting, setIsSorting] = useState(false)
   const [isDropdownOpen, setIsDropdownOpen] = useState(false)
+  const [videoDetails, setVideoDetails] = useState({})
   const dropdownRef = useRef(null)
   const scrollContainerRef = useRef(null)
+  const youtubeSectionRef = useRef(null)
+
+  const requestYoutubePages = (pages) => {
+    Promise.all(pages.map(loadYoutubePage)).then((results) => {
+      const rows = results.flat()
+      setVideoDetails((prev) => {
+        if (rows.every((row) => prev[row.videoId])) return prev
+        const next = { ...prev }
+        rows.forEach((row) => { next[row.videoId] = row })
+        return next
+      })
+    })
+  }
+
+  // Fetch the first page when the YouTube row is about to scroll into view;
+  // sorting by likes/views needs every page's stats
+  useEffect(() => {
+    if (sortBy !== 'time') {
+      requestYoutubePages(youtubePages.map((_, page) => page))
+      return
+    }
+    const observer = new IntersectionObserver(
+      ([entry]) => {
+        if (entry.isIntersecting) {
+          requestYoutubePages([0])
+          observer.disconnect()
+        }
+      },
+      { rootMargin: '400px' }
+    )
+    if (youtubeSectionRef.current) {
+      observer.observe(youtubeSectionRef.current)
+    }
+    return () => observer.disconnect()
+  }, [sortBy])
+
+  // Later pages load as cards from them come into view while scrolling the row
+  const handleCardInView = (page) => {
+    if (page > 0) requestYoutubePages([page])
+  }
 
   // Helper function to parse numeric values from formatted strings
   const parseNumericValue = (value) => {
-    if (value === 'Unknown') return 0
+    if (value === 'Unknown' || value === '—') return 0
     // Handle K and M suffixes properly
     if (value.includes('K')) {
       const num = parseFloat(value.replace('K', ''))
@@ -1980,7 +1764,11 @@ const Media = () => {
 
   // Sort videos based on selected criteria
   const sortedVideos = useMemo(() => {
-    const videos = [...youtubeVideos]
+    const videos = youtubeVideos.map((video) => ({
+      ...video,
+      views: videoDetails[video.videoId]?.views ?? '—',
+      likes: videoDetails[video.videoId]?.likes ?? '—',
+    }))
     
     switch (sortBy) {
       case 'likes':
@@ -1991,7 +1779,7 @@ const Media = () => {
       default:
         return videos.sort((a, b) => new Date(b.publishedAt) - new Date(a.publishedAt))
     }
-  }, [sortBy])
+  }, [sortBy, videoDetails])
 
   // Handle sort change with smooth animation
   const handleSortChange = (newSortBy) => {
@@ -2050,7 +1838,7 @@ const Media = () => {
       <SectionTitle icon={BookOpen} title="Media" subtitle="Articles & Videos" />
       
       {/* YouTube Section */}
-      <div className="mb-12">
+      <div className="mb-12" ref={youtubeSectionRef}>
         <div className="flex items-center justify-between mb-6">
           <div className="flex items-center gap-3">
             <div className="p-1.5 rounded-lg bg-white/5 border border-white/10">
@@ -2156,12 +1944,16 @@ const Media = () => {
                         scale: 1.02,
                         transition: { duration: 0.2 }
                       }}
+                      onViewportEnter={() => handleCardInView(video.page)}
+                      viewport={{ once: true, margin: '0px 400px' }}
                     >
               <Card>
                 <div className="flex-1 min-w-0">
                   <div className="relative group">
                     <LazyImage
                       src={video.thumbnail}
+                      srcSet={youtubeThumbnailSrcSet(video.thumbnail)}
+                      sizes="320px"
                       alt={video.title}
                       className="w-full h-48 object-cover rounded-lg mb-3"
                       onError={(e) => {
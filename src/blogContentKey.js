@@ -0,0 +1,16 @@
+// Kept apart from blogRender.js (which pulls in KaTeX) so the app can check a prerendered
+// post against its body without loading the renderer.
+
+// Bump when the HTML produced by blogRender.js changes, so prerendered posts are rebuilt
+export const RENDER_VERSION = 1
+
+// Cheap, synchronous content hash (FNV-1a, 32 bit) so the browser can tell whether a
+// prerendered post still matches the body it was built from
+export const contentKey = (text) => {
+  let hash = 0x811c9dc5
+  for (let i = 0; i < text.length; i++) {
+    hash ^= text.charCodeAt(i)
+    hash = Math.imul(hash, 0x01000193)
+  }
+  return `${RENDER_VERSION}-${(hash >>> 0).toString(16).padStart(8, '0')}-${text.length}`
+}
@@ -0,0 +1,316 @@
+// Blog post rendering shared by the browser (App.jsx) and the build-time prerenderer
+// (scripts/prerenderBlogs.js). Headers, lists, text and math become finished HTML
+// strings; code blocks, images and YouTube embeds stay structured because they are
+// interactive React components.
+import katex from 'katex'
+import { contentKey } from './blogContentKey.js'
+
+export { RENDER_VERSION, contentKey } from './blogContentKey.js'
+
+// Token types for the parser
+export const TOKEN_TYPES = {
+  HEADER_1: 'HEADER_1',
+  HEADER_2: 'HEADER_2', 
+  HEADER_3: 'HEADER_3',
+  LATEX_BLOCK: 'LATEX_BLOCK',
+  LATEX_INLINE: 'LATEX_INLINE',
+  ORDERED_LIST: 'ORDERED_LIST',
+  UNORDERED_LIST: 'UNORDERED_LIST',
+  IMAGE: 'IMAGE',
+  CODE_BLOCK: 'CODE_BLOCK',
+  YOUTUBE: 'YOUTUBE',
+  TEXT: 'TEXT'
+}
+
+// Tokenizer - converts markdown text into structured tokens
+export const tokenizeContent = (text) => {
+  const tokens = []
+  const lines = text.split(/(?<!\\)\n/)
+  let i = 0
+
+  while (i < lines.length) {
+    const line = lines[i]
+    
+    // Headers
+    if (line.match(/^###\s+(.+)/)) {
+      tokens.push({ type: TOKEN_TYPES.HEADER_3, content: line.replace(/^###\s+/, '') })
+      // Skip any empty lines immediately after the header
+      i++
+      while (i < lines.length && !lines[i].trim()) {
+        i++
+      }
+      i-- // Back up one since we'll increment at end of loop
+    } else if (line.match(/^##\s+(.+)/)) {
+      tokens.push({ type: TOKEN_TYPES.HEADER_2, content: line.replace(/^##\s+/, '') })
+      // Skip any empty lines immediately after the header
+      i++
+      while (i < lines.length && !lines[i].trim()) {
+        i++
+      }
+      i-- // Back up one since we'll increment at end of loop
+    } else if (line.match(/^#\s+(.+)/)) {
+      tokens.push({ type: TOKEN_TYPES.HEADER_1, content: line.replace(/^#\s+/, '') })
+      // Skip any empty lines immediately after the header
+      i++
+      while (i < lines.length && !lines[i].trim()) {
+        i++
+      }
+      i-- // Back up one since we'll increment at end of loop
+    }
+    // Lists - collect multiple lines including nested lists
+    else if (line.match(/^\d+\.\s+/)) {
+      const listItems = [line]
+      i++
+      while (i < lines.length && (lines[i].match(/^\d+\.\s+/) || lines[i].match(/^\s+\d+\.\s+/) || lines[i].trim() === '')) {
+        if (lines[i].trim() !== '') {
+          listItems.push(lines[i])
+        }
+        i++
+      }
+      i-- // Back up one since we'll increment at end of loop
+      tokens.push({ type: TOKEN_TYPES.ORDERED_LIST, content: listItems })
+    } else if (line.match(/^[-*]\s+/)) {
+      const listItems = [line]
+      i++
+      while (i < lines.length && (lines[i].match(/^[-*]\s+/) || lines[i].match(/^\s+[-*]\s+/) || lines[i].trim() === '')) {
+        if (lines[i].trim() !== '') {
+          listItems.push(lines[i])
+        }
+        i++
+      }
+      i-- // Back up one since we'll increment at end of loop
+      tokens.push({ type: TOKEN_TYPES.UNORDERED_LIST, content: listItems })
+    }
+    // Code blocks - detect LaTeX-style {{code(language)}} pattern
+    else if (line.match(/^\{\{code\(([^)]*)\)\}\}/)) {
+      const match = line.match(/^\{\{code\(([^)]*)\)\}\}/)
+      const language = match[1].trim() || 'text'
+      const codeLines = []
+      i++
+      
+      // Collect all lines until we find the closing {{code}}
+      while (i < lines.length && !lines[i].trim().match(/^\{\{code\}\}$/)) {
+        codeLines.push(lines[i])
+        i++
+      }
+      
+      // Skip the closing line
+      if (i < lines.length) {
+        i++
+      }
+      
+      tokens.push({ 
+        type: TOKEN_TYPES.CODE_BLOCK, 
+        content: { 
+          code: codeLines.join('\n'), 
+          language: language 
+        }
+      })
+      
+      // Skip any empty lines immediately after the code block
+      while (i < lines.length && !lines[i].trim()) {
+        i++
+      }
+      i-- // Back up one since we'll increment at end of loop
+    }
+    // YouTube videos - detect {{youtube(url)}} syntax
+    else if (line.match(/^\{\{youtube\(([^)]+)\)\}\}$/)) {
+      const match = line.match(/^\{\{youtube\(([^)]+)\)\}\}$/)
+      const url = match[1]
+      
+      // Extract video ID from various YouTube URL formats
+      let videoId = null
+      if (url.includes('youtube.com/watch?v=')) {
+        videoId = url.match(/[?&]v=([a-zA-Z0-9_-]{11})/)?.[1]
+      } else if (url.includes('youtu.be/')) {
+        videoId = url.match(/youtu\.be\/([a-zA-Z0-9_-]{11})/)?.[1]
+      } else if (url.match(/^[a-zA-Z0-9_-]{11}$/)) {
+        // Direct video ID
+        videoId = url
+      }
+      
+      if (videoId) {
+        tokens.push({ 
+          type: TOKEN_TYPES.YOUTUBE, 
+          content: { videoId: videoId, url: url }
+        })
+        
+        // Skip any empty lines immediately after the YouTube video
+        i++
+        while (i < lines.length && !lines[i].trim()) {
+          i++
+        }
+        i-- // Back up one since we'll increment at end of loop
+      } else {
+        // If we can't parse the URL, treat it as regular text
+        tokens.push({ type: TOKEN_TYPES.TEXT, content: line })
+      }
+    }
+    // Images
+    else if (line.match(/!\[([^\]]*)\]\(([^)\s]+)(?:\s+"([^"]*)")?\)/)) {
+      const match = line.match(/!\[([^\]]*)\]\(([^)\s]+)(?:\s+"([^"]*)")?\)/)
+      tokens.push({ 
+        type: TOKEN_TYPES.IMAGE, 
+        content: { alt: match[1], src: match[2], caption: match[3] }
+      })
+      
+      // Skip any empty lines immediately after the image
+      i++
+      while (i < lines.length && !lines[i].trim()) {
+        i++
+      }
+      i-- // Back up one since we'll increment at end of loop
+    }
+    // Regular text
+    else if (line.trim()) {
+      tokens.push({ type: TOKEN_TYPES.TEXT, content: line })
+    } else {
+      // Empty line - only add if it's not immediately after an image, header, or YouTube video
+      const prevToken = tokens[tokens.length - 1]
+      if (!prevToken || (prevToken.type !== TOKEN_TYPES.IMAGE && 
+          prevToken.type !== TOKEN_TYPES.HEADER_1 && 
+          prevToken.type !== TOKEN_TYPES.HEADER_2 && 
+          prevToken.type !== TOKEN_TYPES.HEADER_3 &&
+          prevToken.type !== TOKEN_TYPES.YOUTUBE)) {
+        tokens.push({ type: TOKEN_TYPES.TEXT, content: '' })
+      }
+    }
+    
+    i++
+  }
+  
+  return tokens
+}
+
+// Helper function to escape HTML entities
+export const escapeHtml = (text) => {
+  return text
+    .replace(/&/g, '&amp;')
+    .replace(/</g, '&lt;')
+    .replace(/>/g, '&gt;')
+    .replace(/"/g, '&quot;')
+    .replace(/'/g, '&#39;')
+}
+
+// Inline formatting and LaTeX shared by headers, list items, text and captions
+export const formatInline = (content) => {
+  return escapeHtml(content)
+    .replace(/\[([^\]]+)\]\(([^)\s]+)\)/g, '<a href="$2" target="_blank" rel="noreferrer" class="underline">$1</a>')
+    .replace(/\*\*(.*?)\*\*/g, '<strong>$1</strong>')
+    .replace(/\*(.*?)\*/g, '<em>$1</em>')
+    .replace(/`(.*?)`/g, '<code class="bg-white/10 px-1 py-0.5 rounded text-sm">$1</code>')
+    // Process LaTeX inline
+    .replace(/\$([^$]+)\$/g, (match, latex) => {
+      try {
+        return katex.renderToString(latex, { displayMode: false })
+      } catch (error) {
+        return `<span class="text-red-400">LaTeX Error: ${latex}</span>`
+      }
+    })
+    // Process LaTeX blocks
+    .replace(/\$\$([^$]+)\$\$/g, (match, latex) => {
+      try {
+        const rendered = katex.renderToString(latex, { displayMode: true })
+        return `<div class="my-6 text-center">${rendered}</div>`
+      } catch (error) {
+        return `<div class="my-6 text-center text-red-400">LaTeX Error: ${latex}</div>`
+      }
+    })
+}
+
+const HEADER_CLASSES = {
+  1: "text-3xl font-bold mt-8 mb-6 text-white",
+  2: "text-2xl font-bold mt-8 mb-4 text-white",
+  3: "text-xl font-bold mt-8 mb-4 text-white"
+}
+
+export const renderHeaderHtml = (level, content) => {
+  return `<h${level} class="${HEADER_CLASSES[level]}">${formatInline(content)}</h${level}>`
+}
+
+const renderListItem = (item) => {
+  const content = item.replace(/^\s*[-*]\s+|^\s*\d+\.\s+/, '')
+  return formatInline(content)
+    .replace(/\n\n+/g, '<br><br>')
+    .replace(/\n/g, '<br>')
+}
+
+// Nested lists: deeper-indented lines following an item become its children
+export const renderListHtml = (items, ordered = false) => {
+  const result = []
+  let i = 0
+
+  while (i < items.length) {
+    const currentIndent = items[i].match(/^(\s*)/)[1].length
+    const children = []
+    let j = i + 1
+    while (j < items.length && items[j].match(/^(\s*)/)[1].length > currentIndent) {
+      children.push(items[j])
+      j++
+    }
+
+    const nested = children.length > 0 ? `<div class="ml-4 mt-1">${renderListHtml(children, ordered)}</div>` : ''
+    result.push(`<li class="mb-1 pl-2"><div style="display: contents">${renderListItem(items[i])}</div>${nested}</li>`)
+    i = j
+  }
+
+  const listClass = ordered
+    ? "list-decimal list-outside mb-4 space-y-1 ml-6"
+    : "list-disc list-outside mb-4 space-y-1 ml-6"
+  const tag = ordered ? 'ol' : 'ul'
+  return `<${tag} class="${listClass}">${result.join('')}</${tag}>`
+}
+
+export const renderTextHtml = (content) => {
+  // No content is replaced with a slightly smaller gap than a line break
+  if (!content.trim()) return '<p class="mb-4"></p>'
+
+  const processedContent = formatInline(content)
+    .replace(/\n\n+/g, '')
+    .replace(/\n/g, '')
+  return `<div style="display: contents">${processedContent}</div>`
+}
+
+const tokenHtml = (token) => {
+  switch (token.type) {
+    case TOKEN_TYPES.HEADER_1:
+      return renderHeaderHtml(1, token.content)
+    case TOKEN_TYPES.HEADER_2:
+      return renderHeaderHtml(2, token.content)
+    case TOKEN_TYPES.HEADER_3:
+      return renderHeaderHtml(3, token.content)
+    case TOKEN_TYPES.ORDERED_LIST:
+      return renderListHtml(token.content, true)
+    case TOKEN_TYPES.UNORDERED_LIST:
+      return renderListHtml(token.content, false)
+    case TOKEN_TYPES.TEXT:
+      return renderTextHtml(token.content)
+    default:
+      return null
+  }
+}
+
+// Markdown body -> { key, blocks }. Runs of static tokens are merged into one
+// { type: 'html' } block; code, image and youtube blocks keep their data.
+export const renderContent = (text) => {
+  const blocks = []
+  for (const token of tokenizeContent(text)) {
+    const html = tokenHtml(token)
+    if (html !== null) {
+      const last = blocks[blocks.length - 1]
+      if (last && last.type === 'html') {
+        last.html += html
+      } else {
+        blocks.push({ type: 'html', html })
+      }
+    } else if (token.type === TOKEN_TYPES.IMAGE) {
+      const { alt, src, caption } = token.content
+      blocks.push({ type: 'image', alt, src, captionHtml: caption ? formatInline(caption) : null })
+    } else if (token.type === TOKEN_TYPES.CODE_BLOCK) {
+      blocks.push({ type: 'code', ...token.content })
+    } else if (token.type === TOKEN_TYPES.YOUTUBE) {
+      blocks.push({ type: 'youtube', videoId: token.content.videoId })
+    }
+  }
+  return { key: contentKey(text), blocks }
+}
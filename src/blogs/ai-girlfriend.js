@@ -1,10 +1,4 @@
-export const post = {
-    slug: "ai-girlfriend",
-    title: "Coding a Virtual AI Girlfriend",
-    date: "2023-02-12",
-    tags: ["Neural Networks", "AI Girlfriend", "Machine Learning"],
-    excerpt: "Building an AI girlfriend using an old diffusion model and GPT 2 on subtitle data",
-    body: String.raw`Note :Imported from [medium](https://gmongaras.medium.com/coding-a-virtual-ai-girlfriend-f951e648aa46)
+export const body = String.raw`Note :Imported from [medium](https://gmongaras.medium.com/coding-a-virtual-ai-girlfriend-f951e648aa46)
     
 I always told people I would create an AI girlfriend, but after a few weeks of building a conglomeration of ML models, I finally have one. In this article, I'm going to explain my procedure for creating a virtual girlfriend so that everyone can have one. Don't worry, If you don't want a virtual girlfriend, these methods can be applied to make a boyfriend too.
 
@@ -288,17 +282,17 @@ Press enter or click to view image in full size
 
 The cycle can be generated in real-time using Gradio.
 
-![Blinking gif](/blogs/images/ai_girlfriend/4.gif "No dilation")
+![Blinking gif](/blogs/images/ai_girlfriend/4.webp "No dilation")
 
 I also added eye dilation as I thought it looked better.
 
-![Eye dilation gif](/blogs/images/ai_girlfriend/5.gif "With dilation")
+![Eye dilation gif](/blogs/images/ai_girlfriend/5.webp "With dilation")
 
 With the style vector, we can change all types of components of the image which I have documented [in my repo](https://github.com/gmongaras/AI_Girlfriend/blob/master/Img_Mover/Img_Mover.py).
 
 What happens if you randomly change all elements at once? I'm glad you asked.
 
-![errrrrmmmm?](/blogs/images/ai_girlfriend/5.gif)
+![errrrrmmmm?](/blogs/images/ai_girlfriend/5.webp)
 
 {{code(python)}}
 # Let's initialize the object to allow the image to move
@@ -594,5 +588,3 @@ As a Computer Science major, I'm not entirely sure why I should have to try to g
 Let me know if you have any questions or run into any issues with the notebooks.
 
   `
-  }
-  
\ No newline at end of file
@@ -1,10 +1,4 @@
-export const post = {
-    slug: "attn-masks",
-    title: "How Do Self-Attention Masks Work",
-    date: "2022-10-27",
-    tags: ["Neural Networks", "Attention", "Machine Learning", "Self attention"],
-    excerpt: "Explanation of how different types of attention masks work in detail.",
-    body: String.raw`Note: Imported from [medium](https://medium.com/mlearning-ai/how-do-self-attention-masks-work-72ed9382510f)
+export const body = String.raw`Note: Imported from [medium](https://medium.com/mlearning-ai/how-do-self-attention-masks-work-72ed9382510f)
 
 As I've been working with [self-attention](https://towardsdatascience.com/illustrated-self-attention-2d627e33b20a), I've found that there's a lot of information on how the function works, but not a lot online that explains why and how a mask works. Additionally, I had several questions revolving around the masks. For example:
 
@@ -221,5 +215,3 @@ Each self-attention function will require the use of the same mask due to the re
 The attention mask is essentially a way to stop the model from looking at the information we don't want it to look at. It's not a very complicated method of doing so, but it's very effective. I hope this article gave you a better understanding of how masking works in the self-attention function. Hopefully, I was able to get all the matrix multiplication correct.
 
   `
-  }
-  
\ No newline at end of file
@@ -1,10 +1,4 @@
-export const post = {
-  slug: "community-detection-neural-networks",
-  title: "Community Detection with Neural Networks",
-  date: "2022-04-10",
-  tags: ["Neural Networks", "Graph Theory", "Machine Learning", "Research"],
-  excerpt: "Using neural networks to solve community detection problems faster and more accurately than traditional algorithms like Girvan-Newman.",
-  body: String.raw`Note :Imported from [medium](https://medium.com/smucs/community-detection-with-neural-networks-2e6c79a28d0c)
+export const body = String.raw`Note :Imported from [medium](https://medium.com/smucs/community-detection-with-neural-networks-2e6c79a28d0c)
   
 This article is written for a class project and is a continuation of a previous article linked below. The previous article, written by  which describes how the Girvan Newman algorithm attempts to solve the community detection Problem:
 
@@ -161,4 +155,3 @@ The only real downside to the Neural Network algorithm shown in this article is
 - [https://www.pnas.org/doi/full/10.1073/pnas.0601602103](https://www.pnas.org/doi/full/10.1073/pnas.0601602103)
 
 `
-}
@@ -1,10 +1,4 @@
-export const post = {
-    slug: "diffusion-models",
-    title: "Diffusion Models - DDPMs, DDIMs, and Classifier Free Guidance",
-    date: "2023-03-13",
-    tags: ["Neural Networks", "Diffusion models", "DDIM", "DDPM", "Machine Learning"],
-    excerpt: "Explanation of how old diffusion models (DDPM and DDIM) work",
-    body: String.raw`Note: Imported from [medium](https://medium.com/better-programming/diffusion-models-ddpms-ddims-and-classifier-free-guidance-e07b297b2869)
+export const body = String.raw`Note: Imported from [medium](https://medium.com/better-programming/diffusion-models-ddpms-ddims-and-classifier-free-guidance-e07b297b2869)
 
 The big models in the news are text-to-image (TTI) models like DALL-E and text-generation models like GPT-3. Image generation models started with GANs, but recently diffusion models have started showing amazing results over GANs and are now used in every TTI model you hear about, like Stable Diffusion. In this article, I want to talk about where diffusion models started and some improvements that led them to where they are today.
 
@@ -480,5 +474,3 @@ If you are interested, the code is available in [this repo](https://github.com/g
 
 
   `
-  }
-  
\ No newline at end of file
@@ -1,21 +1,19 @@
-// Import all blog posts
-import { post as diffusionModels } from './diffusion_models.js'
-import { post as attnMasks } from './attn_masks.js'
-import { post as aiGirlfriend } from './ai_girlfriend.js'
-import { post as communityDetection } from './community_detection_nns.js'
-
-// Export all posts as an array
+// Generated by src/blogs/medium_to_markdown.py from the <slug>.js body modules.
+// Listing metadata lives here; titles, tags and excerpts may be edited by hand.
 export const posts = [
-  diffusionModels,
-  attnMasks,
-  aiGirlfriend,
-  communityDetection,
+  {"slug": "diffusion-models", "title": "Diffusion Models - DDPMs, DDIMs, and Classifier Free Guidance", "date": "2023-03-13", "tags": ["Neural Networks", "Diffusion models", "DDIM", "DDPM", "Machine Learning"], "excerpt": "Explanation of how old diffusion models (DDPM and DDIM) work", "readingTime": 34, "imageCount": 41},
+  {"slug": "attn-masks", "title": "How Do Self-Attention Masks Work", "date": "2022-10-27", "tags": ["Neural Networks", "Attention", "Machine Learning", "Self attention"], "excerpt": "Explanation of how different types of attention masks work in detail.", "readingTime": 15, "imageCount": 27},
+  {"slug": "ai-girlfriend", "title": "Coding a Virtual AI Girlfriend", "date": "2023-02-12", "tags": ["Neural Networks", "AI Girlfriend", "Machine Learning"], "excerpt": "Building an AI girlfriend using an old diffusion model and GPT 2 on subtitle data", "readingTime": 22, "imageCount": 8},
+  {"slug": "community-detection-neural-networks", "title": "Community Detection with Neural Networks", "date": "2022-04-10", "tags": ["Neural Networks", "Graph Theory", "Machine Learning", "Research"], "excerpt": "Using neural networks to solve community detection problems faster and more accurately than traditional algorithms like Girvan-Newman.", "readingTime": 10, "imageCount": 14},
 ]
 
-// Export individual posts for easy access
-export {
-  diffusionModels,
-  attnMasks,
-  aiGirlfriend,
-  communityDetection,
+// Each body is its own chunk, fetched only when the post is opened
+const bodies = {
+  "diffusion-models": () => import('./diffusion-models.js'),
+  "attn-masks": () => import('./attn-masks.js'),
+  "ai-girlfriend": () => import('./ai-girlfriend.js'),
+  "community-detection-neural-networks": () => import('./community-detection-neural-networks.js'),
 }
+
+export const loadPostBody = (slug) =>
+  bodies[slug] ? bodies[slug]().then((module) => module.body) : Promise.resolve(null)
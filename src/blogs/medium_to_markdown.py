@@ -3,39 +3,92 @@
 medium2md.py — Convert a Medium article URL into a clean Markdown file.
 
 Features
-- Extracts the main article body with readability-lxml (falls back to <article>/<main>/<body>).
+- Reads Medium's embedded post JSON (window.__APOLLO_STATE__) directly when present.
+- Otherwise extracts the main article body with readability-lxml (falls back to <article>/<main>/<body>).
+- Parses the page once (lxml tree builder when installed) and runs every clean-up pass on that tree.
 - Converts HTML → Markdown (fenced code blocks, proper lists/links).
 - Captures title, author, and published date → optional YAML front matter.
 - Optionally downloads images and rewrites image links to local assets.
+- Caches page/image responses on disk (ETag/Last-Modified revalidation, `--offline` replay).
+- Downloads images concurrently over one keep-alive session, streaming to disk with retries.
+- Optional transcoding of downloaded images to WebP/AVIF at several widths (`--transcode`).
+- Records intrinsic size + a tiny base64 placeholder per image in `<assets>/images.json` (`--image-metadata DIR`).
+- Content-addressed asset store (`--asset-store`): fingerprinted, deduplicated files; `--migrate-assets DIR`.
+- Animated GIFs → animated WebP or looping MP4/WebM + poster (`--animations`, `--convert-animations DIR`).
+- `--post`: writes the article as a site post (`src/blogs/<slug>.js` body chunk) and updates the `index.js` listing manifest.
+- `--prerender`: renders the Markdown and KaTeX to static HTML blocks at conversion time (scripts/prerenderBlogs.js).
+- `--profile`: wall time, CPU time and peak memory for every pipeline stage.
+- Batch mode (`--batch urls.txt`): fetches pages concurrently and converts them in a process pool.
 - Strips common tracking query params (utm_*, source, sk, ref, etc.).
 - Includes a lightweight self-test suite (no network) with: `python medium2md.py --self-test`
 - Friendly CLI: if no URL is supplied, shows help & examples instead of throwing a stack trace.
 
 Usage
     python medium2md.py "https://medium.com/some-article" -o out.md --images --assets-dir assets
+    python medium2md.py --batch urls.txt --out-dir posts --images --assets-dir assets
+    python medium2md.py "https://medium.com/some-article" --post --tags "Diffusion,Machine Learning" --prerender
+    python medium2md.py --convert-animations public/blogs/images/ai_girlfriend --posts-dir src/blogs
+    python medium2md.py --image-metadata public/blogs/images/*
+    python medium2md.py --migrate-assets public/blogs/images/* --asset-store public/blogs/assets
 
 Install deps
     pip install requests readability-lxml beautifulsoup4 markdownify python-dateutil
+    pip install lxml pillow   # optional: faster parsing, --transcode
 
 Note: Some Medium pages require the JSON format. This script handles normal HTML pages well.
 """
 from __future__ import annotations
 
 import argparse
+import base64
+import hashlib
+import io
+import json
+import multiprocessing
 import os
 import re
+import shutil
+import subprocess
 import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext, redirect_stderr, redirect_stdout
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from html import escape
 from pathlib import Path
 from urllib.parse import urlparse, urljoin, urlunparse, parse_qsl, urlencode
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, Tag
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore
 from dateutil import parser as dateparser
 try:
     from readability import Document
 except Exception:  # pragma: no cover - optional dependency import guard
     Document = None  # type: ignore
-from markdownify import markdownify as md
+try:
+    import lxml  # noqa: F401  (only needed as a BeautifulSoup tree builder)
+    HTML_PARSER = "lxml"
+except Exception:  # pragma: no cover - optional dependency import guard
+    HTML_PARSER = "html.parser"
+try:
+    from PIL import Image, ImageSequence
+except Exception:  # pragma: no cover - optional dependency import guard
+    Image = None  # type: ignore
+    ImageSequence = None  # type: ignore
+from markdownify import MarkdownConverter
+
+# Image variant encoder shared with scripts/optimizeImages.py
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+from imageVariants import DEFAULT_QUALITY, available_formats, encode_variants, run_pool, save_atomic  # noqa: E402
 
 HEADERS = {
     "User-Agent": (
@@ -57,6 +110,78 @@ TRACKING_PARAMS = {
     "utm_content",
 }
 
+UNWANTED_TAGS = ("script", "style", "noscript")
+
+MARKDOWN_OPTIONS = {
+    "heading_style": "ATX",
+    "bullets": "*",
+}
+# Site posts are rendered by src/blogRender.js, which never unescapes `\_` / `\*`
+POST_MARKDOWN_OPTIONS = {
+    **MARKDOWN_OPTIONS,
+    "escape_underscores": False,
+    "escape_asterisks": False,
+}
+
+DEFAULT_CACHE_DIR = ".medium_cache"
+
+DEFAULT_WORKERS = 8
+DEFAULT_JOBS = os.cpu_count() or 1
+DEFAULT_RETRIES = 3
+RETRY_BACKOFF = 0.5  # seconds, doubled after each failed attempt
+RETRY_STATUS = {429, 500, 502, 503, 504}
+CHUNK_SIZE = 64 * 1024
+
+# Transcoding (formats and quality: scripts/imageVariants.py)
+DEFAULT_WIDTHS = (480, 960, 1400)
+IMAGE_MANIFEST = "images.json"  # per assets folder, keyed by file name
+IMAGE_EXTS = {".webp", ".avif", ".png", ".jpg", ".jpeg", ".gif"}
+PLACEHOLDER_SIZE = 16  # px, longest side of the LQIP thumbnail
+PLACEHOLDER_QUALITY = 30
+
+# Animated GIF re-encoding: "webp" is a drop-in <img>; "video" writes .mp4/.webm + a .poster.webp
+ANIMATION_MODES = ("webp", "video")
+DEFAULT_PUBLIC_DIR = "public"
+DEFAULT_ASSET_URL = "/blogs/assets"
+FINGERPRINT_LEN = 16  # hex chars of sha256 kept in stored file names
+HEADERS_FILE = "_headers"  # Netlify / Cloudflare Pages style per-path response headers
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+DEFAULT_POSTS_DIR = "src/blogs"
+# Site posts: one <slug>.js body module per post plus a small manifest (index.js) for listings
+POST_MANIFEST = "index.js"
+MANIFEST_FIELDS = ("slug", "title", "date", "tags", "excerpt", "readingTime", "imageCount")
+WORDS_PER_MINUTE = 200
+EXCERPT_CHARS = 160
+# Node script that renders Markdown + KaTeX into src/blogs/prerendered/<slug>.json
+PRERENDER_SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "prerenderBlogs.js"
+
+# Characters String.raw`...` cannot hold literally (plus backslashes that would escape them)
+RAW_TEMPLATE_SPECIAL_RE = re.compile(r"\\+(?=`|\$\{|\Z)|`|\$\{")
+RAW_TEMPLATE_INTERP_RE = re.compile(r'\$\{("(?:[^"\\]|\\.)*")\}')
+POST_BODY_RE = re.compile(r"export const body = String\.raw`(.*)`;?\s*\Z", re.S)
+MANIFEST_ENTRY_RE = re.compile(r"^  (\{.*\}),?$", re.M)
+MARKDOWN_IMAGE_RE = re.compile(r"!\[([^\]]*)\]\(([^)\s]+)(?:\s+\"([^\"]*)\")?\)")
+FRONT_MATTER_RE = re.compile(r"\A---\n.*?\n---\n+", re.S)
+# ```lang fences → the {{code(lang)}} ... {{code}} blocks src/blogRender.js understands
+CODE_FENCE_RE = re.compile(r"^```([\w+-]*)\n(.*?)\n?^```$", re.M | re.S)
+
+APOLLO_STATE_RE = re.compile(r"window\.__APOLLO_STATE__\s*=\s*")
+MEDIUM_POST_ID_RE = re.compile(r"(?:^|-)([0-9a-f]{8,16})$")
+MEDIUM_IMAGE_URL = "https://miro.medium.com/v2/resize:fit:1400/{id}"
+
+# Medium paragraph type → (block tag, markups allowed)
+MEDIUM_BLOCKS = {
+    "P": ("p", True),
+    "H2": ("h1", True),
+    "H3": ("h2", True),
+    "H4": ("h3", True),
+    "BQ": ("blockquote", True),
+    "PQ": ("blockquote", True),
+    "ULI": ("li", True),
+    "OLI": ("li", True),
+}
+MEDIUM_MARKUPS = {"STRONG": "strong", "EM": "em", "CODE": "code", "A": "a"}
+
 CODE_LANG_RE = re.compile(r"\blanguage-([a-zA-Z0-9_+-]+)\b")
 
 
@@ -84,8 +209,276 @@ def strip_tracking(url: str) -> str:
         return url
 
 
-def fetch(url: str) -> tuple[str, str]:
-    resp = requests.get(url, headers=HEADERS, timeout=30)
+# ------------------------------
+# Profiling
+# ------------------------------
+
+class StageProfiler:
+    """Accumulates wall time, CPU time and peak traced memory per pipeline stage.
+
+    CPU time is process-wide, so it includes download/encode threads started by a
+    stage. Memory tracing (tracemalloc) slows Python code down noticeably; pass
+    `trace_memory=False` when only timings matter. Stages must not be nested.
+    """
+
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.stages: dict[str, dict] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        base = 0
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            rec = self.stages.setdefault(name, {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0, "peak_mb": 0.0})
+            rec["calls"] += 1
+            rec["wall_s"] += time.perf_counter() - wall
+            rec["cpu_s"] += time.process_time() - cpu
+            if self.trace_memory:
+                peak = (tracemalloc.get_traced_memory()[1] - base) / 2**20
+                rec["peak_mb"] = max(rec["peak_mb"], peak)
+
+    def report(self) -> str:
+        total = sum(r["wall_s"] for r in self.stages.values()) or 1.0
+        lines = [f"{'stage':<18}{'wall s':>10}{'cpu s':>10}{'peak MB':>10}{'share':>8}"]
+        for name, r in self.stages.items():
+            lines.append(
+                f"{name:<18}{r['wall_s']:>10.3f}{r['cpu_s']:>10.3f}{r['peak_mb']:>10.1f}{r['wall_s'] / total:>8.0%}"
+            )
+        lines.append(f"{'total':<18}{total:>10.3f}")
+        return "\n".join(lines)
+
+
+def _stage(profiler: StageProfiler | None, name: str):
+    return profiler.stage(name) if profiler is not None else nullcontext()
+
+
+# ------------------------------
+# HTTP cache
+# ------------------------------
+
+class CacheMiss(LookupError):
+    """Raised in offline mode when a URL has never been cached."""
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    content: bytes
+    content_type: str = ""
+    encoding: str | None = None
+    from_cache: bool = False
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write to a temp file in the same directory, then rename into place."""
+    ensure_dir(path.parent)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _stream_to_temp(resp, dest_dir: Path) -> tuple[Path, str]:
+    """Stream a response body into a temp file in `dest_dir`; return (path, sha256)."""
+    ensure_dir(dest_dir)
+    fd, tmp = tempfile.mkstemp(dir=dest_dir, prefix=".tmp-")
+    digest = hashlib.sha256()
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in resp.iter_content(CHUNK_SIZE):
+                digest.update(chunk)
+                f.write(chunk)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return Path(tmp), digest.hexdigest()
+
+
+def _copy_to_temp(src: Path, dest_dir: Path) -> Path:
+    ensure_dir(dest_dir)
+    fd, tmp = tempfile.mkstemp(dir=dest_dir, prefix=".tmp-")
+    os.close(fd)
+    try:
+        shutil.copyfile(src, tmp)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return Path(tmp)
+
+
+def make_session(pool_size: int = DEFAULT_WORKERS) -> requests.Session:
+    """Keep-alive session whose connection pool is large enough for `pool_size` workers."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _with_retries(fn, retries: int, *args):
+    """Call fn(*args), retrying connection errors/timeouts and 429/5xx with exponential backoff."""
+    for attempt in range(retries + 1):
+        try:
+            return fn(*args)
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            if status not in RETRY_STATUS or attempt == retries:
+                raise
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == retries:
+                raise
+        time.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+
+class HttpCache:
+    """On-disk response cache for pages and images.
+
+    Layout under `root`:
+        entries/<sha256(url)>.json   validators (ETag/Last-Modified), content-type, body digest
+        objects/<sha256(body)>       response bodies, content-addressed (identical bodies stored once)
+
+    Cached URLs are revalidated with a conditional GET; a 304 reuses the stored body.
+    With `offline=True` the network is never touched and unknown URLs raise `CacheMiss`.
+    """
+
+    def __init__(self, root: Path, offline: bool = False, session=None):
+        self.root = Path(root)
+        self.offline = offline
+        self.session = session or requests
+        self.stats = {"hits": 0, "revalidated": 0, "downloads": 0}
+        self._lock = threading.Lock()
+
+    def _bump(self, stat: str) -> None:
+        with self._lock:
+            self.stats[stat] += 1
+
+    def _entry_path(self, url: str) -> Path:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.root / "entries" / key[:2] / f"{key}.json"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / digest
+
+    def lookup_path(self, url: str) -> tuple[dict, Path] | None:
+        try:
+            entry = json.loads(self._entry_path(url).read_text(encoding="utf-8"))
+            obj = self._object_path(entry["sha256"])
+        except (OSError, ValueError, KeyError):
+            return None
+        return (entry, obj) if obj.exists() else None
+
+    def lookup(self, url: str) -> tuple[dict, bytes] | None:
+        found = self.lookup_path(url)
+        if found is None:
+            return None
+        try:
+            return found[0], found[1].read_bytes()
+        except OSError:
+            return None
+
+    def store(self, url: str, content: bytes, headers, encoding: str | None = None) -> dict:
+        digest = hashlib.sha256(content).hexdigest()
+        obj = self._object_path(digest)
+        if not obj.exists():
+            _atomic_write(obj, content)
+        return self._write_entry(url, digest, headers, encoding)
+
+    def _write_entry(self, url: str, digest: str, headers, encoding: str | None) -> dict:
+        entry = {
+            "url": url,
+            "sha256": digest,
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "content_type": headers.get("content-type", "").lower(),
+            "encoding": encoding,
+        }
+        _atomic_write(self._entry_path(url), json.dumps(entry, indent=2).encode("utf-8"))
+        return entry
+
+    @staticmethod
+    def _conditional_headers(entry: dict | None) -> dict:
+        headers = dict(HEADERS)
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def get(self, url: str, timeout: float = 30) -> CachedResponse:
+        cached = self.lookup(url)
+        if self.offline:
+            if cached is None:
+                raise CacheMiss(f"Not in cache (offline): {url}")
+            self._bump("hits")
+            return self._from_entry(url, *cached)
+
+        headers = self._conditional_headers(cached[0] if cached else None)
+        resp = self.session.get(url, headers=headers, timeout=timeout)
+        if resp.status_code == 304 and cached is not None:
+            self._bump("revalidated")
+            return self._from_entry(url, *cached)
+        resp.raise_for_status()
+
+        ct = resp.headers.get("content-type", "").lower()
+        # Only sniff the charset for text; running chardet over image bytes is wasted work
+        encoding = (resp.apparent_encoding or "utf-8") if ct.startswith("text/") or "html" in ct else None
+        self.store(url, resp.content, resp.headers, encoding)
+        self._bump("downloads")
+        return CachedResponse(url, resp.content, ct, encoding, from_cache=False)
+
+    def get_file(self, url: str, dest_dir: Path, timeout: float = 30) -> tuple[Path, str]:
+        """Like `get`, but streams the body and returns (temp file in dest_dir, content_type)."""
+        cached = self.lookup_path(url)
+        if self.offline:
+            if cached is None:
+                raise CacheMiss(f"Not in cache (offline): {url}")
+            self._bump("hits")
+            return _copy_to_temp(cached[1], dest_dir), cached[0].get("content_type") or ""
+
+        headers = self._conditional_headers(cached[0] if cached else None)
+        with self.session.get(url, headers=headers, timeout=timeout, stream=True) as resp:
+            if resp.status_code == 304 and cached is not None:
+                self._bump("revalidated")
+                return _copy_to_temp(cached[1], dest_dir), cached[0].get("content_type") or ""
+            resp.raise_for_status()
+            tmp, digest = _stream_to_temp(resp, self.root / "objects")
+            resp_headers = resp.headers
+
+        obj = self._object_path(digest)
+        ensure_dir(obj.parent)
+        os.replace(tmp, obj)
+        entry = self._write_entry(url, digest, resp_headers, None)
+        self._bump("downloads")
+        return _copy_to_temp(obj, dest_dir), entry["content_type"]
+
+    @staticmethod
+    def _from_entry(url: str, entry: dict, body: bytes) -> CachedResponse:
+        return CachedResponse(url, body, entry.get("content_type") or "", entry.get("encoding"), from_cache=True)
+
+
+def fetch(url: str, cache: HttpCache | None = None, session: requests.Session | None = None) -> tuple[str, str]:
+    if cache is not None:
+        resp = cache.get(url)
+        return resp.text, resp.content_type
+    resp = (session or requests).get(url, headers=HEADERS, timeout=30)
     resp.raise_for_status()
     ct = resp.headers.get("content-type", "").lower()
     encoding = resp.apparent_encoding or "utf-8"
@@ -93,21 +486,205 @@ def fetch(url: str) -> tuple[str, str]:
     return resp.text, ct
 
 
-def select_article_html(html: str, base_url: str) -> tuple[str, dict]:
-    """Return (article_html, meta) with meta keys: title, author, published, base_url."""
-    article_html = None
+def make_soup(html: str, parser: str | None = None) -> BeautifulSoup:
+    """Parse HTML once with the fastest available tree builder (lxml if installed)."""
+    return BeautifulSoup(html, parser or HTML_PARSER)
+
+
+# ------------------------------
+# Medium embedded JSON (fast path)
+# ------------------------------
+
+def _load_apollo_state(html: str) -> dict | None:
+    """Pull the `window.__APOLLO_STATE__ = {...}` object out of the raw page without a DOM parse."""
+    m = APOLLO_STATE_RE.search(html)
+    if not m:
+        return None
+    try:
+        state, _ = json.JSONDecoder().raw_decode(html, m.end())
+    except ValueError:
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def _deref(state: dict, value):
+    if isinstance(value, dict) and "__ref" in value:
+        return state.get(value["__ref"]) or {}
+    return value or {}
+
+
+def _find_post(state: dict, base_url: str) -> dict | None:
+    """The Post whose id matches the URL's trailing hex id, else the first Post with a body."""
+    slug = urlparse(base_url).path.rstrip("/").rsplit("/", 1)[-1]
+    m = MEDIUM_POST_ID_RE.search(slug)
+    if m and isinstance(state.get(f"Post:{m.group(1)}"), dict):
+        return state[f"Post:{m.group(1)}"]
+    for key, value in state.items():
+        if key.startswith("Post:") and isinstance(value, dict) and _post_paragraphs(state, value):
+            return value
+    return None
+
+
+def _post_paragraphs(state: dict, post: dict) -> list[dict]:
+    for key, value in post.items():
+        if key.startswith("content") and isinstance(value, dict):
+            body = _deref(state, value.get("bodyModel"))
+            return [_deref(state, p) for p in body.get("paragraphs") or []]
+    return []
+
+
+def _render_markups(text: str, markups: list[dict]) -> str:
+    """Apply Medium's offset-based inline markups to `text`, producing nested, escaped HTML."""
+    spans = []
+    for mk in markups or []:
+        tag = MEDIUM_MARKUPS.get(mk.get("type"))
+        start, end = mk.get("start", 0), mk.get("end", 0)
+        if tag and 0 <= start < end <= len(text):
+            attrs = ""
+            if tag == "a":
+                href = mk.get("href") or (f"https://medium.com/u/{mk['userId']}" if mk.get("userId") else "")
+                attrs = f' href="{escape(href)}"'
+            spans.append((start, end, tag, attrs))
+    if not spans:
+        return escape(text)
+
+    spans.sort(key=lambda sp: (sp[0], -sp[1]))
+    points = sorted({0, len(text), *(sp[0] for sp in spans), *(sp[1] for sp in spans)})
+    out: list[str] = []
+    stack: list[tuple] = []
+    pending = list(spans)
+    for pos, nxt in zip(points, points[1:] + [None]):
+        # Close everything ending here; re-open (in order) anything that was merely on top of it
+        if any(sp[1] <= pos for sp in stack):
+            reopen = []
+            while any(sp[1] <= pos for sp in stack):
+                sp = stack.pop()
+                out.append(f"</{sp[2]}>")
+                if sp[1] > pos:
+                    reopen.append(sp)
+            for sp in reversed(reopen):
+                out.append(f"<{sp[2]}{sp[3]}>")
+                stack.append(sp)
+        while pending and pending[0][0] == pos:
+            sp = pending.pop(0)
+            out.append(f"<{sp[2]}{sp[3]}>")
+            stack.append(sp)
+        if nxt is not None:
+            out.append(escape(text[pos:nxt]))
+    return "".join(out)
+
+
+def _paragraph_html(state: dict, para: dict) -> str:
+    ptype = para.get("type", "P")
+    text = para.get("text") or ""
+    if ptype == "IMG":
+        meta = _deref(state, para.get("metadata"))
+        if not meta.get("id"):
+            return ""
+        size = ""
+        if meta.get("originalWidth") and meta.get("originalHeight"):
+            size = f' width="{meta["originalWidth"]}" height="{meta["originalHeight"]}"'
+        caption = f"<figcaption>{_render_markups(text, para.get('markups'))}</figcaption>" if text else ""
+        src = MEDIUM_IMAGE_URL.format(id=meta["id"])
+        return f'<figure><img src="{escape(src)}" alt="{escape(text)}"{size}/>{caption}</figure>'
+    if ptype == "PRE":
+        lang = (_deref(state, para.get("codeBlockMetadata")).get("lang") or "").strip()
+        cls = f' class="language-{escape(lang)}"' if lang else ""
+        return f"<pre><code{cls}>{escape(text)}</code></pre>"
+    if ptype == "IFRAME":
+        media = _deref(state, _deref(state, para.get("iframe")).get("mediaResource"))
+        href = media.get("href") or media.get("iframeSrc")
+        return f'<p><a href="{escape(href)}">{escape(media.get("title") or href)}</a></p>' if href else ""
+    if ptype == "MIXTAPE_EMBED":
+        href = _deref(state, para.get("mixtapeMetadata")).get("href")
+        body = _render_markups(text, para.get("markups"))
+        return f'<p><a href="{escape(href)}">{body}</a></p>' if href else f"<p>{body}</p>"
+    tag, _ = MEDIUM_BLOCKS.get(ptype, ("p", True))
+    body = _render_markups(text, para.get("markups"))
+    if tag == "blockquote":
+        return f"<blockquote><p>{body}</p></blockquote>"
+    return f"<{tag}>{body}</{tag}>"
+
+
+def extract_from_medium_state(html: str, base_url: str, parser: str | None = None) -> tuple[Tag, dict] | None:
+    """Build (article_node, meta) from Medium's preloaded Apollo state, or None if absent.
+
+    One JSON decode replaces the page parse and Readability's scoring pass; the
+    paragraphs are rendered to a small HTML fragment so the usual DOM passes
+    (image rewriting, code fences, markdownify) apply unchanged.
+    """
+    state = _load_apollo_state(html)
+    if not state:
+        return None
+    post = _find_post(state, base_url)
+    if not post:
+        return None
+    paragraphs = _post_paragraphs(state, post)
+    if not paragraphs:
+        return None
+
+    title = (post.get("title") or "").strip()
+    # Medium repeats the title as the first heading of the body
+    if paragraphs and title and (paragraphs[0].get("text") or "").strip() == title:
+        paragraphs = paragraphs[1:]
+
+    parts: list[str] = []
+    open_list = None
+    for para in paragraphs:
+        ptype = para.get("type")
+        list_tag = {"ULI": "ul", "OLI": "ol"}.get(ptype)
+        if list_tag != open_list:
+            if open_list:
+                parts.append(f"</{open_list}>")
+            if list_tag:
+                parts.append(f"<{list_tag}>")
+            open_list = list_tag
+        parts.append(_paragraph_html(state, para))
+    if open_list:
+        parts.append(f"</{open_list}>")
+
+    published = None
+    ts = post.get("firstPublishedAt") or post.get("latestPublishedAt")
+    if isinstance(ts, (int, float)) and ts > 0:
+        published = datetime.fromtimestamp(ts / 1000, tz=timezone.utc).date().isoformat()
+
+    author = (_deref(state, post.get("creator")).get("name") or "").strip() or None
+
+    meta = {
+        "title": title or "Untitled",
+        "author": author,
+        "published": published,
+        "base_url": base_url,
+    }
+    return make_soup("<article>" + "".join(parts) + "</article>", parser), meta
+
+
+def select_article(html: str, base_url: str, parser: str | None = None) -> tuple[Tag, dict]:
+    """Return (article_node, meta) where article_node is a parsed tree ready for the DOM passes.
+
+    Medium's embedded post JSON is used when it is present and non-trivial. Otherwise
+    the page is parsed exactly once; the Readability summary (if used) is parsed once
+    more and becomes the working tree, so nothing downstream has to re-parse.
+    """
+    fast = extract_from_medium_state(html, base_url, parser)
+    if fast is not None and len(fast[0].get_text(strip=True)) >= 100:
+        return fast
+
+    article: Tag | None = None
     title = ""
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html, parser)
 
     # Prefer Readability when available
     if Document is not None:
         try:
             doc = Document(html)
-            article_html = doc.summary(html_partial=True)
+            summary = make_soup(doc.summary(html_partial=True), parser)
             title = (doc.short_title() or "").strip()
+            if len(summary.get_text(strip=True)) >= 100:
+                article = summary
         except Exception:
-            article_html = None
+            article = None
 
     # Meta title if missing or low quality
     if not title or len(title) < 3:
@@ -146,18 +723,9 @@ def select_article_html(html: str, base_url: str) -> tuple[str, dict]:
                 except Exception:
                     pass
 
-    # Fallback: try to find <article>, then <main>, else <body>
-    if not article_html or len(BeautifulSoup(article_html, "html.parser").get_text(strip=True)) < 100:
-        art = soup.find("article")
-        if art:
-            article_html = str(art)
-        else:
-            main = soup.find("main")
-            if main:
-                article_html = str(main)
-            else:
-                body = soup.find("body")
-                article_html = str(body) if body else html
+    # Fallback: try to find <article>, then <main>, else <body> (reusing the page tree)
+    if article is None:
+        article = soup.find("article") or soup.find("main") or soup.find("body") or soup
 
     meta = {
         "title": title or "Untitled",
@@ -165,7 +733,13 @@ def select_article_html(html: str, base_url: str) -> tuple[str, dict]:
         "published": published,
         "base_url": base_url,
     }
-    return article_html, meta
+    return article, meta
+
+
+def select_article_html(html: str, base_url: str) -> tuple[str, dict]:
+    """Return (article_html, meta) with meta keys: title, author, published, base_url."""
+    article, meta = select_article(html, base_url)
+    return str(article), meta
 
 
 def ensure_dir(path: Path) -> None:
@@ -183,6 +757,18 @@ def guess_filename_from_url(url: str, idx: int) -> str:
     return name
 
 
+def unique_filename(name: str, taken: set[str]) -> str:
+    """`name`, or `stem-2.ext`, `stem-3.ext`, ... if another image already uses it."""
+    stem, dot, ext = name.rpartition(".")
+    if not dot:
+        stem, ext = name, ""
+    n = 1
+    while name in taken:
+        n += 1
+        name = f"{stem}-{n}{dot}{ext}"
+    return name
+
+
 def extract_img_src(tag) -> str | None:
     """Find the best src for an <img> (handles data-src/srcset)."""
     candidates = [
@@ -204,51 +790,570 @@ def extract_img_src(tag) -> str | None:
     return None
 
 
-def download_and_rewrite_images(article_html: str, base_url: str, assets_dir: Path) -> tuple[str, list[Path]]:
-    soup = BeautifulSoup(article_html, "html.parser")
+def download_to_temp(
+    url: str,
+    dest_dir: Path,
+    session: requests.Session | None = None,
+    cache: HttpCache | None = None,
+) -> tuple[Path, str]:
+    """Stream an image into a temp file inside dest_dir; return (temp_path, content_type)."""
+    if cache is not None:
+        return cache.get_file(url, dest_dir)
+    with (session or requests).get(url, headers=HEADERS, timeout=30, stream=True) as r:
+        r.raise_for_status()
+        tmp, _ = _stream_to_temp(r, dest_dir)
+        return tmp, r.headers.get("content-type", "").lower()
+
+
+def rewrite_images(
+    soup: Tag,
+    base_url: str,
+    assets_dir: Path,
+    cache: HttpCache | None = None,
+    session: requests.Session | None = None,
+    workers: int = DEFAULT_WORKERS,
+    retries: int = DEFAULT_RETRIES,
+) -> list[Path]:
+    """Download every <img> in the tree and point it at the local copy (in place).
+
+    Downloads run on a bounded thread pool sharing one keep-alive session and stream
+    into temp files; renaming into place and rewriting `src` happen here in document
+    order, so the output does not depend on which download finishes first.
+    """
     downloaded: list[Path] = []
     ensure_dir(assets_dir)
+    session = session or make_session(workers)
 
+    jobs = []
     for idx, img in enumerate(soup.find_all("img"), start=1):
         src = extract_img_src(img)
         if not src:
             continue
         abs_url = urljoin(base_url, src)
         abs_url = strip_tracking(abs_url)
-        try:
-            r = requests.get(abs_url, headers=HEADERS, timeout=30)
-            r.raise_for_status()
-            # Try to preserve extension from content-type if unknown
-            filename = guess_filename_from_url(abs_url, idx)
-            # If no extension or generic, refine from content-type
-            ct = r.headers.get("content-type", "").lower()
-            if (filename.endswith(".png") or filename.endswith(".jpg") or filename.endswith(".jpeg") or filename.endswith(".gif")) is False:
-                if "jpeg" in ct and not filename.endswith(".jpg"):
-                    filename += ".jpg"
-                elif "png" in ct and not filename.endswith(".png"):
-                    filename += ".png"
-                elif "gif" in ct and not filename.endswith(".gif"):
-                    filename += ".gif"
-            out_path = assets_dir / filename
-            with open(out_path, "wb") as f:
-                f.write(r.content)
-            downloaded.append(out_path)
+        jobs.append((idx, img, abs_url))
+
+    placed: dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {}
+        for _, _, abs_url in jobs:
+            if abs_url not in futures:
+                futures[abs_url] = pool.submit(_with_retries, download_to_temp, retries, abs_url, assets_dir, session, cache)
+
+        for idx, img, abs_url in jobs:
+            if abs_url not in placed:
+                try:
+                    tmp, ct = futures[abs_url].result()
+                except Exception:
+                    # If download fails, keep original src
+                    continue
+                # Try to preserve extension from content-type if unknown
+                filename = guess_filename_from_url(abs_url, idx)
+                # If no extension or generic, refine from content-type
+                if (filename.endswith(".png") or filename.endswith(".jpg") or filename.endswith(".jpeg") or filename.endswith(".gif")) is False:
+                    if "jpeg" in ct and not filename.endswith(".jpg"):
+                        filename += ".jpg"
+                    elif "png" in ct and not filename.endswith(".png"):
+                        filename += ".png"
+                    elif "gif" in ct and not filename.endswith(".gif"):
+                        filename += ".gif"
+                # Different URLs can share a basename (CDN variants, image.png from two hosts)
+                filename = unique_filename(filename, set(placed.values()))
+                out_path = assets_dir / filename
+                try:
+                    os.replace(tmp, out_path)
+                except OSError:
+                    tmp.unlink(missing_ok=True)
+                    continue
+                downloaded.append(out_path)
+                placed[abs_url] = filename
             # rewrite src to local relative path
-            img["src"] = str(Path(assets_dir.name) / filename)
+            img["src"] = str(Path(assets_dir.name) / placed[abs_url])
             for attr in ["srcset", "data-src", "data-srcset", "data-original"]:
                 if img.has_attr(attr):
                     del img[attr]
-        except Exception:
-            # If download fails, keep original src
+
+    return downloaded
+
+
+# ------------------------------
+# Image transcoding
+# ------------------------------
+
+@dataclass
+class TranscodeOptions:
+    formats: tuple[str, ...] = ("webp",)
+    widths: tuple[int, ...] = DEFAULT_WIDTHS
+    quality: int = DEFAULT_QUALITY
+    jobs: int = DEFAULT_JOBS
+    keep_originals: bool = False
+
+
+def transcode_images(soup: Tag, assets_dir: Path, downloaded: list[Path], options: TranscodeOptions) -> dict:
+    """Re-encode downloaded images into responsive WebP/AVIF variants and point the tree at them.
+
+    Each <img> gets `src` = the widest variant of the first format and a `srcset`
+    for that format. Markdown keeps only `src`, so the full variant table is also
+    written to `assets_dir/images.json` (keyed by the new file name, srcset entries
+    relative to the folder) for the frontend.
+    """
+    formats = available_formats(options.formats)
+    if not formats or not downloaded:
+        return {}
+
+    # Animations converted to video (--animations video) are not images any more
+    paths = list(dict.fromkeys(str(p) for p in downloaded if Path(p).suffix.lower() in IMAGE_EXTS))
+    results = run_pool(encode_variants, paths, options.jobs, formats, tuple(options.widths), options.quality)
+
+    prefix = Path(assets_dir.name)
+    by_src: dict[str, tuple[str, str]] = {}
+    manifest: dict[str, dict] = {}
+    for p in paths:
+        info = results.get(p)
+        if not info or "variants" not in info:
             continue
+        primary = info["variants"][formats[0]][-1][0]
+        manifest[primary] = {
+            "original": Path(p).name,
+            "width": info["width"],
+            "height": info["height"],
+            "srcset": {
+                fmt: ", ".join(f"{name} {w}w" for name, w in variants)
+                for fmt, variants in info["variants"].items()
+            },
+        }
+        srcset = ", ".join(f"{prefix / name} {w}w" for name, w in info["variants"][formats[0]])
+        by_src[str(prefix / Path(p).name)] = (str(prefix / primary), srcset)
+        if not options.keep_originals:
+            Path(p).unlink(missing_ok=True)
+
+    for img in soup.find_all("img"):
+        hit = by_src.get(img.get("src", ""))
+        if hit:
+            img["src"], img["srcset"] = hit
+
+    if manifest:
+        update_image_manifest(assets_dir, manifest)
+    return manifest
 
-    return str(soup), downloaded
 
+# ------------------------------
+# Image metadata (intrinsic size + LQIP)
+# ------------------------------
 
-def normalize_codeblocks(html: str) -> str:
-    """Wrap <pre><code class="language-xyz"> into fenced code blocks for markdownify."""
-    soup = BeautifulSoup(html, "html.parser")
+def image_metadata(src: str) -> dict:
+    """Process-pool worker: intrinsic size and a ~100-300 byte base64 WebP placeholder (first frame)."""
+    with Image.open(src) as im:
+        width, height = im.size
+        has_alpha = "A" in im.getbands() or "transparency" in im.info
+        thumb = im.convert("RGBA" if has_alpha else "RGB")
+    thumb.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE), Image.Resampling.BOX)
+    buf = io.BytesIO()
+    thumb.save(buf, "WEBP", quality=PLACEHOLDER_QUALITY)
+    placeholder = "data:image/webp;base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+    return {"width": width, "height": height, "placeholder": placeholder}
+
+
+def update_image_manifest(assets_dir: Path, entries: dict[str, dict]) -> dict:
+    """Merge entries into `assets_dir/images.json`, dropping files that no longer exist.
+
+    The file is only rewritten when its content actually changes.
+    """
+    manifest_path = assets_dir / IMAGE_MANIFEST
+    old_text = ""
+    existing: dict[str, dict] = {}
+    if manifest_path.exists():
+        old_text = manifest_path.read_text(encoding="utf-8")
+        try:
+            existing = json.loads(old_text)
+        except ValueError:
+            existing = {}
+    for name, entry in entries.items():
+        existing[name] = {**existing.get(name, {}), **entry}
+    merged = {name: existing[name] for name in sorted(existing) if (assets_dir / name).is_file()}
+    new_text = json.dumps(merged, indent=2) + "\n"
+    if new_text != old_text:
+        _atomic_write(manifest_path, new_text.encode("utf-8"))
+    return merged
+
+
+def record_image_metadata(soup: Tag, assets_dir: Path, jobs: int = DEFAULT_JOBS) -> dict:
+    """Measure every local image the tree references, set width/height on its <img>, update images.json."""
+    if Image is None:
+        return {}
+    prefix = f"{assets_dir.name}/"
+    names = []
+    for img in soup.find_all("img"):
+        src = img.get("src", "")
+        name = src[len(prefix):]
+        if src.startswith(prefix) and Path(name).suffix.lower() in IMAGE_EXTS and (assets_dir / name).is_file():
+            names.append(name)
+    names = list(dict.fromkeys(names))
+    results = run_pool(image_metadata, [str(assets_dir / n) for n in names], jobs)
+    entries = {n: results[str(assets_dir / n)] for n in names if str(assets_dir / n) in results}
+
+    for img in soup.find_all("img"):
+        entry = entries.get(img.get("src", "")[len(prefix):])
+        if entry:
+            img["width"], img["height"] = str(entry["width"]), str(entry["height"])
+    return update_image_manifest(assets_dir, entries) if entries else {}
+
+
+def index_image_folders(dirs: list[Path], jobs: int = DEFAULT_JOBS) -> dict[Path, dict]:
+    """Batch pass over existing asset folders (e.g. public/blogs/images/<slug>/): write each images.json."""
+    files = [p for d in dirs for p in sorted(Path(d).iterdir()) if p.suffix.lower() in IMAGE_EXTS]
+    results = run_pool(image_metadata, [str(p) for p in files], jobs)
+    manifests: dict[Path, dict] = {}
+    for d in dirs:
+        d = Path(d)
+        entries = {p.name: results[str(p)] for p in files if p.parent == d and str(p) in results}
+        manifests[d] = update_image_manifest(d, entries)
+        print(f"{d / IMAGE_MANIFEST}: {len(entries)} images")
+    return manifests
+
+
+# ------------------------------
+# Animated GIFs
+# ------------------------------
+
+def is_animated_gif(path: Path) -> bool:
+    if Image is None:
+        return False
+    try:
+        with Image.open(path) as im:
+            return im.format == "GIF" and bool(getattr(im, "is_animated", False))
+    except Exception:
+        return False
+
+
+def _animation_outputs(path: Path, mode: str) -> list[Path]:
+    """Files written for one animation; the first is what posts should reference."""
+    if mode == "video":
+        return [path.with_suffix(".mp4"), path.with_suffix(".webm"), path.with_suffix(".poster.webp")]
+    return [path.with_suffix(".webp")]
+
+
+def _ffmpeg(args: list[str]) -> None:
+    subprocess.run(["ffmpeg", "-v", "error", "-y", *args], check=True)
+
+
+def encode_animation(src: str, mode: str = "webp", quality: int = DEFAULT_QUALITY) -> list[str]:
+    """Process-pool worker: re-encode one animated GIF; return the written file names.
+
+    "webp" keeps per-frame durations and the loop count. "video" uses ffmpeg for a
+    faststart H.264 MP4 plus a VP9 WebM, and saves the first frame as the poster.
+    Existing outputs are never overwritten.
+    """
+    path = Path(src)
+    outputs = _animation_outputs(path, mode)
+    clash = [o.name for o in outputs if o.exists()]
+    if clash:
+        raise FileExistsError(f"refusing to overwrite {', '.join(clash)}")
+
+    if mode == "video":
+        even = ["-vf", "scale=trunc(iw/2)*2:trunc(ih/2)*2", "-an"]
+        mp4, webm, poster = outputs
+        for out, codec in ((mp4, ["-c:v", "libx264", "-crf", "28", "-pix_fmt", "yuv420p", "-movflags", "+faststart"]),
+                           (webm, ["-c:v", "libvpx-vp9", "-crf", "40", "-b:v", "0"])):
+            tmp = out.with_name(f".tmp-{out.name}")
+            try:
+                _ffmpeg(["-i", str(path), *even, *codec, str(tmp)])
+                os.replace(tmp, out)
+            finally:
+                tmp.unlink(missing_ok=True)
+        with Image.open(path) as im:
+            save_atomic(im.convert("RGBA"), poster, "WEBP", quality=quality)
+        return [o.name for o in outputs]
+
+    with Image.open(path) as im:
+        frames, durations = [], []
+        for frame in ImageSequence.Iterator(im):
+            frames.append(frame.convert("RGBA"))
+            durations.append(frame.info.get("duration", im.info.get("duration", 100)))
+        loop = im.info.get("loop", 0)
+    save_atomic(
+        frames[0], outputs[0], "WEBP",
+        save_all=True, append_images=frames[1:], duration=durations, loop=loop, quality=quality, method=4,
+    )
+    return [outputs[0].name]
+
+
+def _check_animation_mode(mode: str) -> None:
+    if Image is None:
+        raise RuntimeError("animation conversion needs Pillow (pip install pillow)")
+    if mode == "video" and shutil.which("ffmpeg") is None:
+        raise RuntimeError("--animations video needs ffmpeg on PATH")
+
+
+def convert_animations(
+    soup: Tag,
+    assets_dir: Path,
+    downloaded: list[Path],
+    mode: str = "webp",
+    quality: int = DEFAULT_QUALITY,
+    jobs: int = DEFAULT_JOBS,
+    keep_originals: bool = False,
+) -> dict[Path, Path]:
+    """Re-encode animated GIFs among `downloaded` and repoint their <img> tags (in place).
+
+    Returns {old_path: new_primary_path}. Callers should swap those entries in their
+    downloaded list so later stages (transcoding) see the new files.
+    """
+    _check_animation_mode(mode)
+    gifs = [str(p) for p in dict.fromkeys(downloaded) if is_animated_gif(p)]
+    results = run_pool(encode_animation, gifs, jobs, mode, quality)
+
+    replaced: dict[Path, Path] = {}
+    prefix = Path(assets_dir.name)
+    by_src: dict[str, str] = {}
+    for g in gifs:
+        if g not in results:
+            continue
+        old, new = Path(g), Path(g).with_name(results[g][0])
+        replaced[old] = new
+        by_src[str(prefix / old.name)] = str(prefix / new.name)
+        if not keep_originals:
+            old.unlink(missing_ok=True)
+    for img in soup.find_all("img"):
+        if img.get("src") in by_src:
+            img["src"] = by_src[img["src"]]
+    return replaced
+
+
+def convert_animation_folders(
+    dirs: list[Path],
+    public_dir: Path = Path(DEFAULT_PUBLIC_DIR),
+    posts_dir: Path = Path(DEFAULT_POSTS_DIR),
+    mode: str = "webp",
+    quality: int = DEFAULT_QUALITY,
+    jobs: int = DEFAULT_JOBS,
+    keep_originals: bool = False,
+) -> dict[str, str]:
+    """Standalone pass over existing asset folders (e.g. public/blogs/images/<slug>/).
+
+    Converts every animated GIF, then rewrites `/blogs/images/<slug>/x.gif` style URLs
+    in the post modules under `posts_dir`. Returns {old_url: new_url}.
+    """
+    _check_animation_mode(mode)
+    gifs = [str(p) for d in dirs for p in sorted(Path(d).glob("*.gif")) if is_animated_gif(p)]
+    results = run_pool(encode_animation, gifs, jobs, mode, quality)
+
+    public_root = public_dir.resolve()
+    renames: dict[str, str] = {}
+    for g in gifs:
+        if g not in results:
+            continue
+        old = Path(g)
+        new = old.with_name(results[g][0])
+        try:
+            old_url = "/" + old.resolve().relative_to(public_root).as_posix()
+            new_url = "/" + new.resolve().relative_to(public_root).as_posix()
+        except ValueError:
+            old_url, new_url = old.name, new.name
+        renames[old_url] = new_url
+        print(f"{old} ({old.stat().st_size // 1024} KB) → {new.name} ({new.stat().st_size // 1024} KB)")
+        if not keep_originals:
+            old.unlink()
+
+    if renames:
+        rewrite_post_references(posts_dir, renames)
+    return renames
+
+
+def rewrite_post_references(posts_dir: Path, renames: dict[str, str]) -> list[Path]:
+    """Replace asset URLs in every post module under posts_dir; only touched files are rewritten.
+
+    Only whole URLs are replaced (bounded by `(`, quotes, whitespace or `/` on the left), so
+    renaming `4.gif` leaves `14.gif` and `24.gif` alone.
+    """
+    if not renames:
+        return []
+    alternatives = "|".join(re.escape(u) for u in sorted(renames, key=len, reverse=True))
+    url_re = re.compile(rf"""(?<![^\s("'/])(?:{alternatives})(?=[\s)"',?#]|$)""", re.M)
+    changed: list[Path] = []
+    for post in sorted(Path(posts_dir).glob("*.js")):
+        text = post.read_text(encoding="utf-8")
+        new_text = url_re.sub(lambda m: renames[m.group(0)], text)
+        if new_text != text:
+            _atomic_write(post, new_text.encode("utf-8"))
+            changed.append(post)
+            print(f"Updated references in {post}")
+    return changed
+
+
+# ------------------------------
+# Content-addressed asset store
+# ------------------------------
+
+def fingerprint(path: Path) -> str:
+    """`<sha256 prefix><ext>` for a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return f"{digest.hexdigest()[:FINGERPRINT_LEN]}{path.suffix.lower()}"
+
+
+def _rename_srcset(srcset: str, names: dict[str, str]) -> str:
+    parts = []
+    for candidate in srcset.split(","):
+        bits = candidate.strip().split()
+        if bits:
+            bits[0] = names.get(bits[0], bits[0])
+            parts.append(" ".join(bits))
+    return ", ".join(parts)
+
+
+class AssetStore:
+    """Flat directory of images named by content hash, shared by every post.
+
+    Identical files from different posts are stored once, names never collide,
+    and because a name can only ever refer to one content the host may serve
+    the directory with immutable, year-long cache headers. The store keeps a
+    single images.json (same format as the per-post one) keyed by stored name.
+    """
+
+    def __init__(self, root: Path, url_prefix: str = DEFAULT_ASSET_URL):
+        self.root = Path(root)
+        self.url_prefix = url_prefix.rstrip("/")
+
+    def url(self, name: str) -> str:
+        return f"{self.url_prefix}/{name}"
+
+    def add(self, path: Path, move: bool = True) -> str:
+        """Store a file by content; returns its fingerprinted name. Duplicates are dropped."""
+        name = fingerprint(path)
+        dest = self.root / name
+        if dest.exists():
+            if move:
+                path.unlink()
+        elif move:
+            ensure_dir(self.root)
+            shutil.move(str(path), dest)
+        else:
+            tmp = _copy_to_temp(path, self.root)
+            os.replace(tmp, dest)
+        return name
+
+    def merge_manifest(self, entries: dict[str, dict]) -> dict:
+        """update_image_manifest under an exclusive lock (batch workers share the store)."""
+        ensure_dir(self.root)
+        # Lock file lives outside the store so it never gets deployed with public/
+        key = hashlib.sha256(str(self.root.resolve()).encode("utf-8")).hexdigest()[:FINGERPRINT_LEN]
+        with open(Path(tempfile.gettempdir()) / f"medium2md-store-{key}.lock", "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            return update_image_manifest(self.root, entries)
+
+    def ensure_cache_headers(self, public_dir: Path) -> None:
+        """Add an immutable Cache-Control rule for the store to public/_headers (if not present)."""
+        rule = f"{self.url_prefix}/*"
+        path = Path(public_dir) / HEADERS_FILE
+        text = path.read_text(encoding="utf-8") if path.exists() else ""
+        if rule in text.split():
+            return
+        block = f"{rule}\n  Cache-Control: {IMMUTABLE_CACHE}\n"
+        _atomic_write(path, ((text.rstrip("\n") + "\n\n") if text.strip() else "").encode("utf-8") + block.encode("utf-8"))
+
+    def _absorb_folder_manifest(self, folder: Path, names: dict[str, str]) -> None:
+        """Carry a per-post images.json over to the store, translated to stored names."""
+        manifest_path = folder / IMAGE_MANIFEST
+        if not manifest_path.exists():
+            return
+        try:
+            old = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except ValueError:
+            old = {}
+        entries = {}
+        for name, entry in old.items():
+            if name not in names:
+                continue
+            entry = dict(entry)
+            if isinstance(entry.get("srcset"), dict):
+                entry["srcset"] = {fmt: _rename_srcset(v, names) for fmt, v in entry["srcset"].items()}
+            entries[names[name]] = entry
+        if entries:
+            self.merge_manifest(entries)
+        manifest_path.unlink()
+
+
+def store_assets(soup: Tag, assets_dir: Path, store: AssetStore) -> dict[str, str]:
+    """Move every local image the tree references into the store and point src/srcset at it.
+
+    Returns {old_local_name: stored_name}. The per-post images.json is folded into
+    the store's manifest and the (now empty) assets_dir is removed.
+    """
+    prefix = f"{assets_dir.name}/"
+    names: dict[str, str] = {}
+
+    def local(ref: str) -> str | None:
+        if ref.startswith(prefix) and (assets_dir / ref[len(prefix):]).is_file():
+            return ref[len(prefix):]
+        return None
+
+    refs = []
+    for img in soup.find_all("img"):
+        refs.append(img.get("src", ""))
+        refs.extend(c.strip().split()[0] for c in (img.get("srcset") or "").split(",") if c.strip())
+    for ref in refs:
+        name = local(ref)
+        if name and name not in names:
+            names[name] = store.add(assets_dir / name)
+
+    urls = {prefix + old: store.url(new) for old, new in names.items()}
+    for img in soup.find_all("img"):
+        if img.get("src") in urls:
+            img["src"] = urls[img["src"]]
+        if img.get("srcset"):
+            img["srcset"] = _rename_srcset(img["srcset"], urls)
+
+    store._absorb_folder_manifest(assets_dir, names)
+    try:
+        assets_dir.rmdir()
+    except OSError:
+        pass
+    return names
+
+
+def migrate_asset_folders(
+    dirs: list[Path],
+    store: AssetStore,
+    public_dir: Path = Path(DEFAULT_PUBLIC_DIR),
+    posts_dir: Path = Path(DEFAULT_POSTS_DIR),
+) -> dict[str, str]:
+    """Move existing public/blogs/images/<slug>/ files into the store and rewrite post URLs.
+
+    Returns {old_url: new_url}. Folders are removed once empty.
+    """
+    public_root = public_dir.resolve()
+    renames: dict[str, str] = {}
+    for d in dirs:
+        d = Path(d)
+        names: dict[str, str] = {}
+        for p in sorted(d.iterdir()):
+            if p.suffix.lower() not in IMAGE_EXTS or not p.is_file():
+                continue
+            try:
+                old_url = "/" + p.resolve().relative_to(public_root).as_posix()
+            except ValueError:
+                old_url = p.name
+            names[p.name] = store.add(p)
+            renames[old_url] = store.url(names[p.name])
+        store._absorb_folder_manifest(d, names)
+        print(f"{d}: {len(names)} files → {store.root}")
+        try:
+            d.rmdir()
+        except OSError:
+            pass
+
+    if renames:
+        rewrite_post_references(posts_dir, renames)
+        store.ensure_cache_headers(public_dir)
+    return renames
 
+
+def fence_codeblocks(soup: Tag) -> None:
+    """Replace <pre><code class="language-xyz"> with fenced code text (in place)."""
     for pre in soup.find_all("pre"):
         code = pre.find("code")
         if code:
@@ -259,23 +1364,50 @@ def normalize_codeblocks(html: str) -> str:
                 lang = m.group(1)
             contents = code.get_text()
             fence = f"```{lang or ''}\n{contents}\n```"
-            pre.replace_with(soup.new_string(fence))
         else:
             contents = pre.get_text()
             fence = f"```\n{contents}\n```"
-            pre.replace_with(soup.new_string(fence))
-
-    return str(soup)
+        pre.replace_with(fence)
 
 
-def _preclean_html(html: str) -> str:
+def strip_unwanted(soup: Tag) -> None:
     """Remove unsafe/irrelevant tags before markdownify so we can avoid
     passing both `strip` and `convert` (which raises ValueError in markdownify).
     """
-    soup = BeautifulSoup(html, "html.parser")
-    for tag_name in ("script", "style", "noscript"):
-        for t in soup.find_all(tag_name):
-            t.decompose()
+    for t in soup.find_all(UNWANTED_TAGS):
+        t.decompose()
+
+
+def code_language(pre: Tag) -> str | None:
+    """markdownify `code_language_callback`: the language-xyz class of a <pre>/<code>."""
+    code = pre.find("code") or pre
+    m = CODE_LANG_RE.search(" ".join(code.get("class", [])))
+    return m.group(1) if m else None
+
+
+def soup_to_markdown(soup: Tag, options: dict = MARKDOWN_OPTIONS) -> str:
+    """Convert an already-parsed tree to Markdown without serializing it back to HTML."""
+    strip_unwanted(soup)
+    return MarkdownConverter(**options).convert_soup(soup)
+
+
+def download_and_rewrite_images(article_html: str, base_url: str, assets_dir: Path) -> tuple[str, list[Path]]:
+    soup = make_soup(article_html)
+    downloaded = rewrite_images(soup, base_url, assets_dir)
+    return str(soup), downloaded
+
+
+def normalize_codeblocks(html: str) -> str:
+    """Wrap <pre><code class="language-xyz"> into fenced code blocks for markdownify."""
+    soup = make_soup(html)
+    fence_codeblocks(soup)
+    return str(soup)
+
+
+def _preclean_html(html: str) -> str:
+    """String-in/string-out wrapper around `strip_unwanted`."""
+    soup = make_soup(html)
+    strip_unwanted(soup)
     return str(soup)
 
 
@@ -286,12 +1418,7 @@ def html_to_markdown(html: str) -> str:
     passed together. We pre-clean unwanted tags instead, and only specify
     formatting options here.
     """
-    cleaned = _preclean_html(html)
-    return md(
-        cleaned,
-        heading_style="ATX",
-        bullets="*",
-    )
+    return soup_to_markdown(make_soup(html))
 
 
 def _yaml_escape(s: str) -> str:
@@ -315,31 +1442,445 @@ def build_front_matter(meta: dict, include_yaml: bool) -> str:
     return "\n".join(lines)
 
 
-def convert(url: str, out_path: Path, download_images: bool, assets_dir: Path, include_yaml: bool) -> None:
-    html, _ = fetch(url)
-    article_html, meta = select_article_html(html, url)
-
-    # Clean/normalize before conversion
+def slugify(title: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9\-]+", "-", (title or "Untitled").strip()).strip("-").lower() or "medium-article"
+
+
+def article_to_markdown(
+    article: Tag,
+    meta: dict,
+    download_images: bool,
+    assets_dir: Path,
+    include_yaml: bool,
+    cache: HttpCache | None = None,
+    session: requests.Session | None = None,
+    workers: int = DEFAULT_WORKERS,
+    transcode: TranscodeOptions | None = None,
+    animations: str | None = None,
+    store: AssetStore | None = None,
+    profiler: StageProfiler | None = None,
+    post: bool = False,
+) -> tuple[str, list[Path]]:
+    """Run the DOM passes over a selected article and return (final_markdown, downloaded_images).
+
+    With `post`, the Markdown is meant for a site post: nothing is backslash-escaped and
+    <pre> blocks are left to markdownify, which keeps their indentation.
+    """
+    downloaded: list[Path] = []
     if download_images:
-        article_html, downloaded = download_and_rewrite_images(article_html, url, assets_dir)
-        if downloaded:
-            print(f"Downloaded {len(downloaded)} images to {assets_dir}")
+        with _stage(profiler, "download_images"):
+            downloaded = rewrite_images(article, meta["base_url"], assets_dir, cache, session, workers)
+        if animations:
+            jobs = transcode.jobs if transcode is not None else DEFAULT_JOBS
+            keep = transcode.keep_originals if transcode is not None else False
+            with _stage(profiler, "animations"):
+                replaced = convert_animations(article, assets_dir, downloaded, animations, jobs=jobs, keep_originals=keep)
+            downloaded = [replaced.get(p, p) for p in downloaded]
+        if transcode is not None:
+            with _stage(profiler, "transcode"):
+                transcode_images(article, assets_dir, downloaded, transcode)
+        with _stage(profiler, "image_metadata"):
+            record_image_metadata(article, assets_dir, transcode.jobs if transcode is not None else 1)
+        if store is not None:
+            with _stage(profiler, "asset_store"):
+                store_assets(article, assets_dir, store)
+
+    if not post:
+        with _stage(profiler, "fence_codeblocks"):
+            fence_codeblocks(article)
+
+    with _stage(profiler, "markdown"):
+        if post:
+            md_body = soup_to_markdown(article, {**POST_MARKDOWN_OPTIONS, "code_language_callback": code_language})
+        else:
+            md_body = soup_to_markdown(article)
+
+        # Post-process: collapse >3 blank lines, trim spaces
+        md_body = re.sub(r"\n{3,}", "\n\n", md_body).strip() + "\n"
+
+        fm = build_front_matter(meta, include_yaml)
+        title_h1 = f"# {meta.get('title','Untitled')}\n\n" if not include_yaml else ""
+
+    return f"{fm}{title_h1}{md_body}", downloaded
+
+
+def convert(
+    url: str,
+    out_path: Path | None,
+    download_images: bool,
+    assets_dir: Path,
+    include_yaml: bool,
+    cache: HttpCache | None = None,
+    html: str | None = None,
+    session: requests.Session | None = None,
+    workers: int = DEFAULT_WORKERS,
+    transcode: TranscodeOptions | None = None,
+    animations: str | None = None,
+    store: AssetStore | None = None,
+    profiler: StageProfiler | None = None,
+    posts_dir: Path | None = None,
+    tags: list[str] | None = None,
+) -> Path:
+    """Convert one article to `out_path` (default: <title slug>.md), or to a site post under
+    `posts_dir` when given; returns the written path."""
+    if html is None:
+        with _stage(profiler, "fetch"):
+            html, _ = fetch(url, cache, session)
+
+    # Parse once; every stage below mutates the same tree
+    with _stage(profiler, "select_article"):
+        article, meta = select_article(html, url)
+
+    final_md, downloaded = article_to_markdown(
+        article, meta, download_images, assets_dir, include_yaml, cache, session, workers, transcode, animations, store,
+        profiler, post=posts_dir is not None,
+    )
+    if downloaded:
+        print(f"Downloaded {len(downloaded)} images to {assets_dir}")
+
+    with _stage(profiler, "write"):
+        if posts_dir is not None:
+            body = post_body(final_md, meta)
+            entry = post_entry(meta, body, tags)
+            out_path = write_post_module(posts_dir, entry["slug"], body)
+            add_posts(posts_dir, [entry])
+        else:
+            if out_path is None:
+                out_path = Path(f"{slugify(meta.get('title', 'Untitled'))}.md")
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            out_path.write_text(final_md, encoding="utf-8")
+    print(f"Saved → {out_path}")
+    return out_path
 
-    article_html = normalize_codeblocks(article_html)
 
-    md_body = html_to_markdown(article_html)
+# ------------------------------
+# Site posts (body modules + manifest)
+# ------------------------------
 
-    # Post-process: collapse >3 blank lines, trim spaces
-    md_body = re.sub(r"\n{3,}", "\n\n", md_body).strip() + "\n"
+def js_raw_template(text: str) -> str:
+    """`text` as a String.raw template literal; backticks and `${` become interpolations."""
+    return "String.raw`" + RAW_TEMPLATE_SPECIAL_RE.sub(lambda m: "${" + json.dumps(m.group(0)) + "}", text) + "`"
 
-    fm = build_front_matter(meta, include_yaml)
-    title_h1 = f"# {meta.get('title','Untitled')}\n\n" if not include_yaml else ""
 
-    final_md = f"{fm}{title_h1}{md_body}"
+def read_post_body(path: Path) -> str:
+    match = POST_BODY_RE.search(path.read_text(encoding="utf-8"))
+    if not match:
+        raise ValueError(f"{path} is not a post body module")
+    return RAW_TEMPLATE_INTERP_RE.sub(lambda m: json.loads(m.group(1)), match.group(1))
 
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(final_md, encoding="utf-8")
-    print(f"Saved → {out_path}")
+
+def write_post_module(posts_dir: Path, slug: str, body: str) -> Path:
+    path = Path(posts_dir) / f"{slug}.js"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"export const body = {js_raw_template(body)}\n", encoding="utf-8")
+    return path
+
+
+def post_stats(body: str) -> dict:
+    """Listing stats derived from a body: reading time (minutes) and image count."""
+    words = len(re.findall(r"\S+", body))
+    images = sum(1 for line in body.splitlines() if MARKDOWN_IMAGE_RE.search(line))
+    return {"readingTime": max(1, round(words / WORDS_PER_MINUTE)), "imageCount": images}
+
+
+def post_excerpt(body: str, limit: int = EXCERPT_CHARS) -> str:
+    """First prose paragraph of a Markdown body as plain text, cut at a word boundary."""
+    for para in re.split(r"\n\s*\n", body):
+        para = para.strip()
+        if not para or para.startswith(("#", "!", "```", "$$", "Note:", ">", "|")):
+            continue
+        text = re.sub(r"\[([^\]]*)\]\([^)]*\)", r"\1", para)
+        text = re.sub(r"[*_`]+", "", " ".join(text.split()))
+        if len(text) <= limit:
+            return text
+        return text[:limit].rsplit(" ", 1)[0].rstrip(",.;:") + "…"
+    return ""
+
+
+def read_post_manifest(posts_dir: Path) -> list[dict]:
+    try:
+        text = (Path(posts_dir) / POST_MANIFEST).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return []
+    return [json.loads(m) for m in MANIFEST_ENTRY_RE.findall(text)]
+
+
+def write_post_manifest(posts_dir: Path, entries: list[dict]) -> Path:
+    """Regenerate <posts_dir>/index.js: listing metadata inline, bodies behind dynamic imports.
+
+    Stats are recomputed from each body module, so hand edits to a body are picked up.
+    Entries whose module no longer exists are dropped.
+    """
+    posts_dir = Path(posts_dir)
+    rows = []
+    for entry in entries:
+        module = posts_dir / f"{entry['slug']}.js"
+        if not module.exists():
+            continue
+        entry = {**entry, **post_stats(read_post_body(module))}
+        rows.append({field: entry.get(field) for field in MANIFEST_FIELDS})
+    lines = [
+        "// Generated by src/blogs/medium_to_markdown.py from the <slug>.js body modules.",
+        "// Listing metadata lives here; titles, tags and excerpts may be edited by hand.",
+        "export const posts = [",
+        *(f"  {json.dumps(row, ensure_ascii=False)}," for row in rows),
+        "]",
+        "",
+        "// Each body is its own chunk, fetched only when the post is opened",
+        "const bodies = {",
+        *(f"  {json.dumps(row['slug'])}: () => import('./{row['slug']}.js')," for row in rows),
+        "}",
+        "",
+        "export const loadPostBody = (slug) =>",
+        "  bodies[slug] ? bodies[slug]().then((module) => module.body) : Promise.resolve(null)",
+        "",
+    ]
+    path = posts_dir / POST_MANIFEST
+    path.write_text("\n".join(lines), encoding="utf-8")
+    return path
+
+
+def post_entry(meta: dict, body: str, tags: list[str] | None = None) -> dict:
+    return {
+        "slug": slugify(meta.get("title", "Untitled")),
+        "title": meta.get("title") or "Untitled",
+        "date": meta.get("published") or datetime.now(timezone.utc).date().isoformat(),
+        "tags": list(tags or []),
+        "excerpt": post_excerpt(body),
+    }
+
+
+def post_body(final_md: str, meta: dict) -> str:
+    """Post module body for converted Markdown: no front matter, a source note on top and
+    code fences turned into {{code(lang)}} blocks."""
+    body = FRONT_MATTER_RE.sub("", final_md, count=1).strip()
+    body = CODE_FENCE_RE.sub(lambda m: f"{{{{code({m.group(1) or 'text'})}}}}\n{m.group(2)}\n{{{{code}}}}", body)
+    source = strip_tracking(meta.get("base_url", ""))
+    note = f"Note: Imported from [medium]({source})\n\n" if source else ""
+    return f"{note}{body}\n"
+
+
+def add_posts(posts_dir: Path, new_entries: list[dict]) -> Path:
+    """Merge entries into the manifest: new slugs go first (newest), known slugs keep
+    their position and hand-edited tags/excerpt."""
+    manifest = read_post_manifest(posts_dir)
+    by_slug = {e["slug"]: e for e in manifest}
+    fresh = []
+    for entry in new_entries:
+        old = by_slug.get(entry["slug"])
+        if old is None:
+            fresh.append(entry)
+        else:
+            old.update({k: v for k, v in entry.items() if k not in ("tags", "excerpt") or not old.get(k)})
+    return write_post_manifest(posts_dir, fresh + manifest)
+
+
+def prerender_markdown(paths: list[Path]) -> None:
+    """Render converted posts to static HTML blocks (KaTeX included) with scripts/prerenderBlogs.js.
+
+    With no paths the script renders every post in the site manifest (unchanged ones are skipped).
+    """
+    if shutil.which("node") is None:
+        raise RuntimeError("--prerender needs Node.js (and `npm install` for katex)")
+    subprocess.run(["node", str(PRERENDER_SCRIPT), *map(str, paths)], check=True)
+
+
+# ------------------------------
+# Batch mode
+# ------------------------------
+
+def read_url_list(path: Path) -> list[str]:
+    """Read article URLs from a text file (one per line, `#` comments allowed)
+    or from an HTML reading-list export (every <a href>). Duplicates are dropped."""
+    text = path.read_text(encoding="utf-8")
+    if path.suffix.lower() in (".html", ".htm"):
+        candidates = [a["href"] for a in make_soup(text).find_all("a", href=True)]
+    else:
+        candidates = [line.strip() for line in text.splitlines()]
+
+    urls: list[str] = []
+    seen: set[str] = set()
+    for c in candidates:
+        if not c.startswith(("http://", "https://")):
+            continue
+        c = strip_tracking(c)
+        if c not in seen:
+            seen.add(c)
+            urls.append(c)
+    return urls
+
+
+def claim_slug(claims, lock, slug: str, url: str) -> str:
+    """Reserve `slug` for `url` in a batch, or `slug-2`, `slug-3`, ... if another article
+    already took it, so articles with the same title never overwrite each other."""
+    with lock:
+        candidate, n = slug, 1
+        while claims.get(candidate, url) != url:
+            n += 1
+            candidate = f"{slug}-{n}"
+        claims[candidate] = url
+    return candidate
+
+
+def _convert_fetched(job: dict) -> dict:
+    """Process-pool worker: parse, (download images,) markdownify and write one fetched article."""
+    start = time.perf_counter()
+    result = {"url": job["url"], "out": None, "images": 0, "convert_s": 0.0, "error": None}
+    profiler = StageProfiler(trace_memory=False) if job["profile"] else None
+    try:
+        session = make_session(job["workers"])
+        cache = None
+        if job["cache_dir"]:
+            cache = HttpCache(Path(job["cache_dir"]), offline=job["offline"], session=session)
+
+        with _stage(profiler, "select_article"):
+            article, meta = select_article(job["html"], job["url"])
+        slug = claim_slug(job["claims"], job["claim_lock"], slugify(meta["title"]), job["url"])
+        final_md, downloaded = article_to_markdown(
+            article,
+            meta,
+            job["download_images"],
+            Path(job["assets_dir"]) / slug,
+            job["include_yaml"],
+            cache,
+            session,
+            job["workers"],
+            job["transcode"],
+            job["animations"],
+            job["store"],
+            profiler,
+            post=bool(job["posts_dir"]),
+        )
+        with _stage(profiler, "write"):
+            if job["posts_dir"]:
+                # The parent merges the manifest once, so workers never write index.js concurrently
+                body = post_body(final_md, meta)
+                result["post"] = {**post_entry(meta, body, job["tags"]), "slug": slug}
+                out_path = write_post_module(Path(job["posts_dir"]), slug, body)
+            else:
+                out_path = Path(job["out_dir"]) / f"{slug}.md"
+                out_path.parent.mkdir(parents=True, exist_ok=True)
+                out_path.write_text(final_md, encoding="utf-8")
+        result.update(out=str(out_path), images=len(downloaded))
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["convert_s"] = round(time.perf_counter() - start, 3)
+    if profiler is not None:
+        result["stages"] = {name: round(r["wall_s"], 4) for name, r in profiler.stages.items()}
+    return result
+
+
+def convert_batch(
+    urls: list[str],
+    out_dir: Path,
+    download_images: bool,
+    assets_dir: Path,
+    include_yaml: bool,
+    cache_dir: Path | None = None,
+    offline: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    jobs: int = DEFAULT_JOBS,
+    transcode: TranscodeOptions | None = None,
+    animations: str | None = None,
+    store: AssetStore | None = None,
+    profile: bool = False,
+    posts_dir: Path | None = None,
+    tags: list[str] | None = None,
+) -> dict:
+    """Convert many articles in one run.
+
+    Pages are fetched on a thread pool; each page is handed to a process pool as soon
+    as it arrives, so parsing/markdownify of one article overlaps the downloads of the
+    next. Images for an article are downloaded inside its worker (assets go to
+    `assets_dir/<slug>/`); transcoding/animation encodes run inline in that worker since the article
+    pool already occupies the cores. Articles whose titles give the same slug get `-2`, `-3`
+    suffixes instead of overwriting each other. With `posts_dir`, articles become site posts and the
+    manifest is updated once at the end. Returns a summary dict (also written to `out_dir/batch_summary.json`).
+    """
+    start = time.perf_counter()
+    session = make_session(workers)
+    cache = HttpCache(cache_dir, offline=offline, session=session) if cache_dir else None
+
+    if transcode is not None:
+        transcode = TranscodeOptions(**{**transcode.__dict__, "jobs": 1})
+
+    results: list[dict] = []
+    fetch_times: dict[str, float] = {}
+
+    def timed_fetch(url: str) -> str:
+        t0 = time.perf_counter()
+        try:
+            return fetch(url, cache, session)[0]
+        finally:
+            fetch_times[url] = round(time.perf_counter() - t0, 3)
+
+    # Slugs are only known once a worker has parsed its page; workers claim them here
+    manager = multiprocessing.Manager()
+    claims, claim_lock = manager.dict(), manager.Lock()
+
+    with manager, ThreadPoolExecutor(max_workers=max(1, workers)) as fetchers, ProcessPoolExecutor(max_workers=max(1, jobs)) as converters:
+        fetches = {fetchers.submit(_with_retries, timed_fetch, DEFAULT_RETRIES, url): url for url in urls}
+        conversions = []
+        for fut in as_completed(fetches):
+            url = fetches[fut]
+            try:
+                html = fut.result()
+            except Exception as e:
+                results.append({"url": url, "out": None, "images": 0, "convert_s": 0.0, "error": f"fetch: {type(e).__name__}: {e}"})
+                continue
+            conversions.append(converters.submit(_convert_fetched, {
+                "url": url,
+                "html": html,
+                "out_dir": str(out_dir),
+                "assets_dir": str(assets_dir),
+                "download_images": download_images,
+                "include_yaml": include_yaml,
+                "cache_dir": str(cache_dir) if cache_dir else None,
+                "offline": offline,
+                "workers": workers,
+                "transcode": transcode,
+                "animations": animations,
+                "store": store,
+                "profile": profile,
+                "posts_dir": str(posts_dir) if posts_dir else None,
+                "tags": tags,
+                "claims": claims,
+                "claim_lock": claim_lock,
+            }))
+        for fut in as_completed(conversions):
+            results.append(fut.result())
+
+    order = {u: i for i, u in enumerate(urls)}
+    results.sort(key=lambda r: order[r["url"]])
+    for r in results:
+        r["fetch_s"] = fetch_times.get(r["url"])
+    if posts_dir is not None:
+        add_posts(posts_dir, [r["post"] for r in results if r.get("post")])
+
+    summary = {
+        "total": len(urls),
+        "converted": sum(1 for r in results if not r["error"]),
+        "failed": sum(1 for r in results if r["error"]),
+        "wall_s": round(time.perf_counter() - start, 3),
+        "articles": results,
+    }
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / "batch_summary.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    return summary
+
+
+def print_batch_summary(summary: dict) -> None:
+    for r in summary["articles"]:
+        if r["error"]:
+            print(f"[FAILED] {r['url']}\n         {r['error']}")
+        else:
+            print(f"[OK] {r['out']}  (fetch {r['fetch_s']}s, convert {r['convert_s']}s, {r['images']} images)")
+            if r.get("stages"):
+                print("     " + ", ".join(f"{name} {sec}s" for name, sec in r["stages"].items()))
+    print(
+        f"\nConverted {summary['converted']}/{summary['total']} articles in {summary['wall_s']}s"
+        f" ({summary['failed']} failed)"
+    )
 
 
 # ------------------------------
@@ -391,6 +1932,222 @@ def _run_self_tests() -> int:
     md_clean = html_to_markdown(dirty)
     assert "alert(1)" not in md_clean and "no" not in md_clean and "Body" in md_clean and "## Head" in md_clean
 
+    # HttpCache: offline miss, offline replay, and 304 revalidation (fake session, no network)
+    class _FakeResp:
+        def __init__(self, status_code: int):
+            self.status_code = status_code
+            self.headers: dict = {}
+
+    class _FakeSession:
+        def __init__(self):
+            self.sent: list[dict] = []
+
+        def get(self, url, headers=None, timeout=None):
+            self.sent.append(headers or {})
+            return _FakeResp(304)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        offline = HttpCache(Path(tmp), offline=True)
+        try:
+            offline.get("https://e/x")
+            raise AssertionError("expected CacheMiss")
+        except CacheMiss:
+            pass
+        offline.store("https://e/x", b"<p>cached</p>", {"etag": '"v1"', "content-type": "text/html"}, "utf-8")
+        assert fetch("https://e/x", offline)[0] == "<p>cached</p>"
+
+        session = _FakeSession()
+        online = HttpCache(Path(tmp), session=session)
+        resp = online.get("https://e/x")
+        assert resp.from_cache and resp.content == b"<p>cached</p>"
+        assert session.sent[0]["If-None-Match"] == '"v1"' and online.stats["revalidated"] == 1
+
+    # rewrite_images: two URLs with the same basename get separate files
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = HttpCache(Path(tmp) / "cache", offline=True)
+        cache.store("https://a.example/image.png", b"first", {"content-type": "image/png"})
+        cache.store("https://b.example/image.png", b"second", {"content-type": "image/png"})
+        tree = make_soup('<p><img src="https://a.example/image.png"/><img src="https://b.example/image.png"/>'
+                         '<img src="https://a.example/image.png"/></p>')
+        got = rewrite_images(tree, "https://m/x", Path(tmp) / "post", cache, workers=2)
+        assert [p.name for p in got] == ["image.png", "image-2.png"]
+        assert [p.read_bytes() for p in got] == [b"first", b"second"]
+        assert [img["src"] for img in tree.find_all("img")] == ["post/image.png", "post/image-2.png", "post/image.png"]
+
+    # read_url_list: text list with comments/duplicates/tracking params
+    with tempfile.TemporaryDirectory() as tmp:
+        lst = Path(tmp) / "urls.txt"
+        lst.write_text("# reading list\nhttps://m/a?source=x\n\nhttps://m/a\nnot-a-url\nhttps://m/b\n", encoding="utf-8")
+        assert read_url_list(lst) == ["https://m/a", "https://m/b"]
+
+    # convert_batch: articles with the same title get distinct slugs instead of overwriting
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = HttpCache(Path(tmp) / "cache")
+        urls = [f"https://m/same-{i}" for i in range(3)]
+        for i, u in enumerate(urls):
+            page = f"<html><head><title>Same</title></head><body><article><p>{'Article %d. ' % i * 20}</p></article></body></html>"
+            cache.store(u, page.encode("utf-8"), {"content-type": "text/html"}, "utf-8")
+        summary = convert_batch(urls, Path(tmp) / "out", False, Path(tmp) / "assets", True,
+                                cache_dir=Path(tmp) / "cache", offline=True, workers=2, jobs=2)
+        outs = sorted(Path(r["out"]).name for r in summary["articles"])
+        assert summary["converted"] == 3 and outs == ["same-2.md", "same-3.md", "same.md"], summary
+        assert len({(Path(tmp) / "out" / name).read_text() for name in outs}) == 3
+
+    # extract_from_medium_state: Apollo JSON → same tree shape as the HTML path
+    state = {
+        "Post:abc123def456": {
+            "title": "My Post",
+            "firstPublishedAt": 1678665600000,
+            "creator": {"__ref": "User:u1"},
+            "content({})": {"bodyModel": {"paragraphs": [{"__ref": f"Paragraph:{i}"} for i in range(7)]}},
+        },
+        "User:u1": {"name": "Gabriel"},
+        "ImageMetadata:img.png": {"id": "img.png", "originalWidth": 800, "originalHeight": 600},
+        "Paragraph:0": {"type": "H3", "text": "My Post", "markups": []},
+        "Paragraph:1": {"type": "P", "text": "Read the paper here for the details of everything in this post, really. It covers the full derivation.",
+                        "markups": [{"type": "A", "start": 15, "end": 19, "href": "https://arxiv.org"},
+                                    {"type": "STRONG", "start": 9, "end": 23}]},
+        "Paragraph:2": {"type": "IMG", "text": "A figure", "metadata": {"__ref": "ImageMetadata:img.png"}},
+        "Paragraph:3": {"type": "PRE", "text": "x = 1 < 2", "codeBlockMetadata": {"lang": "python"}},
+        "Paragraph:4": {"type": "ULI", "text": "one"},
+        "Paragraph:5": {"type": "ULI", "text": "two"},
+        "Paragraph:6": {"type": "H4", "text": "Sources"},
+    }
+    page = f"<html><script>window.__APOLLO_STATE__ = {json.dumps(state)}</script></html>"
+    art3, meta3 = select_article(page, "https://medium.com/@u/my-post-abc123def456")
+    assert meta3 == {"title": "My Post", "author": "Gabriel", "published": "2023-03-13",
+                     "base_url": "https://medium.com/@u/my-post-abc123def456"}
+    assert art3.find("img")["src"].endswith("/img.png") and art3.find("img")["width"] == "800"
+    fence_codeblocks(art3)
+    md3 = soup_to_markdown(art3)
+    assert "**paper [here](https://arxiv.org) for**" in md3, md3
+    assert "```python\nx = 1 < 2\n```" in md3 and "* one\n* two" in md3 and "### Sources" in md3
+    assert "My Post" not in md3
+
+    # transcode_images: variants written, src/srcset rewritten, manifest emitted (needs Pillow)
+    if Image is not None:
+        with tempfile.TemporaryDirectory() as tmp:
+            assets = Path(tmp) / "post"
+            ensure_dir(assets)
+            Image.new("RGB", (1000, 500), "purple").save(assets / "fig.png")
+            tree = make_soup('<p><img src="post/fig.png" alt="fig"/></p>')
+            opts = TranscodeOptions(formats=("webp",), widths=(480, 2000), jobs=1)
+            manifest = transcode_images(tree, assets, [assets / "fig.png"], opts)
+            img = tree.find("img")
+            assert img["src"] == "post/fig-png-1000.webp" and img["srcset"] == "post/fig-png-480.webp 480w, post/fig-png-1000.webp 1000w"
+            assert manifest["fig-png-1000.webp"]["height"] == 500 and not (assets / "fig.png").exists()
+            assert json.loads((assets / IMAGE_MANIFEST).read_text())["fig-png-1000.webp"]["original"] == "fig.png"
+
+            # record_image_metadata: size + small placeholder merged into the same entry
+            meta_all = record_image_metadata(tree, assets, jobs=1)
+            entry = meta_all["fig-png-1000.webp"]
+            assert entry["srcset"]["webp"].startswith("fig-png-480.webp") and entry["width"] == 1000
+            assert entry["placeholder"].startswith("data:image/webp;base64,") and len(entry["placeholder"]) < 400
+            assert img["width"] == "1000" and img["height"] == "500"
+
+            # Same stem, different extensions: variants must not overwrite each other
+            Image.new("RGB", (100, 50), "red").save(assets / "a.png")
+            Image.new("RGB", (100, 50), "blue").save(assets / "a.jpg")
+            tree = make_soup('<img src="post/a.png"/><img src="post/a.jpg"/>')
+            transcode_images(tree, assets, [assets / "a.png", assets / "a.jpg"], opts)
+            assert [i["src"] for i in tree.find_all("img")] == ["post/a-png-100.webp", "post/a-jpg-100.webp"]
+
+    # convert_animation_folders: GIF → animated WebP, post URL rewritten, timing kept
+    if Image is not None:
+        with tempfile.TemporaryDirectory() as tmp:
+            public = Path(tmp) / "public"
+            folder = public / "blogs" / "images" / "post"
+            posts = Path(tmp) / "posts"
+            ensure_dir(folder)
+            ensure_dir(posts)
+            frames = [Image.new("RGB", (40, 30), c) for c in ("red", "green", "blue")]
+            frames[0].save(folder / "a.gif", save_all=True, append_images=frames[1:], duration=[50, 60, 70], loop=0)
+            Image.new("RGB", (10, 10)).save(folder / "still.gif")
+            (posts / "post.js").write_text("![x](/blogs/images/post/a.gif)\n![y](/blogs/images/post/still.gif)\n", encoding="utf-8")
+            renames = convert_animation_folders([folder], public, posts, jobs=1)
+            assert renames == {"/blogs/images/post/a.gif": "/blogs/images/post/a.webp"}
+            assert (posts / "post.js").read_text() == "![x](/blogs/images/post/a.webp)\n![y](/blogs/images/post/still.gif)\n"
+            with Image.open(folder / "a.webp") as anim:
+                assert anim.is_animated and anim.n_frames == 3
+            assert not (folder / "a.gif").exists() and (folder / "still.gif").exists()
+
+    # rewrite_post_references: whole URLs only; 4.gif must not touch 14.gif or /x/24.gif
+    with tempfile.TemporaryDirectory() as tmp:
+        (Path(tmp) / "p.js").write_text('![a](4.gif) ![b](/x/14.gif) ![c](/x/24.gif) <img src="4.gif"/>', encoding="utf-8")
+        with redirect_stdout(io.StringIO()):
+            rewrite_post_references(Path(tmp), {"4.gif": "4.webp"})
+        assert (Path(tmp) / "p.js").read_text() == '![a](4.webp) ![b](/x/14.gif) ![c](/x/24.gif) <img src="4.webp"/>'
+
+    # Video-mode animations: an <img> pointing at .mp4 is skipped by transcode and metadata
+    if Image is not None:
+        with tempfile.TemporaryDirectory() as tmp:
+            assets = Path(tmp) / "post"
+            ensure_dir(assets)
+            (assets / "anim.mp4").write_bytes(b"not an image")
+            tree = make_soup('<p><img src="post/anim.mp4"/></p>')
+            warnings = io.StringIO()
+            with redirect_stderr(warnings):
+                assert transcode_images(tree, assets, [assets / "anim.mp4"], TranscodeOptions(jobs=1)) == {}
+                assert record_image_metadata(tree, assets, jobs=1) == {} and tree.find("img")["src"] == "post/anim.mp4"
+            assert not warnings.getvalue(), warnings.getvalue()
+
+    # migrate_asset_folders: dedupe across posts, fingerprinted names, URLs + manifest rewritten
+    with tempfile.TemporaryDirectory() as tmp:
+        public = Path(tmp) / "public"
+        posts = Path(tmp) / "posts"
+        for slug in ("a", "b"):
+            ensure_dir(public / "blogs" / "images" / slug)
+        ensure_dir(posts)
+        (public / "blogs/images/a/1.webp").write_bytes(b"same")
+        (public / "blogs/images/b/9.webp").write_bytes(b"same")
+        (public / "blogs/images/b/2.png").write_bytes(b"other")
+        (public / "blogs/images/b" / IMAGE_MANIFEST).write_text(json.dumps({"2.png": {"width": 3, "height": 4}}))
+        (posts / "b.js").write_text("![](/blogs/images/b/9.webp) ![](/blogs/images/b/2.png)", encoding="utf-8")
+        store = AssetStore(public / "blogs" / "assets")
+        renames = migrate_asset_folders(sorted((public / "blogs/images").iterdir()), store, public, posts)
+        assert renames["/blogs/images/a/1.webp"] == renames["/blogs/images/b/9.webp"]
+        assert sorted(p.name for p in store.root.iterdir()) == sorted(
+            [fingerprint(store.root / renames["/blogs/images/a/1.webp"].rsplit("/", 1)[1]), "images.json",
+             renames["/blogs/images/b/2.png"].rsplit("/", 1)[1]])
+        new_png = renames["/blogs/images/b/2.png"].rsplit("/", 1)[1]
+        assert json.loads((store.root / IMAGE_MANIFEST).read_text())[new_png]["width"] == 3
+        assert "/blogs/images/" not in (posts / "b.js").read_text() and not (public / "blogs/images/b").exists()
+        assert "immutable" in (public / HEADERS_FILE).read_text()
+
+    # Site posts: raw-template round trip (backticks, ${, trailing backslashes) and manifest merge
+    tricky = "Inline `code`, ${not a var}, \\\\`, $\\frac{a}{b}$\n```py\nx = 1\n```\nends with \\"
+    assert "`" not in RAW_TEMPLATE_INTERP_RE.sub("", js_raw_template(tricky)[len("String.raw`"):-1])
+    with tempfile.TemporaryDirectory() as tmp:
+        posts = Path(tmp)
+        write_post_module(posts, "old", "Hello\n\n![a](/a.png)\n")
+        write_post_manifest(posts, [{"slug": "old", "title": "Old", "date": "2020-01-01", "tags": ["x"], "excerpt": "Hand written"}])
+        body = post_body(build_front_matter({"title": "New", "base_url": "https://m/new?source=x"}, True) + tricky, {"base_url": "https://m/new?source=x"})
+        assert body.startswith("Note: Imported from [medium](https://m/new)\n\n") and "title:" not in body
+        write_post_module(posts, "new", body)
+        assert read_post_body(posts / "new.js") == body
+        add_posts(posts, [post_entry({"title": "New", "published": "2024-01-02"}, body, ["t"]),
+                          {"slug": "old", "title": "Old 2", "date": "2020-01-01", "tags": [], "excerpt": "auto"}])
+        entries = read_post_manifest(posts)
+        assert [e["slug"] for e in entries] == ["new", "old"]
+        assert entries[1] == {"slug": "old", "title": "Old 2", "date": "2020-01-01", "tags": ["x"],
+                              "excerpt": "Hand written", "readingTime": 1, "imageCount": 1}
+        assert entries[0]["excerpt"].startswith("Inline code, ${not a var}")
+
+    # --post end to end: code becomes a {{code(lang)}} block with its indentation, no escapes
+    with tempfile.TemporaryDirectory() as tmp:
+        url = "https://medium.com/@u/code-post-abc123def456"
+        page = ("<html><head><title>Code Post</title></head><body><article><h1>Code Post</h1>"
+                "<p>Use snake_case and a *star* here, it is long enough to count as the article body.</p>"
+                '<pre><code class="language-python">def f(x_1):\n    return x_1 * 2\n</code></pre>'
+                "<p>More prose after the code block so the extractor keeps the whole article.</p>"
+                "</article></body></html>")
+        HttpCache(Path(tmp) / "cache").store(url, page.encode("utf-8"), {"content-type": "text/html"}, "utf-8")
+        with redirect_stdout(io.StringIO()):
+            assert main([url, "--post", "--posts-dir", f"{tmp}/posts", "--cache-dir", f"{tmp}/cache", "--offline"]) == 0
+        body = read_post_body(Path(tmp) / "posts" / "code-post.js")
+        assert "{{code(python)}}\ndef f(x_1):\n    return x_1 * 2\n{{code}}" in body, body
+        assert "```" not in body and "\\" not in body and "snake_case" in body
+
     print("All self tests passed.")
     return 0
 
@@ -407,9 +2164,34 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     ap.add_argument("url", nargs="?", help="Medium article URL")
     ap.add_argument("-o", "--out", default=None, help="Output .md path (default: title.md)")
+    ap.add_argument("--batch", default=None, help="File of article URLs (one per line) or an HTML reading-list export")
+    ap.add_argument("--out-dir", default=".", help="Output directory for --batch (default: .)")
+    ap.add_argument("--jobs", type=int, default=DEFAULT_JOBS, help=f"Conversion processes for --batch (default: {DEFAULT_JOBS})")
     ap.add_argument("--images", action="store_true", help="Download images and rewrite links")
     ap.add_argument("--assets-dir", default="assets", help="Directory for downloaded images (default: assets)")
+    ap.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"Concurrent image downloads (default: {DEFAULT_WORKERS})")
+    ap.add_argument("--transcode", action="store_true", help="Re-encode downloaded images to WebP/AVIF variants (needs --images and Pillow)")
+    ap.add_argument("--formats", default="webp", help="Comma-separated transcode formats: webp, avif (default: webp)")
+    ap.add_argument("--widths", default=",".join(map(str, DEFAULT_WIDTHS)), help="Comma-separated variant widths for srcset")
+    ap.add_argument("--quality", type=int, default=DEFAULT_QUALITY, help=f"Encoder quality 0-100 (default: {DEFAULT_QUALITY})")
+    ap.add_argument("--keep-originals", action="store_true", help="Keep the downloaded originals next to the transcoded variants")
+    ap.add_argument("--animations", choices=ANIMATION_MODES, default=None, help="Re-encode animated GIFs as animated WebP or MP4/WebM + poster")
+    ap.add_argument("--convert-animations", nargs="+", metavar="DIR", default=None, help="Convert animated GIFs in existing asset folders and exit")
+    ap.add_argument("--image-metadata", nargs="+", metavar="DIR", default=None, help="Write images.json (size + placeholder) for existing asset folders and exit")
+    ap.add_argument("--asset-store", default=None, metavar="DIR", help="Store images by content hash in DIR (e.g. public/blogs/assets) instead of per-post folders")
+    ap.add_argument("--asset-url", default=DEFAULT_ASSET_URL, help=f"URL prefix the asset store is served under (default: {DEFAULT_ASSET_URL})")
+    ap.add_argument("--migrate-assets", nargs="+", metavar="DIR", default=None, help="Move existing asset folders into --asset-store, rewrite post URLs, and exit")
+    ap.add_argument("--public-dir", default=DEFAULT_PUBLIC_DIR, help=f"Site public/ root used to build asset URLs (default: {DEFAULT_PUBLIC_DIR})")
+    ap.add_argument("--posts-dir", default=DEFAULT_POSTS_DIR, help=f"Post modules whose asset URLs get rewritten (default: {DEFAULT_POSTS_DIR})")
+    ap.add_argument("--post", action="store_true", help="Write a site post (<posts-dir>/<slug>.js + index.js manifest) instead of a .md file")
+    ap.add_argument("--tags", default="", help="Comma-separated tags for --post")
+    ap.add_argument("--update-manifest", action="store_true", help="Recompute reading times/image counts in <posts-dir>/index.js and exit")
     ap.add_argument("--no-front-matter", action="store_true", help="Do not include YAML front matter")
+    ap.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help=f"HTTP response cache directory (default: {DEFAULT_CACHE_DIR})")
+    ap.add_argument("--no-cache", action="store_true", help="Always download; do not read or write the cache")
+    ap.add_argument("--offline", action="store_true", help="Replay pages/images from the cache only; never hit the network")
+    ap.add_argument("--prerender", action="store_true", help="Prerender the written Markdown + KaTeX to static HTML (needs Node.js)")
+    ap.add_argument("--profile", action="store_true", help="Report wall/CPU time and peak memory per pipeline stage")
     ap.add_argument("--self-test", action="store_true", help="Run built-in tests and exit")
     return ap
 
@@ -422,43 +2204,175 @@ def main(argv: list[str] | None = None) -> int:
     if args.self_test:
         return _run_self_tests()
 
+    if args.convert_animations:
+        try:
+            convert_animation_folders(
+                [Path(d) for d in args.convert_animations],
+                public_dir=Path(args.public_dir),
+                posts_dir=Path(args.posts_dir),
+                mode=args.animations or "webp",
+                quality=args.quality,
+                jobs=args.jobs,
+                keep_originals=args.keep_originals,
+            )
+        except RuntimeError as e:
+            sys.stderr.write(f"Error: {e}\n")
+            return 2
+        return 0
+
+    store = AssetStore(Path(args.asset_store), args.asset_url) if args.asset_store else None
+
+    if args.migrate_assets:
+        if store is None:
+            sys.stderr.write("Error: --migrate-assets needs --asset-store DIR.\n")
+            return 2
+        migrate_asset_folders(
+            [Path(d) for d in args.migrate_assets if Path(d).is_dir()],
+            store,
+            public_dir=Path(args.public_dir),
+            posts_dir=Path(args.posts_dir),
+        )
+        return 0
+
+    if args.update_manifest:
+        path = write_post_manifest(Path(args.posts_dir), read_post_manifest(Path(args.posts_dir)))
+        print(f"Updated {path}")
+        return 0
+
+    if args.image_metadata:
+        if Image is None:
+            sys.stderr.write("Error: --image-metadata needs Pillow (pip install pillow).\n")
+            return 2
+        index_image_folders([Path(d) for d in args.image_metadata if Path(d).is_dir()], jobs=args.jobs)
+        return 0
+
     # Friendly message instead of argparse's SystemExit when URL is missing
-    if not args.url:
+    if not args.url and not args.batch:
         sys.stderr.write(
             "Error: no URL provided.\n\n"
             "Examples:\n"
             "  python medium2md.py \"https://medium.com/@user/article\"\n"
             "  python medium2md.py \"https://medium.com/@user/article\" -o out.md --images\n"
+            "  python medium2md.py --batch urls.txt --out-dir posts --images\n"
             "  python medium2md.py --self-test\n\n"
         )
         ap.print_help(sys.stderr)
         return 2  # explicit exit code instead of raising
 
-    # Fetch once to determine title/metadata (for default filename)
-    html, _ = fetch(args.url)
-    article_html, meta = select_article_html(html, args.url)
+    if args.offline and args.no_cache:
+        sys.stderr.write("Error: --offline needs the cache; drop --no-cache.\n")
+        return 2
+
+    transcode = None
+    if args.transcode:
+        if Image is None:
+            sys.stderr.write("Error: --transcode needs Pillow (pip install pillow).\n")
+            return 2
+        transcode = TranscodeOptions(
+            formats=tuple(f.strip().lower() for f in args.formats.split(",") if f.strip()),
+            widths=tuple(int(w) for w in args.widths.split(",") if w.strip()),
+            quality=args.quality,
+            jobs=args.jobs,
+            keep_originals=args.keep_originals,
+        )
 
-    title_slug = re.sub(r"[^a-zA-Z0-9\-]+", "-", meta.get("title", "Untitled").strip()).strip("-").lower() or "medium-article"
+    if args.animations:
+        try:
+            _check_animation_mode(args.animations)
+        except RuntimeError as e:
+            sys.stderr.write(f"Error: {e}\n")
+            return 2
+
+    posts_dir = Path(args.posts_dir) if args.post else None
+    tags = [t.strip() for t in args.tags.split(",") if t.strip()]
+
+    if args.batch:
+        urls = read_url_list(Path(args.batch))
+        if not urls:
+            sys.stderr.write(f"Error: no URLs found in {args.batch}\n")
+            return 2
+        summary = convert_batch(
+            urls,
+            out_dir=Path(args.out_dir),
+            download_images=args.images,
+            assets_dir=Path(args.assets_dir),
+            include_yaml=args.post or not args.no_front_matter,
+            cache_dir=None if args.no_cache else Path(args.cache_dir),
+            offline=args.offline,
+            workers=args.workers,
+            jobs=args.jobs,
+            transcode=transcode,
+            animations=args.animations,
+            store=store,
+            profile=args.profile,
+            posts_dir=posts_dir,
+            tags=tags,
+        )
+        print_batch_summary(summary)
+        if args.prerender:
+            written = [] if args.post else [Path(r["out"]) for r in summary["articles"] if not r["error"]]
+            try:
+                prerender_markdown(written)
+            except (RuntimeError, subprocess.CalledProcessError) as e:
+                sys.stderr.write(f"Error: {e}\n")
+                return 1
+        return 1 if summary["failed"] else 0
+
+    session = make_session(args.workers)
+    cache = None if args.no_cache else HttpCache(Path(args.cache_dir), offline=args.offline, session=session)
+
+    profiler = StageProfiler() if args.profile else None
+
+    # Fetch here so a cache miss is a clean error; convert() parses the HTML once and
+    # names the output after the title when -o is not given
+    try:
+        with _stage(profiler, "fetch"):
+            html, _ = fetch(args.url, cache, session)
+    except CacheMiss as e:
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
 
-    out_path = Path(args.out) if args.out else Path(f"{title_slug}.md")
     assets_dir = Path(args.assets_dir)
 
-    convert(
+    out_path = convert(
         url=args.url,
-        out_path=out_path,
+        out_path=Path(args.out) if args.out else None,
         download_images=args.images,
         assets_dir=assets_dir,
-        include_yaml=not args.no_front_matter,
+        include_yaml=args.post or not args.no_front_matter,
+        cache=cache,
+        html=html,
+        session=session,
+        workers=args.workers,
+        transcode=transcode,
+        animations=args.animations,
+        store=store,
+        profiler=profiler,
+        posts_dir=posts_dir,
+        tags=tags,
     )
 
+    if args.prerender:
+        try:
+            with _stage(profiler, "prerender"):
+                prerender_markdown([] if args.post else [out_path])
+        except (RuntimeError, subprocess.CalledProcessError) as e:
+            sys.stderr.write(f"Error: {e}\n")
+            return 1
+
+    if profiler is not None:
+        print(profiler.report())
+
+    if cache is not None:
+        st = cache.stats
+        print(f"Cache: {st['hits']} offline hits, {st['revalidated']} revalidated (304), {st['downloads']} downloads")
+
     return 0
 
 
 if __name__ == "__main__":
     try:
-        sys.exit(main([
-            "https://medium.com/better-programming/diffusion-models-ddpms-ddims-and-classifier-free-guidance-e07b297b2869"
-        ]))
+        sys.exit(main())
     except KeyboardInterrupt:
         print("\nCancelled.")
         sys.exit(1)
@@ -2,6 +2,7 @@
 export const profile = {
   name: "Gabriel Mongaras",
   tagline: "AI Engineer • Researcher • Builder",
+  photo: "/me.jpg",
   summary: "MTS at Magic training AGI and researcher focused on diffusion models, and efficient attention mechanisms. Experience at Magic, Etched, Google, Amazon, and Meta. Passionate about building, researching, and scaling AI systems.",
   location: "San Francisco, CA",
   email: "gabriel@mongaras.com",
@@ -190,7 +191,7 @@ export const articles = [
 ]
 
 // Import YouTube videos from automatically generated file
-export { youtubeVideos } from './youtubeData.js';
+export { youtubeVideos, youtubePages } from './youtubeData.js';
 
 export const activitiesAwards = {
   activities: ["Artificial Intelligence Club (President)", "Cybersecurity Club", "Computer Science Club", "Commons Council"],
@@ -0,0 +1,37 @@
+// This file is automatically generated by scripts/optimizeImages.py
+// Do not edit manually - it will be overwritten
+
+export const imageVariants = {
+  "/me.jpg": {"hash": "aefd0d170c1db202", "widths": [320, 480, 640, 960], "width": 884, "height": 946, "srcset": {"avif": "/me-jpg-320.avif 320w, /me-jpg-480.avif 480w, /me-jpg-640.avif 640w, /me-jpg-884.avif 884w", "webp": "/me-jpg-320.webp 320w, /me-jpg-480.webp 480w, /me-jpg-640.webp 640w, /me-jpg-884.webp 884w"}},
+  "/projects/ai_girlfriend.png": {"hash": "1785a0f5a307b9e6", "widths": [320, 640], "width": 1270, "height": 918, "srcset": {"avif": "/projects/ai_girlfriend-png-320.avif 320w, /projects/ai_girlfriend-png-640.avif 640w", "webp": "/projects/ai_girlfriend-png-320.webp 320w, /projects/ai_girlfriend-png-640.webp 640w"}},
+  "/projects/anime_stylegan.jpg": {"hash": "b6df87ad2509dcaa", "widths": [320, 640], "width": 1500, "height": 1000, "srcset": {"avif": "/projects/anime_stylegan-jpg-320.avif 320w, /projects/anime_stylegan-jpg-640.avif 640w", "webp": "/projects/anime_stylegan-jpg-320.webp 320w, /projects/anime_stylegan-jpg-640.webp 640w"}},
+  "/projects/cart_pole_ppo.png": {"hash": "a677b9c7327335c6", "widths": [320, 640], "width": 900, "height": 609, "srcset": {"avif": "/projects/cart_pole_ppo-png-320.avif 320w, /projects/cart_pole_ppo-png-640.avif 640w", "webp": "/projects/cart_pole_ppo-png-320.webp 320w, /projects/cart_pole_ppo-png-640.webp 640w"}},
+  "/projects/causal_transformer_base.jpg": {"hash": "d862e7763ada1a8c", "widths": [320, 640], "width": 1026, "height": 1148, "srcset": {"avif": "/projects/causal_transformer_base-jpg-320.avif 320w, /projects/causal_transformer_base-jpg-640.avif 640w", "webp": "/projects/causal_transformer_base-jpg-320.webp 320w, /projects/causal_transformer_base-jpg-640.webp 640w"}},
+  "/projects/cottention.png": {"hash": "c48ff42edc99171e", "widths": [320, 640], "width": 301, "height": 285, "srcset": {"avif": "/projects/cottention-png-301.avif 301w", "webp": "/projects/cottention-png-301.webp 301w"}},
+  "/projects/cudakerneldemo.png": {"hash": "d3a08db661aa8bc9", "widths": [320, 640], "width": 625, "height": 438, "srcset": {"avif": "/projects/cudakerneldemo-png-320.avif 320w, /projects/cudakerneldemo-png-625.avif 625w", "webp": "/projects/cudakerneldemo-png-320.webp 320w, /projects/cudakerneldemo-png-625.webp 625w"}},
+  "/projects/data_structures_search_engine_project.png": {"hash": "9d5477678c342136", "widths": [320, 640], "width": 1050, "height": 700, "srcset": {"avif": "/projects/data_structures_search_engine_project-png-320.avif 320w, /projects/data_structures_search_engine_project-png-640.avif 640w", "webp": "/projects/data_structures_search_engine_project-png-320.webp 320w, /projects/data_structures_search_engine_project-png-640.webp 640w"}},
+  "/projects/diffusion_models_from_scratch.png": {"hash": "d26a402142e8b811", "widths": [320, 640], "width": 3832, "height": 1348, "srcset": {"avif": "/projects/diffusion_models_from_scratch-png-320.avif 320w, /projects/diffusion_models_from_scratch-png-640.avif 640w", "webp": "/projects/diffusion_models_from_scratch-png-320.webp 320w, /projects/diffusion_models_from_scratch-png-640.webp 640w"}},
+  "/projects/diffusion_tts.png": {"hash": "ddb61b753ad18642", "widths": [320, 640], "width": 2010, "height": 540, "srcset": {"avif": "/projects/diffusion_tts-png-320.avif 320w, /projects/diffusion_tts-png-640.avif 640w", "webp": "/projects/diffusion_tts-png-320.webp 320w, /projects/diffusion_tts-png-640.webp 640w"}},
+  "/projects/dino_game_ai_v2.jpg": {"hash": "035f79b63af54357", "widths": [320, 640], "width": 1500, "height": 1000, "srcset": {"avif": "/projects/dino_game_ai_v2-jpg-320.avif 320w, /projects/dino_game_ai_v2-jpg-640.avif 640w", "webp": "/projects/dino_game_ai_v2-jpg-320.webp 320w, /projects/dino_game_ai_v2-jpg-640.webp 640w"}},
+  "/projects/dorahack_apr_2021_project.jpg": {"hash": "bf0cfd93c628184f", "widths": [320, 640], "width": 1000, "height": 675, "srcset": {"avif": "/projects/dorahack_apr_2021_project-jpg-320.avif 320w, /projects/dorahack_apr_2021_project-jpg-640.avif 640w", "webp": "/projects/dorahack_apr_2021_project-jpg-320.webp 320w, /projects/dorahack_apr_2021_project-jpg-640.webp 640w"}},
+  "/projects/gan_textgen.png": {"hash": "0c04fe679f764a0c", "widths": [320, 640], "width": 577, "height": 254, "srcset": {"avif": "/projects/gan_textgen-png-320.avif 320w, /projects/gan_textgen-png-577.avif 577w", "webp": "/projects/gan_textgen-png-320.webp 320w, /projects/gan_textgen-png-577.webp 577w"}},
+  "/projects/gradient_descent_for_bce_loss.jpg": {"hash": "2ca890c0f488ea6c", "widths": [320, 640], "width": 1500, "height": 1000, "srcset": {"avif": "/projects/gradient_descent_for_bce_loss-jpg-320.avif 320w, /projects/gradient_descent_for_bce_loss-jpg-640.avif 640w", "webp": "/projects/gradient_descent_for_bce_loss-jpg-320.webp 320w, /projects/gradient_descent_for_bce_loss-jpg-640.webp 640w"}},
+  "/projects/grpo_dapo_tests_.jpg": {"hash": "707c2efac86e362d", "widths": [320, 640], "width": 1288, "height": 360, "srcset": {"avif": "/projects/grpo_dapo_tests_-jpg-320.avif 320w, /projects/grpo_dapo_tests_-jpg-640.avif 640w", "webp": "/projects/grpo_dapo_tests_-jpg-320.webp 320w, /projects/grpo_dapo_tests_-jpg-640.webp 640w"}},
+  "/projects/image_gradient_thing.gif": {"hash": "d103584b83a59a3b", "widths": [320, 640], "width": 768, "height": 432, "srcset": {"avif": "/projects/image_gradient_thing-gif-320.avif 320w, /projects/image_gradient_thing-gif-640.avif 640w", "webp": "/projects/image_gradient_thing-gif-320.webp 320w, /projects/image_gradient_thing-gif-640.webp 640w"}},
+  "/projects/kron_prod.png": {"hash": "35f9905e2e5cdf15", "widths": [320, 640], "width": 335, "height": 200, "srcset": {"avif": "/projects/kron_prod-png-320.avif 320w, /projects/kron_prod-png-335.avif 335w", "webp": "/projects/kron_prod-png-320.webp 320w, /projects/kron_prod-png-335.webp 335w"}},
+  "/projects/latent_diffusion_model_imagenet_2012.jpeg": {"hash": "c66bba56b30df0e0", "widths": [320, 640], "width": 750, "height": 300, "srcset": {"avif": "/projects/latent_diffusion_model_imagenet_2012-jpeg-320.avif 320w, /projects/latent_diffusion_model_imagenet_2012-jpeg-640.avif 640w", "webp": "/projects/latent_diffusion_model_imagenet_2012-jpeg-320.webp 320w, /projects/latent_diffusion_model_imagenet_2012-jpeg-640.webp 640w"}},
+  "/projects/learnable_rotary_embeddings.webp": {"hash": "a07a555fd846b712", "widths": [320, 640], "width": 1398, "height": 802, "srcset": {"avif": "/projects/learnable_rotary_embeddings-webp-320.avif 320w, /projects/learnable_rotary_embeddings-webp-640.avif 640w", "webp": "/projects/learnable_rotary_embeddings-webp-320.webp 320w, /projects/learnable_rotary_embeddings-webp-640.webp 640w"}},
+  "/projects/matrix_gradient_calculator.png": {"hash": "956c502319e558e0", "widths": [320, 640], "width": 285, "height": 165, "srcset": {"avif": "/projects/matrix_gradient_calculator-png-285.avif 285w", "webp": "/projects/matrix_gradient_calculator-png-285.webp 285w"}},
+  "/projects/metau_capstone.png": {"hash": "793ca254b727af52", "widths": [320, 640], "width": 127, "height": 133, "srcset": {"avif": "/projects/metau_capstone-png-127.avif 127w", "webp": "/projects/metau_capstone-png-127.webp 127w"}},
+  "/projects/on_the_expressiveness_of_sm_attn.png": {"hash": "276366fb11d0fd0d", "widths": [320, 640], "width": 3316, "height": 2006, "srcset": {"avif": "/projects/on_the_expressiveness_of_sm_attn-png-320.avif 320w, /projects/on_the_expressiveness_of_sm_attn-png-640.avif 640w", "webp": "/projects/on_the_expressiveness_of_sm_attn-png-320.webp 320w, /projects/on_the_expressiveness_of_sm_attn-png-640.webp 640w"}},
+  "/projects/res_invariant_vae.png": {"hash": "0a2f8795f2987a89", "widths": [320, 640], "width": 826, "height": 285, "srcset": {"avif": "/projects/res_invariant_vae-png-320.avif 320w, /projects/res_invariant_vae-png-640.avif 640w", "webp": "/projects/res_invariant_vae-png-320.webp 320w, /projects/res_invariant_vae-png-640.webp 640w"}},
+  "/projects/resume_parser.png": {"hash": "8b742d3e40bbd993", "widths": [320, 640], "width": 200, "height": 283, "srcset": {"avif": "/projects/resume_parser-png-200.avif 200w", "webp": "/projects/resume_parser-png-200.webp 200w"}},
+  "/projects/rust_neural_network.jpeg": {"hash": "a3cb50295e6025e1", "widths": [320, 640], "width": 300, "height": 168, "srcset": {"avif": "/projects/rust_neural_network-jpeg-300.avif 300w", "webp": "/projects/rust_neural_network-jpeg-300.webp 300w"}},
+  "/projects/stable_diffusion_3_from_scratch.png": {"hash": "c7181a635ac880d8", "widths": [320, 640], "width": 978, "height": 666, "srcset": {"avif": "/projects/stable_diffusion_3_from_scratch-png-320.avif 320w, /projects/stable_diffusion_3_from_scratch-png-640.avif 640w", "webp": "/projects/stable_diffusion_3_from_scratch-png-320.webp 320w, /projects/stable_diffusion_3_from_scratch-png-640.webp 640w"}},
+  "/projects/token_merging_tests.png": {"hash": "a45eda303fd89d9d", "widths": [320, 640], "width": 570, "height": 272, "srcset": {"avif": "/projects/token_merging_tests-png-320.avif 320w, /projects/token_merging_tests-png-570.avif 570w", "webp": "/projects/token_merging_tests-png-320.webp 320w, /projects/token_merging_tests-png-570.webp 570w"}},
+  "/projects/transformers_from_scratch.png": {"hash": "4e693bdcf0508159", "widths": [320, 640], "width": 640, "height": 426, "srcset": {"avif": "/projects/transformers_from_scratch-png-320.avif 320w, /projects/transformers_from_scratch-png-640.avif 640w", "webp": "/projects/transformers_from_scratch-png-320.webp 320w, /projects/transformers_from_scratch-png-640.webp 640w"}},
+  "/projects/vision_transformers_from_scratch.jpg": {"hash": "0729d9098ad1f6d9", "widths": [320, 640], "width": 760, "height": 500, "srcset": {"avif": "/projects/vision_transformers_from_scratch-jpg-320.avif 320w, /projects/vision_transformers_from_scratch-jpg-640.avif 640w", "webp": "/projects/vision_transformers_from_scratch-jpg-320.webp 320w, /projects/vision_transformers_from_scratch-jpg-640.webp 640w"}},
+  "/projects/wizard_qlora.png": {"hash": "05d77822e9ba694b", "widths": [320, 640], "width": 1074, "height": 604, "srcset": {"avif": "/projects/wizard_qlora-png-320.avif 320w, /projects/wizard_qlora-png-640.avif 640w", "webp": "/projects/wizard_qlora-png-320.webp 320w, /projects/wizard_qlora-png-640.webp 640w"}},
+  "/projects/yann_lecun.webp": {"hash": "063d6e4048997f6c", "widths": [320, 640], "width": 1440, "height": 994, "srcset": {"avif": "/projects/yann_lecun-webp-320.avif 320w, /projects/yann_lecun-webp-640.avif 640w", "webp": "/projects/yann_lecun-webp-320.webp 320w, /projects/yann_lecun-webp-640.webp 640w"}},
+  "/projects/yolox_from_scratch.png": {"hash": "1ae2d5cf839a24b5", "widths": [320, 640], "width": 228, "height": 220, "srcset": {"avif": "/projects/yolox_from_scratch-png-228.avif 228w", "webp": "/projects/yolox_from_scratch-png-228.webp 228w"}},
+}
@@ -0,0 +1,9 @@
+// This file is automatically generated by scripts/generateOGImage.py
+// Do not edit manually - it will be overwritten
+
+export const ogImages = {
+  "blog/ai-girlfriend": "/og/blog/ai-girlfriend.png?v=5015a60a80",
+  "blog/attn-masks": "/og/blog/attn-masks.png?v=af5a1bc163",
+  "blog/community-detection-neural-networks": "/og/blog/community-detection-neural-networks.png?v=5b8e4adaf1",
+  "blog/diffusion-models": "/og/blog/diffusion-models.png?v=251eeb9c23",
+}